@@ -1,14 +1,17 @@
 import os
-from functools import lru_cache
+from contextlib import asynccontextmanager
 from typing import Optional
 
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
+from cache_notifier import CacheWatcher
 from data_manager import DataManager
+from database import http_pool_stats, open_async_database
 
 
 class ApiResponse(BaseModel):
@@ -54,7 +57,18 @@ class TournamentGenerateRequest(BaseModel):
     mode: str = "밸런스"
 
 
-app = FastAPI(title="KNOC Badminton API", version="0.2.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 워커 프로세스 공용 DataManager + 호스트 공용 무효화 알림 (시작 시 설정 · 캐시를 비동기로 적재)
+    adb = open_async_database()
+    app.state.watcher = CacheWatcher(await DataManager.create_async(adb))
+    try:
+        yield
+    finally:
+        await adb.aclose()
+
+
+app = FastAPI(title="KNOC Badminton API", version="0.2.0", lifespan=lifespan)
 
 
 origins = [o.strip() for o in os.getenv("FRONTEND_ORIGINS", "*").split(",") if o.strip()]
@@ -67,9 +81,19 @@ app.add_middleware(
 )
 
 
-@lru_cache(maxsize=1)
-def get_dm() -> DataManager:
-    return DataManager()
+def get_watcher() -> CacheWatcher:
+    """워커 프로세스 공용 DataManager + 호스트 공용 무효화 알림"""
+    return app.state.watcher
+
+
+async def get_dm() -> DataManager:
+    # 읽기: DB 확인/적재는 비동기, 응답은 dm.snapshot_async()의 메모리 스냅샷에서
+    # 쓰기 · 재생처럼 동기 DB를 쓰는 DataManager 호출: run_in_threadpool
+    # (쓰기는 확정 RPC · 버전 확인 재시도 · 잠금을 Streamlit 앱과 공유하므로 동기 경로 하나만 유지)
+    watcher = get_watcher()
+    await watcher.check_async()
+    await watcher.dm.ensure_loaded_async()
+    return watcher.dm
 
 
 
@@ -77,7 +101,7 @@ app.mount("/web", StaticFiles(directory="web"), name="web")
 
 
 @app.get("/")
-def web_index():
+async def web_index():
     return FileResponse("web/index.html")
 
 
@@ -95,15 +119,31 @@ def _player_payload(eid, p):
     }
 
 
+def _aggregate_payload(agg):
+    if not agg:
+        return {"wins": 0, "losses": 0, "win_rate": 0, "last_event": None}
+    return {
+        "wins": agg["wins"],
+        "losses": agg["losses"],
+        "win_rate": agg["rate"],
+        "last_event": {
+            "date": agg["last_date"],
+            "change": agg["last_change"],
+            "wins": agg["last_wins"],
+            "losses": agg["last_losses"],
+        },
+    }
+
+
 @app.get("/health")
-def health_check():
+async def health_check():
     return {"status": "ok"}
 
 
 @app.post("/auth/login")
-def login(payload: LoginRequest):
-    dm = get_dm()
-    success, role, emp_id = dm.authenticate(payload.username, payload.password)
+async def login(payload: LoginRequest):
+    dm = await get_dm()
+    success, role, emp_id = await dm.authenticate_async(payload.username, payload.password)
     if not success:
         raise HTTPException(status_code=401, detail="invalid credentials")
 
@@ -118,17 +158,31 @@ def login(payload: LoginRequest):
 
 
 @app.post("/admin/reload")
-def reload_data():
-    get_dm.cache_clear()
-    get_dm()
+async def reload_data():
+    # 요청을 받은 워커뿐 아니라 같은 호스트의 모든 워커가 다음 요청에서 재로딩
+    get_watcher().request_reload()
+    await get_dm()
     return ApiResponse(success=True, message="reloaded")
 
 
+@app.get("/admin/cache-stats")
+async def get_cache_stats():
+    dm = await get_dm()
+    return {
+        **dm.cache_stats,
+        "db_round_trips": dm.db.round_trips,
+        "db_async_round_trips": dm.adb.round_trips,
+        "db_first_query_ms": getattr(dm.db, "first_query_ms", None),
+        "http_pool": http_pool_stats(),
+        "invalidation": get_watcher().stats,
+    }
+
+
 @app.get("/players")
-def get_players(active_only: bool = Query(default=False)):
-    dm = get_dm()
+async def get_players(active_only: bool = Query(default=False)):
+    dm = await get_dm()
     players = []
-    for eid, p in dm.players.items():
+    for eid, p in (await dm.snapshot_async()).players.items():
         if active_only and not p.is_active:
             continue
         players.append(_player_payload(eid, p))
@@ -137,9 +191,10 @@ def get_players(active_only: bool = Query(default=False)):
 
 
 @app.post("/players")
-def create_player(payload: PlayerCreateRequest):
-    dm = get_dm()
-    ok, msg = dm.add_player(
+async def create_player(payload: PlayerCreateRequest):
+    dm = await get_dm()
+    ok, msg = await run_in_threadpool(
+        dm.add_player,
         eid=payload.emp_id,
         name=payload.name,
         score=payload.score,
@@ -151,9 +206,10 @@ def create_player(payload: PlayerCreateRequest):
 
 
 @app.patch("/players/{emp_id}")
-def update_player(emp_id: str, payload: PlayerUpdateRequest):
-    dm = get_dm()
-    ok = dm.update_player_info(
+async def update_player(emp_id: str, payload: PlayerUpdateRequest):
+    dm = await get_dm()
+    ok = await run_in_threadpool(
+        dm.update_player_info,
         emp_id=emp_id,
         new_name=payload.name,
         new_score=payload.score,
@@ -165,34 +221,60 @@ def update_player(emp_id: str, payload: PlayerUpdateRequest):
 
 
 @app.delete("/players/{emp_id}")
-def delete_player(emp_id: str):
-    dm = get_dm()
-    ok = dm.delete_player(emp_id)
+async def delete_player(emp_id: str):
+    dm = await get_dm()
+    ok = await run_in_threadpool(dm.delete_player, emp_id)
     if not ok:
         raise HTTPException(status_code=400, detail="delete failed")
     return ApiResponse(success=True, message="deleted")
 
 
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+
+
 @app.get("/ranking")
-def get_ranking(limit: int = Query(default=20, ge=1, le=200)):
-    dm = get_dm()
-    ranking = sorted(dm.players.items(), key=lambda x: x[1].score, reverse=True)[:limit]
+async def get_ranking(
+    limit: int = Query(default=20, ge=1, le=200),
+    as_of: Optional[str] = Query(default=None, pattern=DATE_PATTERN),
+):
+    dm = await get_dm()
+    if as_of:
+        # 날짜 기준 랭킹: 저장된 레이팅 체크포인트에서 (체크포인트 조회/저장은 동기 DB 호출)
+        items = (await run_in_threadpool(dm.ranking_at, as_of))[:limit]
+        return {"as_of": as_of, "count": len(items), "items": items}
+    snap = await dm.snapshot_async()
+    ranking = sorted(snap.players.items(), key=lambda x: x[1].score, reverse=True)[:limit]
+    aggregates = snap.aggregates
     return {
         "count": len(ranking),
         "items": [
             {
                 "rank": i + 1,
                 **_player_payload(eid, p),
+                **_aggregate_payload(aggregates.get(eid)),
             }
             for i, (eid, p) in enumerate(ranking)
         ],
     }
 
 
+@app.get("/ranking/changes")
+async def get_ranking_changes(
+    from_date: str = Query(alias="from", pattern=DATE_PATTERN),
+    to_date: str = Query(alias="to", pattern=DATE_PATTERN),
+    limit: int = Query(default=200, ge=1, le=1000),
+):
+    dm = await get_dm()
+    changes = await run_in_threadpool(dm.rank_changes_between, from_date, to_date)
+    items = sorted(({"emp_id": eid, **ch} for eid, ch in changes.items()), key=lambda x: x["rank"])[:limit]
+    return {"from": from_date, "to": to_date, "count": len(items), "items": items}
+
+
 @app.get("/dashboard/overview")
-def get_dashboard_overview(date: Optional[str] = None):
-    dm = get_dm()
-    history = dm.history
+async def get_dashboard_overview(date: Optional[str] = None):
+    dm = await get_dm()
+    snap = await dm.snapshot_async()
+    history = snap.history
     target_date = date or (sorted(history.keys(), reverse=True)[0] if history else None)
     matches = history.get(target_date, []) if target_date else []
 
@@ -202,7 +284,7 @@ def get_dashboard_overview(date: Optional[str] = None):
 
     return {
         "date": target_date,
-        "players_total": len(dm.players),
+        "players_total": len(snap.players),
         "matches_total": len(matches),
         "matches_done": done,
         "matches_pending_approval": pending_approval,
@@ -213,47 +295,48 @@ def get_dashboard_overview(date: Optional[str] = None):
 
 
 @app.get("/match-dates")
-def get_match_dates(limit: int = Query(default=12, ge=1, le=120)):
-    dm = get_dm()
-    dates = sorted(dm.history.keys(), reverse=True)
+async def get_match_dates(limit: int = Query(default=12, ge=1, le=120)):
+    dm = await get_dm()
+    dates = sorted((await dm.snapshot_async()).history.keys(), reverse=True)
     return {"count": len(dates), "items": dates[:limit]}
 
 @app.get("/matches/{date}")
-def get_matches(date: str, group: Optional[str] = None):
-    dm = get_dm()
-    matches = dm.history.get(date, [])
+async def get_matches(date: str, group: Optional[str] = None):
+    dm = await get_dm()
+    matches = (await dm.snapshot_async()).history.get(date, [])
     if group:
         matches = [m for m in matches if m.get("group") == group]
     return {"date": date, "count": len(matches), "items": matches}
 
 
 @app.get("/players/{emp_id}/stats")
-def get_player_stats(emp_id: str):
-    dm = get_dm()
-    if emp_id not in dm.players:
+async def get_player_stats(emp_id: str):
+    dm = await get_dm()
+    if emp_id not in (await dm.snapshot_async()).players:
         raise HTTPException(status_code=404, detail="player not found")
-    return dm.get_player_stats(emp_id)
+    return await run_in_threadpool(dm.get_player_stats, emp_id)
 
 
 @app.get("/players/{emp_id}/matches")
-def get_player_matches(emp_id: str):
-    dm = get_dm()
-    if emp_id not in dm.players:
+async def get_player_matches(emp_id: str):
+    dm = await get_dm()
+    if emp_id not in (await dm.snapshot_async()).players:
         raise HTTPException(status_code=404, detail="player not found")
-    matches = dm.get_player_match_history(emp_id)
+    matches = await run_in_threadpool(dm.get_player_match_history, emp_id)
     return {"count": len(matches), "items": matches}
 
 
 @app.get("/summary/{date}")
-def get_daily_summary(date: str):
-    dm = get_dm()
-    return {"date": date, "items": dm.get_daily_summary(date)}
+async def get_daily_summary(date: str):
+    dm = await get_dm()
+    return {"date": date, "items": await run_in_threadpool(dm.get_daily_summary, date)}
 
 
 @app.post("/matches/{date}/{match_idx}/submit-score")
-def submit_score(date: str, match_idx: int, payload: ScoreSubmitRequest):
-    dm = get_dm()
-    ok = dm.submit_score_for_approval(
+async def submit_score(date: str, match_idx: int, payload: ScoreSubmitRequest):
+    dm = await get_dm()
+    ok = await run_in_threadpool(
+        dm.submit_score_for_approval,
         date=date,
         match_idx=match_idx,
         score1=payload.score1,
@@ -266,27 +349,28 @@ def submit_score(date: str, match_idx: int, payload: ScoreSubmitRequest):
 
 
 @app.post("/matches/{date}/{match_idx}/approve")
-def approve_score(date: str, match_idx: int, payload: MatchApproveRequest):
-    dm = get_dm()
-    ok = dm.approve_match(date=date, match_idx=match_idx, approved_by=payload.approved_by)
+async def approve_score(date: str, match_idx: int, payload: MatchApproveRequest):
+    dm = await get_dm()
+    ok = await run_in_threadpool(dm.approve_match, date=date, match_idx=match_idx, approved_by=payload.approved_by)
     if not ok:
         raise HTTPException(status_code=400, detail="approve failed")
     return ApiResponse(success=True, message="approved")
 
 
 @app.post("/matches/{date}/{match_idx}/reject")
-def reject_score(date: str, match_idx: int, payload: MatchRejectRequest):
-    dm = get_dm()
-    ok = dm.reject_match(date=date, match_idx=match_idx, reason=payload.reason)
+async def reject_score(date: str, match_idx: int, payload: MatchRejectRequest):
+    dm = await get_dm()
+    ok = await run_in_threadpool(dm.reject_match, date=date, match_idx=match_idx, reason=payload.reason)
     if not ok:
         raise HTTPException(status_code=400, detail="reject failed")
     return ApiResponse(success=True, message="rejected")
 
 
 @app.post("/tournaments/generate")
-def generate_tournament(payload: TournamentGenerateRequest):
-    dm = get_dm()
-    ok, msg = dm.generate_tournament(
+async def generate_tournament(payload: TournamentGenerateRequest):
+    dm = await get_dm()
+    ok, msg = await run_in_threadpool(
+        dm.generate_tournament,
         date=payload.date,
         attendees=payload.attendees,
         mode=payload.mode,
@@ -24,17 +24,23 @@ def init_session():
             st.session_state[k] = v
 
 
+@st.cache_resource
+def _shared_dm():
+    """프로세스 공용 DataManager (모든 세션이 하나의 캐시를 공유, 세션에는 화면 상태만 보관)"""
+    return DataManager()
+
+
 def get_dm():
-    """DataManager 싱글턴 (세션 내 캐시)"""
-    if "dm" not in st.session_state:
-        st.session_state.dm = DataManager()
-    return st.session_state.dm
+    """공용 DataManager 반환 (settings.data_version이 바뀌었을 때만 재로딩)"""
+    dm = _shared_dm()
+    dm.refresh_if_stale()
+    return dm
 
 
 def reload_dm():
     """데이터 강제 리로드"""
-    st.session_state.dm = DataManager()
-    return st.session_state.dm
+    _shared_dm.clear()
+    return get_dm()
 
 
 # =========================================================
@@ -313,12 +319,9 @@ def show_main_app():
         # 알림 뱃지 계산
         pending_count = 0
         if emp_id:
-            for d in dm.history:
-                for m in dm.history[d]:
-                    if m.get("status") == "pending_approval":
-                        if emp_id in m["team1"] or emp_id in m["team2"]:
-                            if m.get("input_by") != emp_id:
-                                pending_count += 1
+            for _, m in dm.get_player_matches(emp_id, status="pending_approval"):
+                if m.get("input_by") != emp_id:
+                    pending_count += 1
         
         disputed_count = 0
         if role in ("admin", "super_admin"):
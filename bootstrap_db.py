@@ -0,0 +1,36 @@
+"""
+빈 DB 초기 데이터 복구 스크립트
+data.json(또는 백업)의 선수 · 경기 · 규칙을 비어 있는 DB로 가져옵니다.
+예전에는 DataManager 생성 시 자동으로 실행됐지만, 시작 시간을 줄이기 위해 명시적으로 실행합니다.
+
+실행: python bootstrap_db.py [--file data.json]
+"""
+import argparse
+import sys
+
+from data_manager import DataManager
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except:
+        pass
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="빈 DB에 JSON 데이터 복구")
+    parser.add_argument("--file", help="가져올 JSON 파일 (기본: data.json → data.json.backup 순으로 탐색)")
+    args = parser.parse_args()
+
+    dm = DataManager()
+    ok, msg = dm.bootstrap_from_json(args.file)
+    print(("✅ " if ok else "❌ ") + msg)
+    if ok:
+        print(f"   선수 {len(dm.players)}명 · 경기 날짜 {len(dm.history)}개")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
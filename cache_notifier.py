@@ -0,0 +1,152 @@
+"""
+호스트 공용 캐시 무효화 알림
+같은 호스트의 여러 프로세스(uvicorn --workers N 등)가 SQLite 파일 하나의 채널 카운터를 공유한다.
+쓰기를 한 워커가 카운터를 올리면, 다른 워커는 요청마다 카운터만 읽어(로컬 파일, DB 왕복 없음)
+바뀌었을 때에만 DataManager를 갱신한다.
+"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+import config
+
+
+DATA_CHANNEL = "data"  # 데이터 변경 (data_version 확인 후 필요 시 재로딩)
+RELOAD_CHANNEL = "reload"  # 전체 강제 재로딩 (/admin/reload)
+
+
+class CacheNotifier:
+    """SQLite 파일 기반 채널별 단조 증가 카운터"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or config.CACHE_NOTIFY_FILE
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # fork된 워커가 부모의 연결을 물려받아 쓰지 않도록 프로세스마다 새로 연다
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=config.DB_TIMEOUT, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_notify ("
+                "channel TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+            )
+            conn.commit()
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def publish(self, channel: str = DATA_CHANNEL) -> int:
+        """채널 카운터 1 증가 후 새 값 반환"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                row = conn.execute(
+                    "INSERT INTO cache_notify (channel, version) VALUES (?, 1) "
+                    "ON CONFLICT (channel) DO UPDATE SET version = version + 1 "
+                    "RETURNING version",
+                    (channel,),
+                ).fetchone()
+            return row[0]
+
+    def versions(self) -> Dict[str, int]:
+        """전체 채널 카운터 조회"""
+        with self._lock:
+            rows = self._connection().execute("SELECT channel, version FROM cache_notify").fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+class CacheWatcher:
+    """DataManager를 호스트 공용 알림에 연결
+
+    - 이 프로세스의 쓰기 → DATA 채널 알림
+    - 다른 워커의 DATA 알림 → refresh_if_stale() (버전이 바뀐 경우만 재로딩)
+    - RELOAD 알림 → 전체 재로딩
+    - 다른 호스트/Streamlit 앱의 쓰기는 db_check_interval초마다 DB 데이터 버전으로 확인
+    """
+
+    def __init__(self, dm, notifier: Optional[CacheNotifier] = None,
+                 db_check_interval: Optional[float] = None):
+        self.dm = dm
+        self.notifier = notifier or CacheNotifier()
+        self.db_check_interval = (
+            config.CACHE_DB_CHECK_INTERVAL if db_check_interval is None else db_check_interval
+        )
+        self._seen = self.notifier.versions()
+        self._last_db_check = time.monotonic()
+        self._lock = threading.Lock()
+        self.stats = {"notifications": 0, "reloads": 0, "db_checks": 0}
+        dm.add_write_listener(self._on_write)
+
+    def _on_write(self, version):
+        self.notifier.publish(DATA_CHANNEL)
+
+    def request_reload(self) -> None:
+        """모든 워커(자신 포함)에 전체 재로딩 요청"""
+        self.notifier.publish(RELOAD_CHANNEL)
+
+    def _next_action(self) -> Optional[str]:
+        """알림 · 주기 확인 결과로 할 일 결정 ("reload" | "refresh" | None)"""
+        with self._lock:
+            versions = self.notifier.versions()
+            seen, self._seen = self._seen, versions
+            now = time.monotonic()
+
+            if versions.get(RELOAD_CHANNEL, 0) != seen.get(RELOAD_CHANNEL, 0):
+                self.stats["notifications"] += 1
+                self.stats["reloads"] += 1
+                self._last_db_check = now
+                return "reload"
+
+            notified = versions.get(DATA_CHANNEL, 0) != seen.get(DATA_CHANNEL, 0)
+            if notified:
+                self.stats["notifications"] += 1
+            elif now - self._last_db_check < self.db_check_interval:
+                return None
+
+            self.stats["db_checks"] += 1
+            self._last_db_check = now
+            return "refresh"
+
+    def check(self) -> bool:
+        """알림 확인 후 필요하면 DataManager 갱신 (요청마다 호출)
+
+        Returns:
+            bool: 캐시를 다시 읽었으면 True
+        """
+        action = self._next_action()
+        if action == "reload":
+            self.dm.reload()
+            return True
+        if action == "refresh":
+            return self._count_reload(self.dm.refresh_if_stale())
+        return False
+
+    async def check_async(self) -> bool:
+        """check()의 비동기 버전 (DataManager.create_async()로 만든 인스턴스, API 서버용)
+
+        알림 카운터 조회(SQLite 파일)는 스레드에서 실행해 이벤트 루프를 막지 않는다.
+        """
+        action = await asyncio.to_thread(self._next_action)
+        if action == "reload":
+            await self.dm.reload_async()
+            return True
+        if action == "refresh":
+            return self._count_reload(await self.dm.refresh_if_stale_async())
+        return False
+
+    def _count_reload(self, reloaded: bool) -> bool:
+        if reloaded:
+            with self._lock:
+                self.stats["reloads"] += 1
+        return reloaded
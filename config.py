@@ -10,9 +10,23 @@ DATA_FILE = os.path.join(BASE_PATH, "data.json")
 BACKUP_DIR = os.path.join(BASE_PATH, "backups")
 
 # 데이터베이스 설정
+DB_BACKEND = os.environ.get("KNOC_DB_BACKEND", "supabase")  # "supabase" | "sqlite" (로컬 파일)
 DB_FILE = os.path.join(BASE_PATH, "knoc_badminton.db")
 DB_TIMEOUT = 30.0  # 동시성 처리를 위한 타임아웃 (초)
 DB_CHECK_SAME_THREAD = False  # Streamlit 멀티스레드 지원
+DB_PAGE_SIZE = 1000  # 대용량 조회 시 range 페이지 크기 (PostgREST 기본 상한)
+DB_FETCH_WORKERS = 4  # range 페이지 병렬 조회 스레드 수
+DB_HTTP_MAX_CONNECTIONS = 10  # 프로세스 공용 Supabase HTTP 연결 풀 최대 연결 수
+DB_HTTP_MAX_KEEPALIVE = 10  # 재사용을 위해 열어 두는 유휴 연결 수
+DB_HTTP_KEEPALIVE_EXPIRY = 60.0  # 유휴 연결 유지 시간 (초)
+DB_HTTP_TIMEOUT = 30.0  # Supabase 요청 타임아웃 (초)
+CACHE_NOTIFY_FILE = os.path.join(BASE_PATH, "cache_notify.db")  # 같은 호스트 워커 간 캐시 무효화 알림
+CACHE_DB_CHECK_INTERVAL = 5.0  # 다른 호스트/앱의 쓰기 확인용 DB 데이터 버전 조회 주기 (초)
+SCORE_CAS_RETRIES = 5  # 선수 행 버전 충돌(다른 프로세스가 먼저 갱신) 시 점수 재계산 재시도 횟수
+RULE_SIMULATOR_WORKERS = None  # 규칙 변경 시뮬레이션 프로세스 수 (None: min(후보 수, CPU 수))
+HISTORY_BULK_LOAD = True  # 경기 이력을 단일 쿼리로 일괄 로드 (False: 날짜별 조회)
+HISTORY_STALE_WHILE_REVALIDATE = False  # 캐시 무효화 후 재구성 동안 이전 경기 이력을 즉시 반환 (읽기 위주 화면용)
+HISTORY_MAX_STALENESS = 10.0  # 이전 경기 이력을 돌려줄 수 있는 최대 시간 (초, 넘으면 재구성을 기다림)
 
 # 앱 정보
 APP_TITLE = "KNOC 배드민턴 월례대회 관리 시스템"
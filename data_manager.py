@@ -1,10 +1,26 @@
+import asyncio
+import copy
 import json
 import os
-import shutil
 import hashlib
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
 from datetime import datetime
-from database import Database
+from functools import wraps
+from database import open_database
 import config
+import rating_engine
+import rule_simulator
+
+
+# 점수 반영(경기 확정/롤백)에 필요한 선수 컬럼 (version: 기록 시 충돌 확인용)
+SCORE_COLUMNS = ("emp_id", "name", "score", "tier", "match_count", "win_count", "streak", "boost_games", "version")
+# 레이팅 체크포인트 중 재생 시작 점수를 담는 행의 날짜 (모든 경기 날짜보다 앞섬)
+RATING_SEED_DATE = "0000-00-00"
+# 출석 XP 계산에 필요한 선수 컬럼
+ATTENDANCE_COLUMNS = ("emp_id", "xp", "last_attendance", "attendance_count", "consecutive_months", "version")
 
 
 class Player:
@@ -26,6 +42,7 @@ class Player:
         self.consecutive_months = kwargs.get("consecutive_months", 0)
         self.total_played = kwargs.get("total_played", 0)
         self.role = kwargs.get("role", "player")
+        self.version = kwargs.get("version", 0)  # 마지막으로 읽은 행 버전 (점수 기록 전에는 항상 DB에서 다시 읽음)
     
     @classmethod
     def from_db_row(cls, row):
@@ -36,29 +53,225 @@ class Player:
         return cls(emp_id, **kwargs)
 
 
+# 읽기용 일관 스냅샷 (게시 후 변경되지 않음)
+CacheSnapshot = namedtuple("CacheSnapshot", ["players", "history", "player_index", "aggregates"])
+
+
+class _StripedLocks:
+    """키(경기 id, 사번)별 쓰기 잠금
+
+    고정 개수의 잠금에 키를 나눠 담고, 항상 번호 순으로 잡아 교착을 막는다.
+    """
+
+    def __init__(self, stripes=64):
+        self._locks = [threading.RLock() for _ in range(stripes)]
+
+    @contextmanager
+    def hold(self, keys):
+        slots = sorted({hash(k) % len(self._locks) for k in keys})
+        for i in slots:
+            self._locks[i].acquire()
+        try:
+            yield
+        finally:
+            for i in reversed(slots):
+                self._locks[i].release()
+
+
+class _WriteGate:
+    """경기 단위 쓰기(공유)와 전역 쓰기(배타) 사이의 관문
+
+    전역 쓰기는 진행 중인 경기 단위 쓰기가 모두 끝날 때까지 기다린 뒤 혼자 실행되고,
+    그동안 새 경기 단위 쓰기는 시작하지 못한다. 배타를 가진 스레드 안의 중첩은 그대로 통과한다.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._shared = 0
+        self._owner = None
+        self._depth = 0
+
+    def owned(self):
+        return self._owner == threading.get_ident()
+
+    @contextmanager
+    def shared(self):
+        me = threading.get_ident()
+        with self._cond:
+            while self._owner is not None and self._owner != me:
+                self._cond.wait()
+            self._shared += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._shared -= 1
+                self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._owner == me:
+                self._depth += 1
+            else:
+                while self._owner is not None:
+                    self._cond.wait()
+                self._owner = me  # 먼저 차지해 새 경기 단위 쓰기를 막고 진행 중인 것만 기다림
+                self._depth = 1
+                while self._shared > 0:
+                    self._cond.wait()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._owner = None
+                    self._cond.notify_all()
+
+
+class _NeedsExclusive(Exception):
+    """경기 단위 잠금으로는 안전하지 않은 쓰기 (과거 경기 수정 → 이후 경기 부분 재생): 전역 잠금으로 다시 실행"""
+
+
+def _synchronized(method):
+    """공유 DataManager 잠금 안에서, 진행 중인 경기 단위 쓰기가 끝난 뒤 실행 (재로딩 등)"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock, self._write_gate.exclusive():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _write_op(method):
+    """전역 쓰기 작업 (선수/규칙/출석 등): 전역 잠금 안에서, 진행 중인 경기 단위 쓰기가 끝난 뒤 실행"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock, self._write_gate.exclusive():
+            with self._write_scope():
+                return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _match_op(method):
+    """경기 단위 쓰기 (date, match_idx): 해당 경기와 참가 선수 잠금만 잡음
+
+    서로 다른 선수들의 경기는 동시에 확정되고, 같은 경기/같은 선수가 얽힌 요청만 순서대로 처리된다.
+    과거 경기 수정처럼 다른 경기/선수까지 다시 기록해야 하면(_NeedsExclusive)
+    잡은 잠금을 모두 놓고 전역 쓰기로 처음부터 다시 실행한다.
+    잠금 키는 잠그기 전에 match_idx로 찾으므로, 잠근 뒤 그 자리의 경기 id가 바뀌었으면
+    (동시에 같은 날짜의 다른 경기가 삭제/추가됨) 다른 경기를 건드리지 않도록 실패로 돌려준다.
+    """
+    @wraps(method)
+    def wrapper(self, date, match_idx, *args, **kwargs):
+        with self._write_scope():
+            try:
+                with self._write_gate.shared():
+                    match_id, keys = self._match_lock_keys(date, match_idx)
+                    with self._entity_locks.hold(keys):
+                        if self._match_id_at(date, match_idx) != match_id:
+                            self.cache_stats["shifted_matches"] += 1
+                            return False
+                        return method(self, date, match_idx, *args, **kwargs)
+            except _NeedsExclusive:
+                pass
+            with self.lock, self._write_gate.exclusive():
+                if self._match_id_at(date, match_idx) != match_id:
+                    self.cache_stats["shifted_matches"] += 1
+                    return False
+                return method(self, date, match_idx, *args, **kwargs)
+    return wrapper
+
+
 class DataManager:
-    """데이터베이스 기반 데이터 관리자"""
+    """데이터베이스 기반 데이터 관리자
+
+    프로세스 내 여러 세션/요청 스레드가 하나의 인스턴스를 공유한다.
+    - 읽기: 캐시(players/history/...)는 게시 후 변경하지 않는 사본이라 잠금 없이 읽는다.
+    - 쓰기: 경기 확정류는 경기·선수별 잠금(_match_op), 그 외는 전역 잠금(_write_op).
+      캐시 변경은 사본을 만들어 _publish_lock 안에서 교체한다 (copy-on-write).
+    """
     
-    def __init__(self, db_file=None):
-        self.db = Database(db_file)
+    def __init__(self, db_file=None, startup=None, adb=None):
+        self.lock = threading.RLock()
+        self._entity_locks = _StripedLocks()
+        self._write_gate = _WriteGate()
+        self._publish_lock = threading.Lock()
+        self._build_lock = threading.RLock()
+        self._version_lock = threading.Lock()
+        self._local = threading.local()  # 스레드별 쓰기 깊이
+        self._cache_gen = {"players": 0, "history": 0}  # 캐시 계열별 변경 세대
+        self._write_listeners = []
+        self.db = open_database(db_file)
+        self.adb = adb  # 비동기 조회용 저장소 (API 서버, create_async()로 생성한 경우)
+        self._async_load_lock = asyncio.Lock()
         self.backup_dir = config.BACKUP_DIR
         
         if not os.path.exists(self.backup_dir):
             os.makedirs(self.backup_dir)
         
+        # 규칙 · 슈퍼관리자 설정 · 데이터 버전 · 선수 유무를 1회 조회 (startup: create_async()가 미리 조회한 값)
+        if startup is None:
+            startup = self.db.get_startup_config()
+        
         # 규칙 초기화 (DB에서 로드, 없으면 기본값 사용)
-        self.score_rules = self.db.get_score_rules() or self._init_score_rules()
-        self.tier_rules = self.db.get_tier_rules() or self._init_tier_rules()
+        self.score_rules = startup["score_rules"] or self._init_score_rules()
+        self.tier_rules = startup["tier_rules"] or self._init_tier_rules()
         
         # 슈퍼관리자 설정 초기화
-        self.settings = self._load_settings()
+        self.settings = self._load_settings(startup["super_admin"])
 
-        # DB가 비어있으면 JSON에서 자동 복구(초기 마이그레이션 보조)
-        self._auto_bootstrap_from_json_if_needed()
+        # 빈 DB는 안내만 한다 (JSON 복구는 bootstrap_db.py로 명시적으로 실행)
+        if not startup["has_players"]:
+            print("[bootstrap] DB에 선수가 없습니다. JSON 데이터를 가져오려면: python bootstrap_db.py")
         
         # 호환성을 위한 캐시 (필요시 사용)
         self._players_cache = None
         self._history_cache = None
+        self._player_index_cache = None
+        self._boost_cache = None
+        self._aggregate_cache = None
+
+        # stale-while-revalidate 모드: 무효화 직전 경기 이력 스냅샷과 백그라운드 재구성 상태
+        self._stale = {}
+        self._stale_since = None
+        self._revalidating = False
+        self._revalidate_lock = threading.Lock()
+
+        # 다른 세션/프로세스의 변경 감지용 데이터 버전 (settings.data_version, 단조 증가)
+        self.data_version = startup["data_version"]
+        # 날짜 기준 레이팅 캐시 (데이터 버전, {날짜: 선수 상태})
+        self._rating_states = (self.data_version, {})
+        # 재생 시작 점수 행에 저장된 사번 (처음 확정되는 선수만 확정 트랜잭션에서 추가, None이면 다음에 조회)
+        self._seeded = None
+
+        # 캐시 재구성 통계 (왕복 횟수 확인용)
+        self.cache_stats = {
+            "players_rebuilds": 0,
+            "history_rebuilds": 0,
+            "coalesced_rebuilds": 0,
+            "rebuild_retries": 0,
+            "stale_reads": 0,
+            "background_rebuilds": 0,
+            "last_history_round_trips": 0,
+            "version_reloads": 0,
+            "score_conflicts": 0,
+            "rerates": 0,
+            "last_rerate_replayed": 0,
+            "shifted_matches": 0,
+        }
+    
+    @classmethod
+    async def create_async(cls, adb, db_file=None):
+        """비동기 생성 (API 서버용): 시작 설정을 조회하고 선수 · 경기 이력 캐시까지 적재
+        
+        규칙 기본값 기록 같은 드문 동기 작업은 스레드에서 실행해 이벤트 루프를 막지 않는다.
+        """
+        startup = await adb.get_startup_config()
+        dm = await asyncio.to_thread(cls, db_file, startup, adb)
+        await dm.ensure_loaded_async()
+        return dm
     
     def _init_score_rules(self):
         """점수 규칙 초기화"""
@@ -72,9 +285,8 @@ class DataManager:
             self.db.set_tier_rule(tier_name, threshold)
         return config.TIER_RULES.copy()
     
-    def _load_settings(self):
-        """시스템 설정 로드"""
-        settings_json = self.db.get_setting("super_admin")
+    def _load_settings(self, settings_json):
+        """시스템 설정 로드 (settings_json: DB의 super_admin 값)"""
         if settings_json:
             return {"super_admin": json.loads(settings_json)}
         else:
@@ -83,16 +295,22 @@ class DataManager:
             self.db.set_setting("super_admin", json.dumps(default_sa))
             return {"super_admin": default_sa}
 
-    def _auto_bootstrap_from_json_if_needed(self):
-        """DB가 비어있을 때 JSON 파일에서 1회성 데이터 복구"""
+    @_write_op
+    def bootstrap_from_json(self, source_file=None):
+        """빈 DB에 JSON 파일 데이터 1회성 복구 (초기 마이그레이션, bootstrap_db.py에서 호출)
+
+        Returns:
+            (bool, str): 성공 여부, 메시지
+        """
         try:
-            if self.db.get_all_players():
-                return
+            if self.db.has_players():
+                return False, "DB에 이미 선수 데이터가 있어 복구하지 않습니다."
 
-            candidate_files = [config.DATA_FILE, f"{config.DATA_FILE}.backup", os.path.join(config.BASE_PATH, "data.json.backup")]
-            source_file = next((f for f in candidate_files if os.path.exists(f)), None)
-            if not source_file:
-                return
+            if source_file is None:
+                candidate_files = [config.DATA_FILE, f"{config.DATA_FILE}.backup", os.path.join(config.BASE_PATH, "data.json.backup")]
+                source_file = next((f for f in candidate_files if os.path.exists(f)), None)
+            if not source_file or not os.path.exists(source_file):
+                return False, "복구할 JSON 파일이 없습니다."
 
             with open(source_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -163,87 +381,640 @@ class DataManager:
                         dispute_reason=match.get("dispute_reason"),
                     )
 
-            # 규칙/설정 재로딩
-            self.score_rules = self.db.get_score_rules() or self.score_rules
-            self.tier_rules = self.db.get_tier_rules() or self.tier_rules
-            print(f"[bootstrap] JSON 데이터를 DB로 복구했습니다: {source_file}")
+            # 규칙/설정 · 캐시 재로딩
+            self._reload_all()
+            return True, f"JSON 데이터를 DB로 복구했습니다: {source_file} (선수 {len(players_data)}명)"
         except Exception as e:
-            print(f"[bootstrap] JSON 자동 복구 실패: {e}")
+            return False, f"JSON 복구 실패: {e}"
     
+    # ========== 쓰기 범위 ==========
+    @contextmanager
+    def _write_scope(self):
+        """쓰기 시작/종료 (가장 바깥 쓰기가 끝났을 때 실제로 기록된 것이 있으면 데이터 버전 갱신)
+
+        실패 · 롤백 · 변경 없음(중복 승인, 버전 충돌 등)으로 끝난 쓰기는 버전을 올리지 않아
+        다른 워커/세션이 불필요하게 전체 재로딩하지 않는다.
+        """
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            self._local.committed = False
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            if depth == 0 and self._local.committed:
+                self._local.committed = False
+                # 이전 스냅샷에는 방금 쓴 내용이 없으므로 이후 읽기는 최신 캐시를 기다림
+                self._stale = {}
+                self._bump_data_version()
+
+    def _in_write(self):
+        return getattr(self._local, "depth", 0) > 0
+
+    def _mark_committed(self):
+        """현재 쓰기 범위에서 DB 기록이 반영됨 (캐시 게시 · 규칙/설정 저장 시 호출)"""
+        if self._in_write():
+            self._local.committed = True
+
+    def _match_id_at(self, date, match_idx):
+        """date의 match_idx 자리에 있는 경기 id (없으면 None)"""
+        matches = self.history.get(date, [])
+        if not 0 <= match_idx < len(matches):
+            return None
+        return matches[match_idx].get("id")
+
+    def _match_lock_keys(self, date, match_idx):
+        """경기 단위 쓰기에서 잡을 잠금 키 (경기 id + 참가 선수) → (경기 id, 키 목록)"""
+        matches = self.history.get(date, [])
+        if not 0 <= match_idx < len(matches):
+            return None, [("date", date)]
+        m = matches[match_idx]
+        return m.get("id"), [("match", m.get("id"))] + [("player", pid) for pid in m["team1"] + m["team2"]]
+
+    # ========== 캐시 (single-flight 재구성 + copy-on-write 게시) ==========
+    def _cached(self, attr, build):
+        """캐시 조회, 비어 있으면 single-flight로 재구성
+
+        한 스레드만 DB에서 다시 읽고, 동시에 같은 캐시를 요청한 스레드는
+        그 결과를 기다렸다가 그대로 공유한다 (coalesced_rebuilds로 집계).
+        """
+        value = getattr(self, attr)
+        if value is not None:
+            return value
+        value = self._stale_value(attr)
+        if value is not None:
+            return value
+        with self._build_lock:
+            value = getattr(self, attr)
+            if value is not None:
+                self.cache_stats["coalesced_rebuilds"] += 1
+                return value
+            return self._rebuild(attr, build)
+
+    def _rebuild(self, attr, build):
+        """build() 결과({속성: 값})를 게시 (읽는 동안 같은 계열에 쓰기가 반영됐으면 다시 읽음)"""
+        family = "players" if attr == "_players_cache" else "history"
+        while True:
+            gen = self._cache_gen[family]
+            values = build()
+            with self._publish_lock:
+                if self._cache_gen[family] == gen:
+                    for key, value in values.items():
+                        setattr(self, key, value)
+                    if "_history_cache" in values:
+                        self._stale = {}
+                        self._stale_since = None
+                    return values[attr]
+            self.cache_stats["rebuild_retries"] += 1
+
+    def _build_players_cache(self):
+        return self._players_values(self.db.get_all_players())
+
+    def _players_values(self, rows):
+        self.cache_stats["players_rebuilds"] += 1
+        return {"_players_cache": {row["emp_id"]: Player.from_db_row(row) for row in rows}}
+
+    def _build_history_cache(self):
+        return self._history_values(self._load_history())
+
+    def _history_values(self, history):
+        index = self._build_player_index(history)
+        return {
+            "_history_cache": history,
+            "_player_index_cache": index,
+            "_boost_cache": self._build_boost_table(index),
+        }
+
+    # ========== 비동기 적재 (API 서버, self.adb) ==========
+    async def ensure_loaded_async(self):
+        """비어 있는 선수 · 경기 이력 캐시를 비동기 DB로 동시에 적재 (요청 처리 전 호출)
+
+        이후의 동기 속성 읽기(players/history)가 이벤트 루프 안에서 DB를 기다리지 않게 한다.
+        적재 중 같은 계열에 쓰기가 반영됐으면 게시하지 않고 다시 읽는다.
+        """
+        if self.adb is None:
+            return
+        async with self._async_load_lock:
+            for _ in range(3):
+                families = [
+                    family for family, attr in (("players", "_players_cache"), ("history", "_history_cache"))
+                    if getattr(self, attr) is None
+                ]
+                if not families:
+                    return
+                gens = dict(self._cache_gen)
+                loaders = {"players": self.adb.get_all_players, "history": self.adb.get_all_matches}
+                results = await asyncio.gather(*(loaders[family]() for family in families))
+
+                built = {}
+                for family, rows in zip(families, results):
+                    if family == "players":
+                        built[family] = self._players_values(rows)
+                    else:
+                        built[family] = self._history_values(self._history_from_rows(rows))
+                        self.cache_stats["history_rebuilds"] += 1
+
+                with self._publish_lock:
+                    for family, values in built.items():
+                        if self._cache_gen[family] != gens[family]:
+                            self.cache_stats["rebuild_retries"] += 1
+                            continue
+                        for key, value in values.items():
+                            setattr(self, key, value)
+                        if family == "history":
+                            self._stale = {}
+                            self._stale_since = None
+
+    async def refresh_if_stale_async(self):
+        """refresh_if_stale()의 비동기 버전
+
+        Returns:
+            bool: 재로딩했으면 True
+        """
+        version = await self.adb.get_data_version()
+        if version == self.data_version:
+            return False
+        await self.reload_async()
+        self.cache_stats["version_reloads"] += 1
+        return True
+
+    async def reload_async(self):
+        """reload()의 비동기 버전: 규칙 · 설정 · 데이터 버전을 한 번에 다시 읽고 캐시 재적재
+
+        캐시 비우기는 스레드에서 쓰기와 같은 잠금을 잡고 실행한다
+        (스레드 풀에서 진행 중인 쓰기 도중에 게시되지 않고, 이벤트 루프가 잠금을 기다리지 않도록).
+        """
+        startup = await self.adb.get_startup_config()
+        await asyncio.to_thread(self._apply_reload, startup)
+        await self.ensure_loaded_async()
+
+    @_synchronized
+    def _apply_reload(self, startup):
+        """미리 조회한 시작 설정으로 캐시 비우고 규칙 · 데이터 버전 반영"""
+        self._invalidate_cache()
+        self._apply_startup(startup)
+        with self._version_lock:
+            self.data_version = max(self.data_version, startup["data_version"])
+
+    async def snapshot_async(self):
+        """snapshot()의 비동기 버전 (API 서버 읽기용)
+
+        선수 · 경기 이력은 비동기 DB로 적재하고, 인덱스 · 집계는 메모리에서만 만든다.
+        적재 직후 다른 쓰기가 캐시를 비웠으면 다시 적재한다.
+        """
+        if self.adb is None:
+            return await asyncio.to_thread(self.snapshot)
+        while True:
+            await self.ensure_loaded_async()
+            with self._publish_lock:
+                players, history = self._players_cache, self._history_cache
+                index, aggregates = self._player_index_cache, self._aggregate_cache
+            if players is not None and history is not None:
+                break
+        if index is None:
+            index = self._build_player_index(history)
+        if aggregates is None:
+            aggregates = self._build_player_aggregates(history)
+        with self._publish_lock:
+            if self._history_cache is history:
+                if self._player_index_cache is None:
+                    self._player_index_cache = index
+                if self._aggregate_cache is None:
+                    self._aggregate_cache = aggregates
+        return CacheSnapshot(players, history, index, aggregates)
+
+    # ========== stale-while-revalidate (config.HISTORY_STALE_WHILE_REVALIDATE) ==========
+    _STALE_ATTRS = ("_history_cache", "_player_index_cache", "_boost_cache", "_aggregate_cache")
+
+    def _keep_stale_snapshot(self):
+        """무효화 직전 경기 이력 캐시를 읽기용 스냅샷으로 보관"""
+        if not config.HISTORY_STALE_WHILE_REVALIDATE or self._history_cache is None:
+            return
+        self._stale = {a: getattr(self, a) for a in self._STALE_ATTRS if getattr(self, a) is not None}
+        if self._stale_since is None:
+            self._stale_since = time.monotonic()
+
+    def _stale_value(self, attr):
+        """재구성 중 읽기에 돌려줄 이전 스냅샷 (쓰기 중이거나 허용 시간을 넘었으면 None)"""
+        stale, since = self._stale, self._stale_since
+        if not stale or since is None or self._in_write():
+            return None
+        if time.monotonic() - since > config.HISTORY_MAX_STALENESS:
+            return None
+        value = stale.get(attr)
+        if value is not None:
+            self.cache_stats["stale_reads"] += 1
+            self._start_revalidation()
+        return value
+
+    def _start_revalidation(self):
+        with self._revalidate_lock:
+            if self._revalidating:
+                return
+            self._revalidating = True
+        threading.Thread(target=self._revalidate, name="history-revalidate", daemon=True).start()
+
+    def _revalidate(self):
+        """백그라운드에서 경기 이력 재구성 (끝나면 스냅샷 폐기)"""
+        try:
+            with self._build_lock:
+                if self._history_cache is None:
+                    self._rebuild("_history_cache", self._build_history_cache)
+                    self.cache_stats["background_rebuilds"] += 1
+        except Exception as e:
+            print(f"[history] 백그라운드 재구성 실패: {e}")
+        finally:
+            with self._revalidate_lock:
+                self._revalidating = False
+
     @property
     def players(self):
-        """선수 딕셔너리 (호환성 유지)"""
-        if self._players_cache is None:
-            rows = self.db.get_all_players()
-            self._players_cache = {row["emp_id"]: Player.from_db_row(row) for row in rows}
-        return self._players_cache
+        """선수 딕셔너리 (호환성 유지, 읽기 전용 사본)"""
+        return self._cached("_players_cache", self._build_players_cache)
     
     @property
     def history(self):
-        """경기 이력 딕셔너리 (호환성 유지)"""
-        if self._history_cache is None:
-            dates = self.db.get_all_match_dates()
-            self._history_cache = {}
-            for date in dates:
-                matches = self.db.get_matches_by_date(date)
-                self._history_cache[date] = []
-                for m in matches:
-                    # DB 형식 → JSON 형식 변환
-                    team1 = [p for p in [m["team1_player1"], m["team1_player2"]] if p]
-                    team2 = [p for p in [m["team2_player1"], m["team2_player2"]] if p]
-                    self._history_cache[date].append({
-                        "id": m["id"],
-                        "team1": team1,
-                        "team2": team2,
-                        "score1": m["score1"],
-                        "score2": m["score2"],
-                        "change1": m["change1"],
-                        "change2": m["change2"],
-                        "group": m["group_name"],
-                        "status": m["status"],
-                        "input_by": m["input_by"],
-                        "input_timestamp": m["input_timestamp"],
-                        "approved_by": m["approved_by"],
-                        "approved_timestamp": m["approved_timestamp"],
-                        "dispute_reason": m["dispute_reason"],
-                    })
-        return self._history_cache
+        """경기 이력 딕셔너리 (호환성 유지, 읽기 전용 사본)"""
+        return self._cached("_history_cache", self._build_history_cache)
+
+    @property
+    def player_index(self):
+        """사번 → 해당 선수의 경기 참조 [(date, match), ...] (날짜순)"""
+        return self._cached(
+            "_player_index_cache",
+            lambda: {"_player_index_cache": self._build_player_index(self.history)},
+        )
+
+    def snapshot(self):
+        """players/history/인덱스/집계를 같은 시점 기준으로 묶은 읽기 전용 스냅샷"""
+        built = CacheSnapshot(self.players, self.history, self.player_index, self.player_aggregates)
+        with self._publish_lock:
+            current = CacheSnapshot(
+                self._players_cache, self._history_cache, self._player_index_cache, self._aggregate_cache
+            )
+        if any(v is None for v in current) or current.history is not built.history:
+            return built
+        return current
+
+    @property
+    def boost_table(self):
+        """선수별 부스트 자격 표 (첫 경기 연/월 · 보충 상한, 경기 이력과 함께 갱신)"""
+        return self._cached(
+            "_boost_cache",
+            lambda: {"_boost_cache": self._build_boost_table(self.player_index)},
+        )
+
+    @staticmethod
+    def _build_boost_table(index):
+        """선수 인덱스 → 부스트 자격 표 (인덱스의 첫 경기 날짜 기준)"""
+        return rating_engine.BoostTable({eid: entries[0][0] for eid, entries in index.items() if entries})
+
+    @staticmethod
+    def _build_player_index(history):
+        """경기 이력으로부터 선수별 경기 인덱스 생성"""
+        index = {}
+        for date in sorted(history.keys()):
+            for m in history[date]:
+                for pid in m["team1"] + m["team2"]:
+                    index.setdefault(pid, []).append((date, m))
+        return index
+
+    def _publish_date(self, date, update):
+        """date의 경기 목록을 update(기존 목록) 결과로 교체한 새 사본 게시 (선수 인덱스도 해당 선수만 갱신)"""
+        self._mark_committed()
+        with self._publish_lock:
+            self._cache_gen["history"] += 1
+            self._aggregate_cache = None
+            if self._history_cache is None:
+                return
+            old = self._history_cache.get(date, [])
+            new = update(old)
+            history = dict(self._history_cache)
+            if new:
+                history[date] = new
+            else:
+                history.pop(date, None)
+
+            index, boost = self._player_index_cache, self._boost_cache
+            if index is not None:
+                index = dict(index)
+                boost = boost.copy() if boost is not None else None
+                affected = {pid for m in old + new for pid in m["team1"] + m["team2"]}
+                for pid in affected:
+                    entries = index.get(pid, [])
+                    mine = [(date, m) for m in new if pid in m["team1"] or pid in m["team2"]]
+                    entries = (
+                        [e for e in entries if e[0] < date] + mine + [e for e in entries if e[0] > date]
+                    )
+                    if entries:
+                        index[pid] = entries
+                    else:
+                        index.pop(pid, None)
+                    if boost is not None:
+                        boost.set_first_play(pid, entries[0][0] if entries else None)
+            else:
+                boost = None
+
+            self._history_cache = history
+            self._player_index_cache = index
+            self._boost_cache = boost
+
+    def _add_matches(self, date, entries):
+        """새 경기들을 캐시에 추가"""
+        self._publish_date(date, lambda old: old + list(entries))
+
+    def _remove_match(self, date, match):
+        """삭제된 경기를 캐시에서 제거"""
+        self._publish_date(date, lambda old: [m for m in old if m["id"] != match["id"]])
+
+    @property
+    def player_aggregates(self):
+        """선수별 통산/최근 대회 집계 (다음 쓰기 전까지 캐시)"""
+        return self._cached(
+            "_aggregate_cache",
+            lambda: {"_aggregate_cache": self._build_player_aggregates(self.history)},
+        )
+
+    @staticmethod
+    def _build_player_aggregates(history):
+        """경기 이력 1회 순회로 승/패, 승률, 최근 대회 성적 집계"""
+        aggregates = {}
+        for date in sorted(history.keys()):
+            for m in history[date]:
+                if m.get("status") != "done":
+                    continue
+                # 동점은 양 팀 모두 승리가 아님 (선수 프로필 집계와 동일)
+                for is_t1, team in ((True, m["team1"]), (False, m["team2"])):
+                    is_win = m["score1"] > m["score2"] if is_t1 else m["score2"] > m["score1"]
+                    change = m.get("change1", 0) if is_t1 else m.get("change2", 0)
+                    for pid in team:
+                        agg = aggregates.get(pid)
+                        if agg is None:
+                            agg = aggregates[pid] = {
+                                "wins": 0, "losses": 0, "rate": 0,
+                                "last_date": None, "last_change": 0, "last_wins": 0, "last_losses": 0,
+                            }
+                        if agg["last_date"] != date:
+                            agg["last_date"] = date
+                            agg["last_change"] = 0
+                            agg["last_wins"] = 0
+                            agg["last_losses"] = 0
+                        agg["last_change"] += change or 0
+                        if is_win:
+                            agg["wins"] += 1
+                            agg["last_wins"] += 1
+                        else:
+                            agg["losses"] += 1
+                            agg["last_losses"] += 1
+        for agg in aggregates.values():
+            agg["rate"] = int(agg["wins"] / max(agg["wins"] + agg["losses"], 1) * 100)
+        return aggregates
+
+    def get_player_matches(self, eid, status=None):
+        """선수가 참가한 경기 [(date, match), ...] (날짜순, status 지정 시 필터)"""
+        entries = self.player_index.get(eid, [])
+        if status is None:
+            return list(entries)
+        return [(d, m) for d, m in entries if m.get("status") == status]
+
+    def _load_history(self):
+        """경기 이력 로드 (일괄 모드: 날짜 수와 무관하게 고정 왕복 횟수)"""
+        start_trips = self.db.round_trips
+        history = {}
+        if config.HISTORY_BULK_LOAD:
+            history = self._history_from_rows(self.db.get_all_matches())
+        else:
+            for date in self.db.get_all_match_dates():
+                history[date] = [self._match_from_row(m) for m in self.db.get_matches_by_date(date)]
+
+        self.cache_stats["history_rebuilds"] += 1
+        self.cache_stats["last_history_round_trips"] = self.db.round_trips - start_trips
+        return history
+
+    @classmethod
+    def _history_from_rows(cls, rows):
+        """(date, id) 순 경기 행 → 날짜별 경기 이력"""
+        history = {}
+        for m in rows:
+            history.setdefault(m["date"], []).append(cls._match_from_row(m))
+        return history
+
+    @staticmethod
+    def _new_match_entry(match_id, team1, team2, group_name):
+        """새로 추가된 경기의 캐시 항목 (DB 기본값 기준)"""
+        return {
+            "id": match_id,
+            "team1": [p for p in team1 if p],
+            "team2": [p for p in team2 if p],
+            "score1": 0,
+            "score2": 0,
+            "change1": 0,
+            "change2": 0,
+            "group": group_name,
+            "status": "pending",
+            "input_by": None,
+            "input_timestamp": None,
+            "approved_by": None,
+            "approved_timestamp": None,
+            "dispute_reason": None,
+        }
+
+    @staticmethod
+    def _match_from_row(m):
+        """DB 형식 → JSON 형식 변환"""
+        team1 = [p for p in [m["team1_player1"], m["team1_player2"]] if p]
+        team2 = [p for p in [m["team2_player1"], m["team2_player2"]] if p]
+        return {
+            "id": m["id"],
+            "team1": team1,
+            "team2": team2,
+            "score1": m["score1"],
+            "score2": m["score2"],
+            "change1": m["change1"],
+            "change2": m["change2"],
+            "group": m["group_name"],
+            "status": m["status"],
+            "input_by": m["input_by"],
+            "input_timestamp": m["input_timestamp"],
+            "approved_by": m["approved_by"],
+            "approved_timestamp": m["approved_timestamp"],
+            "dispute_reason": m["dispute_reason"],
+        }
     
     def _invalidate_cache(self):
-        """캐시 무효화"""
-        self._players_cache = None
-        self._history_cache = None
+        """캐시 무효화 (복구/일괄 재계산 등 전체 재로딩이 필요한 경우에만 사용)"""
+        self._mark_committed()
+        with self._publish_lock:
+            self._keep_stale_snapshot()
+            self._cache_gen["players"] += 1
+            self._cache_gen["history"] += 1
+            self._players_cache = None
+            self._history_cache = None
+            self._player_index_cache = None
+            self._boost_cache = None
+            self._aggregate_cache = None
+        self._seeded = None
+
+    def _bump_data_version(self):
+        """쓰기 후 데이터 버전 1 증가 (다른 세션/프로세스가 변경을 감지하도록)"""
+        with self._version_lock:
+            version = self.db.bump_data_version()
+            if version is None:
+                return
+            if version != self.data_version + 1:
+                # 마지막으로 본 버전 이후 다른 곳의 쓰기가 끼어 있었음 → 캐시를 믿을 수 없음
+                self._reload_all()
+                self.cache_stats["version_reloads"] += 1
+            self.data_version = version
+        for listener in self._write_listeners:
+            try:
+                listener(version)
+            except Exception as e:
+                print(f"[data_version] 쓰기 알림 실패: {e}")
+
+    def add_write_listener(self, callback):
+        """쓰기 후 호출할 콜백 등록 (callback(new_version), 다른 워커 알림 등)"""
+        self._write_listeners.append(callback)
+
+    def _reload_all(self):
+        """캐시 비우고 규칙·설정 재로딩"""
+        self._invalidate_cache()
+        self._apply_startup(self.db.get_startup_config())
+
+    def _apply_startup(self, startup):
+        """다시 읽은 시작 설정 반영 (규칙이 비어 있으면 기존 값 유지)"""
+        self.score_rules = startup["score_rules"] or self.score_rules
+        self.tier_rules = startup["tier_rules"] or self.tier_rules
+        if startup["super_admin"]:
+            self.settings = self._load_settings(startup["super_admin"])
+
+    @_synchronized
+    def refresh_if_stale(self):
+        """데이터 버전 1건 조회로 변경 여부 확인, 바뀌었을 때만 캐시·규칙 재로딩
+
+        Returns:
+            bool: 재로딩했으면 True
+        """
+        version = self.db.get_data_version()
+        if version == self.data_version:
+            return False
+        self._reload_all()
+        self.data_version = version
+        self.cache_stats["version_reloads"] += 1
+        return True
+
+    @_synchronized
+    def reload(self):
+        """전체 캐시·규칙 강제 재로딩 (데이터 버전은 갱신하지 않음)"""
+        self._reload_all()
+        self.data_version = self.db.get_data_version()
+
+    @_write_op
+    def reload_after_external_change(self):
+        """외부 스크립트(재계산 등)가 DB를 직접 수정한 뒤 호출: 재로딩 + 데이터 버전 갱신"""
+        self._reload_all()
+
+    def _publish_players(self, update):
+        """선수 캐시 사본에 update(사본)를 적용해 게시"""
+        self._mark_committed()
+        with self._publish_lock:
+            self._cache_gen["players"] += 1
+            if self._players_cache is None:
+                return
+            players = dict(self._players_cache)
+            update(players)
+            self._players_cache = players
+
+    def _patch_players(self, rows):
+        """방금 DB에 기록한 선수 값들(emp_id 포함 행)을 새 Player 사본으로 반영"""
+        def update(players):
+            for row in rows:
+                p = players.get(row["emp_id"])
+                if p is None:
+                    continue
+                p = copy.copy(p)
+                for key, value in row.items():
+                    setattr(p, key, value)
+                players[p.emp_id] = p
+        self._publish_players(update)
+
+    def _patch_player(self, emp_id, **fields):
+        """방금 DB에 기록한 값을 캐시된 선수에 반영"""
+        self._patch_players([{"emp_id": emp_id, **fields}])
+
+    def _patch_match(self, match, **fields):
+        """방금 DB에 기록한 값을 반영한 새 경기 딕셔너리로 교체"""
+        date = self._match_date(match)
+        if date is None:
+            self._mark_committed()
+            with self._publish_lock:
+                self._cache_gen["history"] += 1
+                self._aggregate_cache = None
+            return
+        updated = {**match, **fields}
+        self._publish_date(date, lambda old: [updated if m["id"] == match["id"] else m for m in old])
+
+    def _match_date(self, match):
+        """캐시에서 경기가 속한 날짜 찾기 (선수 인덱스 우선)"""
+        index, history = self._player_index_cache, self._history_cache
+        if index is not None:
+            for pid in match["team1"] + match["team2"]:
+                for d, m in index.get(pid, ()):
+                    if m["id"] == match["id"]:
+                        return d
+        if history is not None:
+            for d, matches in history.items():
+                if any(m["id"] == match["id"] for m in matches):
+                    return d
+        return None
     
     # ========== 인증 시스템 ==========
     def authenticate(self, username, password):
         """로그인 처리"""
         # 1. 슈퍼관리자 체크
-        sa = self.settings.get("super_admin", {})
-        if username == sa.get("username", "admin"):
-            pw_hash = hashlib.sha256(password.encode()).hexdigest()
-            if pw_hash == sa.get("password_hash"):
-                return True, "super_admin", None
+        if self._is_super_admin(username, password):
+            return True, "super_admin", None
         
         # 2. 선수 로그인
-        player_row = self.db.get_player(password)  # password = emp_id
+        player_row = self.db.get_player(password, columns=("name", "role"))  # password = emp_id
+        return self._player_login(player_row, username, password)
+    
+    async def authenticate_async(self, username, password):
+        """로그인 처리 (비동기 DB, API 서버용)"""
+        if self._is_super_admin(username, password):
+            return True, "super_admin", None
+        player_row = await self.adb.get_player(password, columns=("name", "role"))
+        return self._player_login(player_row, username, password)
+    
+    def _is_super_admin(self, username, password):
+        sa = self.settings.get("super_admin", {})
+        if username != sa.get("username", "admin"):
+            return False
+        return hashlib.sha256(password.encode()).hexdigest() == sa.get("password_hash")
+    
+    @staticmethod
+    def _player_login(player_row, username, emp_id):
         if player_row and player_row["name"] == username:
             role = "admin" if player_row.get("role") == "admin" else "player"
-            return True, role, password
-        
+            return True, role, emp_id
         return False, None, None
     
+    @_write_op
     def set_player_role(self, eid, role):
         """관리자 권한 부여/회수"""
         success = self.db.update_player(eid, role=role)
         if success:
-            self._invalidate_cache()
+            self._patch_player(eid, role=role)
         return success
     
+    @_write_op
     def change_super_admin_password(self, new_password):
         """슈퍼관리자 비밀번호 변경"""
         pw_hash = hashlib.sha256(new_password.encode()).hexdigest()
         self.settings["super_admin"]["password_hash"] = pw_hash
-        self.db.set_setting("super_admin", json.dumps(self.settings["super_admin"]))
+        if self.db.set_setting("super_admin", json.dumps(self.settings["super_admin"])):
+            self._mark_committed()
     
     # ========== 데이터 I/O (호환성 유지) ==========
     def create_backup(self):
@@ -253,7 +1024,7 @@ class DataManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = os.path.join(self.backup_dir, f"knoc_badminton_backup_{timestamp}.db")
         try:
-            shutil.copy2(self.db.db_file, backup_path)
+            self.db.backup_to(backup_path)
             # 오래된 백업 삭제 (최대 30개)
             backups = self.get_backup_list()
             if len(backups) > 30:
@@ -271,16 +1042,13 @@ class DataManager:
         files.sort(reverse=True)
         return files
     
+    @_write_op
     def restore_backup(self, filename):
         """백업 복구"""
         src = os.path.join(self.backup_dir, filename)
-        if os.path.exists(src):
-            shutil.copy2(src, self.db.db_file)
-            self._invalidate_cache()
-            # 규칙 재로드
-            self.score_rules = self.db.get_score_rules()
-            self.tier_rules = self.db.get_tier_rules()
-            self.settings = self._load_settings()
+        if os.path.exists(src) and os.path.exists(self.db.db_file):
+            self.db.restore_from(src)
+            self._reload_all()
             return True
         return False
     
@@ -293,6 +1061,7 @@ class DataManager:
         pass
     
     # ========== 규칙 / 티어 ==========
+    @_write_op
     def update_rules(self, new_score_rules, new_tier_rules):
         """규칙 업데이트"""
         # 점수 규칙 업데이트
@@ -304,34 +1073,35 @@ class DataManager:
         for tier_name, threshold in new_tier_rules.items():
             self.db.set_tier_rule(tier_name, threshold)
         self.tier_rules = new_tier_rules
+        self._mark_committed()
         
         # 모든 선수 티어 재계산
-        players = self.db.get_all_players()
+        players = self.db.get_all_players(columns=("emp_id", "score", "version"))
         for p in players:
-            new_tier = self.calculate_tier(p["score"])
-            self.db.update_player(p["emp_id"], tier=new_tier)
-        
-        self._invalidate_cache()
+            self._update_player_checked(
+                p["emp_id"], ("emp_id", "score", "version"),
+                lambda row: {"tier": self.calculate_tier(row["score"])},
+                row=p,
+            )
     
     def calculate_tier(self, score):
         """티어 계산"""
-        sorted_tiers = sorted(self.tier_rules.items(), key=lambda x: x[1], reverse=True)
-        for tier_name, threshold in sorted_tiers:
-            if score >= threshold:
-                return tier_name
-        return "브론즈"
+        return rating_engine.tier_for(score, self.tier_rules)
     
     # ========== 선수 관리 ==========
+    @_write_op
     def add_player(self, eid, name, score=1000, is_active=True):
         """선수 추가"""
         tier = self.calculate_tier(score)
         join_date = datetime.now().strftime("%Y-%m-%d")
         success = self.db.add_player(eid, name, score, tier, is_active, join_date)
         if success:
-            self._invalidate_cache()
+            player = Player(eid, name=name, score=score, tier=tier, is_active=is_active, join_date=join_date)
+            self._publish_players(lambda players: players.__setitem__(eid, player))
             return True, f"{name} 선수 등록 완료!"
         return False, "이미 존재하는 사번입니다."
     
+    @_write_op
     def update_player_info(self, emp_id, new_name=None, new_score=None, is_active=None):
         """선수 정보 수정"""
         updates = {}
@@ -346,15 +1116,16 @@ class DataManager:
         if updates:
             success = self.db.update_player(emp_id, **updates)
             if success:
-                self._invalidate_cache()
+                self._patch_player(emp_id, **updates)
             return success
         return False
     
+    @_write_op
     def delete_player(self, eid):
         """선수 삭제"""
         success = self.db.delete_player(eid)
         if success:
-            self._invalidate_cache()
+            self._publish_players(lambda players: players.pop(eid, None))
         return success
     
     def change_emp_id(self, old_id, new_id):
@@ -363,6 +1134,7 @@ class DataManager:
         return False
     
     # ========== 경기 결과 처리 ==========
+    @_match_op
     def update_match_result(self, date, match_idx, score1, score2, input_by=None):
         """경기 결과 업데이트 (확정)"""
         matches = self.history.get(date, [])
@@ -370,63 +1142,18 @@ class DataManager:
             return False
         
         match = matches[match_idx]
-        match_id = match.get("id")
-        
-        if not match_id:
+        if not match.get("id"):
             return False
         
-        # 기존 결과가 있으면 롤백
-        if match.get("status") == "done":
-            self._rollback_match_effect(match)
-        
-        # 점수 계산
-        t1, t2 = match["team1"], match["team2"]
-        win_t1 = score1 > score2
-        diff = abs(score1 - score2)
-        
-        # 평균 점수 계산
-        players_dict = self.players
-        avg_s1 = sum(players_dict[p].score for p in t1 if p in players_dict) / max(len(t1), 1)
-        avg_s2 = sum(players_dict[p].score for p in t2 if p in players_dict) / max(len(t2), 1)
-        
-        # 보너스 계산
-        base_win = self.score_rules["win"]
-        base_loss = self.score_rules["loss"]
-        bonus = 0
-        
-        if diff >= self.score_rules.get("big_diff", 10):
-            bonus += self.score_rules.get("big_win", 5)
-        if win_t1 and (avg_s2 - avg_s1 >= 100):
-            bonus += self.score_rules.get("underdog", 15)
-        elif not win_t1 and (avg_s1 - avg_s2 >= 100):
-            bonus += self.score_rules.get("underdog", 15)
-        
-        change_win = base_win + bonus
-        change_loss = base_loss
-        
-        # 선수 점수 업데이트
-        for pid in t1:
-            if pid in players_dict:
-                self._apply_score(pid, win_t1, change_win, change_loss)
-        for pid in t2:
-            if pid in players_dict:
-                self._apply_score(pid, not win_t1, change_win, change_loss)
-        
-        # 경기 상태 업데이트
-        self.db.update_match(
-            match_id,
-            score1=score1,
-            score2=score2,
-            change1=change_win if win_t1 else change_loss,
-            change2=change_loss if win_t1 else change_win,
-            status="done",
+        return self._finalize_match(
+            match,
+            score1,
+            score2,
             input_by=input_by,
-            input_timestamp=datetime.now().strftime("%Y-%m-%d %H:%M") if input_by else None
+            input_timestamp=datetime.now().strftime("%Y-%m-%d %H:%M") if input_by else None,
         )
-        
-        self._invalidate_cache()
-        return True
     
+    @_match_op
     def submit_score_for_approval(self, date, match_idx, score1, score2, input_by):
         """점수 입력 → 승인 대기"""
         matches = self.history.get(date, [])
@@ -439,18 +1166,20 @@ class DataManager:
         if not match_id or match.get("status") == "done":
             return False
         
-        self.db.update_match(
-            match_id,
-            score1=score1,
-            score2=score2,
-            status="pending_approval",
-            input_by=input_by,
-            input_timestamp=datetime.now().strftime("%Y-%m-%d %H:%M")
-        )
+        match_updates = {
+            "score1": score1,
+            "score2": score2,
+            "status": "pending_approval",
+            "input_by": input_by,
+            "input_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        }
+        if not self.db.update_match(match_id, **match_updates):
+            return False
         
-        self._invalidate_cache()
+        self._patch_match(match, **match_updates)
         return True
     
+    @_match_op
     def approve_match(self, date, match_idx, approved_by):
         """상대팀 승인 → 확정"""
         matches = self.history.get(date, [])
@@ -461,24 +1190,18 @@ class DataManager:
         if match.get("status") != "pending_approval":
             return False
         
-        s1, s2 = match["score1"], match["score2"]
-        match_id = match["id"]
-        
-        # 임시로 pending 상태로 변경
-        self.db.update_match(
-            match_id,
-            status="pending",
-            score1=0,
-            score2=0,
+        # 승인 정보 + 점수 반영을 한 번에 확정
+        return self._finalize_match(
+            match,
+            match["score1"],
+            match["score2"],
+            input_by=match.get("input_by"),
+            input_timestamp=match.get("input_timestamp"),
             approved_by=approved_by,
-            approved_timestamp=datetime.now().strftime("%Y-%m-%d %H:%M")
+            approved_timestamp=datetime.now().strftime("%Y-%m-%d %H:%M"),
         )
-        
-        self._invalidate_cache()
-        
-        # 실제 점수 반영
-        return self.update_match_result(date, match_idx, s1, s2, input_by=match.get("input_by"))
     
+    @_match_op
     def reject_match(self, date, match_idx, reason=""):
         """이의제기"""
         matches = self.history.get(date, [])
@@ -490,17 +1213,19 @@ class DataManager:
             return False
         
         match_id = match["id"]
-        self.db.update_match(
-            match_id,
-            status="disputed",
-            dispute_reason=reason,
-            score1=0,
-            score2=0
-        )
+        match_updates = {
+            "status": "disputed",
+            "dispute_reason": reason,
+            "score1": 0,
+            "score2": 0,
+        }
+        if not self.db.update_match(match_id, **match_updates):
+            return False
         
-        self._invalidate_cache()
+        self._patch_match(match, **match_updates)
         return True
     
+    @_match_op
     def admin_force_confirm(self, date, match_idx, score1, score2, admin_id):
         """관리자 강제 확정"""
         matches = self.history.get(date, [])
@@ -508,95 +1233,212 @@ class DataManager:
             return False
         
         match = matches[match_idx]
-        match_id = match["id"]
-        
-        # 기존 결과 롤백
-        if match.get("status") == "done":
-            self._rollback_match_effect(match)
-        
-        # pending 상태로 리셋
-        self.db.update_match(
-            match_id,
-            status="pending",
-            score1=0,
-            score2=0,
+        now = datetime.now().strftime("%Y-%m-%d %H:%M")
+        
+        # 기존 결과 롤백 + 새 점수 반영을 한 번에 확정
+        return self._finalize_match(
+            match,
+            score1,
+            score2,
+            input_by=admin_id,
+            input_timestamp=now,
             approved_by=admin_id,
-            approved_timestamp=datetime.now().strftime("%Y-%m-%d %H:%M")
+            approved_timestamp=now,
         )
-        
-        self._invalidate_cache()
-        
-        # 새 점수 반영
-        return self.update_match_result(date, match_idx, score1, score2, input_by=admin_id)
     
-    def _apply_score(self, pid, is_win, win_pt, loss_pt):
-        """선수 점수 적용"""
-        player_row = self.db.get_player(pid)
-        if not player_row:
-            return
-        
-        p = Player.from_db_row(player_row)
-        p.match_count += 1
-        
-        if is_win:
-            mult = self.get_boost_multiplier(pid)
-            gain = int(win_pt * mult)
-            p.score += gain
-            p.win_count += 1
-            p.streak += 1
-            if mult > 1.0:
-                p.boost_games += 1
-        else:
-            p.score += loss_pt
-            p.streak = 0
-        
-        p.tier = self.calculate_tier(p.score)
-        
-        # DB 업데이트
-        self.db.update_player(
-            pid,
-            score=p.score,
-            tier=p.tier,
-            match_count=p.match_count,
-            win_count=p.win_count,
-            streak=p.streak,
-            boost_games=p.boost_games
+    def _finalize_match(self, match, score1, score2, **match_fields):
+        """경기 확정: 기존 결과 롤백 · 점수 반영 · 경기 상태를 단일 트랜잭션으로 기록
+
+        참가 선수가 이후 날짜에 확정 경기를 가졌으면 그 경기들까지 체크포인트부터 다시 재생한다 (_rerate_match).
+        """
+        date = self._match_date(match)
+        if date is not None and self._has_later_results(match, date):
+            return self._rerate_match(
+                match, date, {"score1": score1, "score2": score2, "status": "done", **match_fields}
+            )
+        return self._commit_with_retry(
+            match, lambda players_dict: self._score_match(match, date, players_dict, score1, score2, match_fields)
         )
     
-    def _rollback_match_effect(self, match):
-        """경기 효과 롤백"""
+    def _score_match(self, match, date, players_dict, score1, score2, match_fields):
+        """조회한 선수 상태 기준으로 점수 변동 계산 (players_dict를 갱신, 경기 변경값과 원장 반환)
+
+        부스트는 재생과 같이 경기 날짜의 달을 기준으로 판정한다 (확정한 날짜가 아니라).
+        """
         t1, t2 = match["team1"], match["team2"]
-        win_t1 = match["score1"] > match["score2"]
-        c1 = match.get("change1", 0)
-        c2 = match.get("change2", 0)
         
+        # 기존 결과가 있으면 메모리에서 먼저 롤백
+        if match.get("status") == "done":
+            self._revert_players(match, players_dict, date)
+        
+        # 평균 점수 → 승패 · 보너스 (레이팅 엔진과 같은 규칙)
+        avg_s1 = sum(players_dict[p].score for p in t1 if p in players_dict) / max(len(t1), 1)
+        avg_s2 = sum(players_dict[p].score for p in t2 if p in players_dict) / max(len(t2), 1)
+        win_t1, change_win, change_loss = rating_engine.match_changes(
+            rating_engine.ScoreRules.from_dict(self.score_rules), score1, score2, avg_s1, avg_s2
+        )
+        
+        # 선수 점수 계산 (롤백용 변동 내역은 점수 원장에 기록)
+        ledger = []
         for pid in t1:
-            self._revert_score(pid, win_t1, c1)
+            if pid in players_dict:
+                ledger.append(self._apply_score(players_dict[pid], win_t1, change_win, change_loss, date))
         for pid in t2:
-            self._revert_score(pid, not win_t1, c2)
+            if pid in players_dict:
+                ledger.append(self._apply_score(players_dict[pid], not win_t1, change_win, change_loss, date))
+        
+        match_updates = {
+            "score1": score1,
+            "score2": score2,
+            "change1": change_win if win_t1 else change_loss,
+            "change2": change_loss if win_t1 else change_win,
+            "status": "done",
+            **match_fields,
+        }
+        return match_updates, ledger
+    
+    def _commit_with_retry(self, match, compute):
+        """선수 최신 상태 조회 → compute(players_dict) → 버전 확인 기록, 충돌 시 다시 계산
+
+        다른 프로세스가 같은 선수를 먼저 갱신하면 finalize_match가 버전 불일치로 거부한다.
+        이때 경기 상태가 그대로면 최신 값으로 다시 계산하고, 경기 자체가 바뀌었으면 포기한다.
+        """
+        for _ in range(config.SCORE_CAS_RETRIES + 1):
+            players_dict = self._fetch_players(match["team1"] + match["team2"])
+            match_updates, ledger = compute(players_dict)
+            if self._commit_match(match, players_dict, match_updates, ledger):
+                return True
+            current = self.db.get_match(match["id"], columns=("status",))
+            if current is None or current["status"] != match.get("status"):
+                return False
+            self.cache_stats["score_conflicts"] += 1
+        return False
+    
+    def _update_player_checked(self, emp_id, columns, compute, row=None):
+        """선수 한 명 읽기-수정-쓰기 (버전 확인 기록, 충돌 시 다시 읽어 재시도)
+
+        compute(row)는 기록할 값 딕셔너리를 반환하고, 반영할 것이 없으면 None.
+        row를 주면 첫 시도는 그 값(version 포함)을 그대로 쓴다.
+        """
+        for _ in range(config.SCORE_CAS_RETRIES + 1):
+            if row is None:
+                row = self.db.get_player(emp_id, columns=columns)
+                if row is None:
+                    return False
+            updates = compute(row)
+            if not updates:
+                return False
+            if self.db.update_player(emp_id, expected_version=row["version"], **updates):
+                self._patch_player(emp_id, version=row["version"] + 1, **updates)
+                return True
+            self.cache_stats["score_conflicts"] += 1
+            row = None
+        return False
+    
+    def _fetch_players(self, emp_ids):
+        """참가 선수 최신 상태 일괄 조회"""
+        rows = self.db.get_players(emp_ids, columns=SCORE_COLUMNS)
+        return {row["emp_id"]: Player.from_db_row(row) for row in rows}
+    
+    def _commit_match(self, match, players_dict, match_updates, ledger):
+        """선수 상태 · 점수 원장 · 경기 상태를 한 트랜잭션으로 저장 후 캐시 반영"""
+        rows = [self._score_row(p) for p in players_dict.values()]
+        seed = self._finalize_seed(match, players_dict, ledger)
+        ok = self.db.finalize_match(
+            match["id"],
+            match_updates,
+            rows,
+            ledger,
+            expected_status=match.get("status"),
+            seed=seed,
+        )
+        if not ok:
+            return False
+        if seed:
+            self._seeded = self._seeded_players() | set(seed["states"])
         
-        # 경기 상태 리셋
-        match_id = match["id"]
-        self.db.update_match(
-            match_id,
-            status="pending",
-            score1=0,
-            score2=0,
-            change1=0,
-            change2=0
+        # 기록과 함께 DB 트리거가 선수 행 버전을 1 올렸다
+        self._patch_players([{**row, "version": row["version"] + 1} for row in rows])
+        self._patch_match(match, **match_updates)
+        return True
+    
+    def _apply_score(self, p, is_win, win_pt, loss_pt, date):
+        """선수 점수 적용 (메모리 상 Player 갱신, 반영된 변동 내역을 원장 항목으로 반환)"""
+        mult = self._boost_multiplier_for(p, date) if is_win else 1.0
+        gain, streak_before, boost_used = rating_engine.apply_result(
+            p, is_win, win_pt, loss_pt, mult, rating_engine.tier_table(self.tier_rules)
         )
+        return {
+            "emp_id": p.emp_id,
+            "score_delta": gain,
+            "is_win": is_win,
+            "streak_before": streak_before,
+            "boost_used": boost_used,
+        }
     
-    def _revert_score(self, pid, is_win, change):
-        """점수 롤백"""
-        player_row = self.db.get_player(pid)
-        if not player_row:
+    @staticmethod
+    def _score_row(p):
+        """점수 반영에 필요한 선수 컬럼 (일괄 기록용)"""
+        return {c: getattr(p, c) for c in SCORE_COLUMNS}
+    
+    def _rollback_match_effect(self, match):
+        """경기 효과 롤백 (선수 상태 복원 + 경기 pending 리셋을 한 트랜잭션으로)"""
+        match_updates = {
+            "status": "pending",
+            "score1": 0,
+            "score2": 0,
+            "change1": 0,
+            "change2": 0,
+        }
+        date = self._match_date(match)
+        if date is not None and self._has_later_results(match, date):
+            return self._rerate_match(match, date, match_updates)
+        
+        def compute(players_dict):
+            self._revert_players(match, players_dict, date)
+            return dict(match_updates), []
+        return self._commit_with_retry(match, compute)
+    
+    def _revert_players(self, match, players_dict, date):
+        """확정된 경기 효과를 메모리 상 선수 객체에서 되돌림 (점수 원장 우선, 원장 없는 과거 경기는 역산)"""
+        entries = self.db.get_ledger_entries(match["id"])
+        if entries:
+            for e in entries:
+                p = players_dict.get(e["emp_id"])
+                if p is not None:
+                    self._revert_entry(p, e)
             return
         
-        p = Player.from_db_row(player_row)
+        win_t1 = match["score1"] > match["score2"]
+        c1 = match.get("change1", 0)
+        c2 = match.get("change2", 0)
+        for pid in match["team1"]:
+            if pid in players_dict:
+                self._revert_score(players_dict[pid], win_t1, c1, date)
+        for pid in match["team2"]:
+            if pid in players_dict:
+                self._revert_score(players_dict[pid], not win_t1, c2, date)
+    
+    def _revert_entry(self, p, e):
+        """원장 항목에 기록된 변동을 그대로 되돌림"""
+        p.score -= e["score_delta"]
+        p.match_count -= 1
+        if e["is_win"]:
+            p.win_count -= 1
+            p.streak = max(p.streak - 1, 0)
+        elif p.streak == 0:
+            # 이후 승리가 없었다면 패배로 끊긴 연승을 복원
+            p.streak = e["streak_before"]
+        if e["boost_used"]:
+            p.boost_games -= 1
+        p.tier = self.calculate_tier(p.score)
+    
+    def _revert_score(self, p, is_win, change, date):
+        """점수 롤백 (원장 없는 과거 경기: 경기 날짜 기준 현재 부스트 상태로 역산)"""
         p.match_count -= 1
         
         if is_win:
-            mult = self.get_boost_multiplier(pid)
+            mult = self._boost_multiplier_for(p, date)
             effective_change = int(change * mult) if mult > 1.0 else change
             p.score -= effective_change
             p.win_count -= 1
@@ -606,17 +1448,9 @@ class DataManager:
                 p.boost_games -= 1
         else:
             p.score -= change
-        
-        # DB 업데이트
-        self.db.update_player(
-            pid,
-            score=p.score,
-            match_count=p.match_count,
-            win_count=p.win_count,
-            streak=p.streak,
-            boost_games=p.boost_games
-        )
+        p.tier = self.calculate_tier(p.score)
     
+    @_match_op
     def delete_match_from_history(self, date, idx, keep_match=False):
         """경기 삭제"""
         matches = self.history.get(date, [])
@@ -629,62 +1463,358 @@ class DataManager:
         
         if not keep_match:
             match_id = match["id"]
-            self.db.delete_match(match_id)
-            self._invalidate_cache()
+            if self.db.delete_match(match_id):
+                self._remove_match(date, match)
+    
+    # ========== 레이팅 체크포인트 (과거 경기 수정 시 부분 재생) ==========
+    def _has_later_results(self, match, date):
+        """경기 참가 선수 중 date 이후 날짜에 확정 경기가 있는 선수가 있는지 (있으면 과거 경기 수정 → 부분 재생)
+
+        이 경기 결과는 참가 선수의 상태만 바꾸므로, 참가 선수가 이후에 뛴 확정 경기가 없으면
+        이후 경기들의 재생 입력은 그대로다 → 부분 재생 없이 경기 단위 잠금으로 확정한다.
+        """
+        index = self.player_index
+        return any(
+            d > date and m.get("status") == "done"
+            for pid in match["team1"] + match["team2"]
+            for d, m in index.get(pid, ())
+        )
+    
+    def _rerate_match(self, match, date, match_fields):
+        """과거 경기 수정: 가장 가까운 이전 체크포인트부터 date 이후 확정 경기를 다시 재생해 반영
+        
+        수정 전/후 이력을 같은 시작 상태에서 각각 재생하고 그 차이만 점수 원장과 현재 선수 상태에 더한다
+        (관리자가 직접 고친 점수 등 경기 외 조정은 유지). 상태가 바뀐 선수 · 경기 · 원장과
+        date 이후 체크포인트를 한 트랜잭션으로 기록하고, 다른 쓰기와 겹치면 다시 계산한다.
+        다른 경기 · 선수 행까지 다시 기록하므로 전역 쓰기(배타)로만 실행한다.
+        """
+        if not self._write_gate.owned():
+            raise _NeedsExclusive()
+        for _ in range(config.SCORE_CAS_RETRIES + 1):
+            plan, date_of = self._plan_rerate(match, date, match_fields)
+            if self.db.rerate_match(match["id"], expected_status=match.get("status"), **plan):
+                self.cache_stats["rerates"] += 1
+                self._publish_rerate(match, plan, date_of)
+                return True
+            current = self.db.get_match(match["id"], columns=("status",))
+            if current is None or current["status"] != match.get("status"):
+                return False
+            self.cache_stats["score_conflicts"] += 1
+        return False
+    
+    def _plan_rerate(self, match, date, match_fields):
+        """부분 재생 결과 → rerate_match 인자 (경기 id → 날짜 맵과 함께 반환)"""
+        history = self.history
+        first_play = {eid: entries[0][0] for eid, entries in self.player_index.items() if entries}
+        base, checkpoints, gap_count = self._rating_base(date, history, first_play)
+        
+        suffix = {d: history[d] for d in history if d >= date}
+        edited = {**match, **match_fields}
+        new_suffix = {**suffix, date: [edited if m["id"] == match["id"] else m for m in suffix[date]]}
+        old_matches = rating_engine.matches_from_history(suffix)
+        new_matches = rating_engine.matches_from_history(new_suffix)
+        old = rating_engine.replay(old_matches, self.score_rules, self.tier_rules, base, True, first_play)
+        new = rating_engine.replay(
+            new_matches, self.score_rules, self.tier_rules, base, True, first_play, checkpoints=True
+        )
+        self.cache_stats["last_rerate_replayed"] = gap_count + len(old_matches) + len(new_matches)
+        
+        ledger, score_delta, boost_delta = self._rerate_ledger(match["id"], old.ledger, new.ledger)
+        
+        # 선수 상태는 원장 변화만큼 (관리자가 직접 고친 점수 등 경기 외 조정은 유지)
+        rows = {r["emp_id"]: r for r in self.db.get_all_players(columns=SCORE_COLUMNS)}
+        tier_of = rating_engine.tier_table(self.tier_rules)
+        player_rows = []
+        for eid, after in new.players.items():
+            before, row = old.players[eid], rows.get(eid)
+            d_score, d_boost = score_delta.get(eid, 0), boost_delta.get(eid, 0)
+            if row is None or (after.values() == before.values() and not d_score and not d_boost):
+                continue
+            score = row["score"] + d_score
+            player_rows.append({
+                **row,
+                "score": score,
+                "tier": tier_of(score),
+                "match_count": row["match_count"] + after.match_count - before.match_count,
+                "win_count": row["win_count"] + after.win_count - before.win_count,
+                "streak": row["streak"] if after.streak == before.streak else after.streak,
+                "boost_games": max(row["boost_games"] + d_boost, 0),
+            })
+        
+        # change1/change2는 재생 결과가 달라진 경기만 다시 기록
+        date_of = {m["id"]: d for d, matches in suffix.items() for m in matches}
+        cached = {m["id"]: m for matches in suffix.values() for m in matches}
+        match_updates = dict(match_fields)
+        match_changes = []
+        for mid, change1, change2 in new.match_changes:
+            if mid == match["id"]:
+                match_updates.update(change1=change1, change2=change2)
+            elif (cached[mid].get("change1"), cached[mid].get("change2")) != (change1, change2):
+                match_changes.append({"id": mid, "change1": change1, "change2": change2})
+        
+        checkpoints += [{"date": d, "states": states} for d, states in new.checkpoints]
+        plan = {
+            "match_fields": match_updates,
+            "player_rows": player_rows,
+            "player_versions": {eid: row["version"] for eid, row in rows.items()},
+            "match_changes": match_changes,
+            "ledger_entries": ledger,
+            "checkpoints": checkpoints,
+            "replace_from": date,
+        }
+        return plan, date_of
+    
+    def _rerate_ledger(self, match_id, old_entries, new_entries):
+        """재생 결과가 달라진 경기의 점수 원장 = 기록된 변동 + (수정 후 재생 − 수정 전 재생)
+        
+        Returns:
+            (다시 기록할 원장 항목, 사번별 점수 변화, 사번별 부스트 사용 변화)
+        """
+        old_ledger = self._ledger_by_match(old_entries)
+        new_ledger = self._ledger_by_match(new_entries)
+        rewritten = {mid for mid, entries in new_ledger.items() if entries != old_ledger.get(mid)}
+        rewritten.add(match_id)
+        recorded = {}
+        for e in self.db.get_ledger_entries_for(sorted(rewritten)):
+            recorded.setdefault(e["match_id"], {})[e["emp_id"]] = e
+        
+        ledger = []
+        score_delta, boost_delta = {}, {}
+        for mid in rewritten:
+            before = {e["emp_id"]: e for e in old_ledger.get(mid, ())}
+            prev = recorded.get(mid) or before  # 원장 없는 과거 경기는 수정 전 재생 값으로 간주
+            for e in new_ledger.get(mid, ()):
+                eid = e["emp_id"]
+                if eid in prev:
+                    e["score_delta"] += prev[eid]["score_delta"] - before.get(eid, {"score_delta": 0})["score_delta"]
+                ledger.append(e)
+                score_delta[eid] = score_delta.get(eid, 0) + e["score_delta"]
+                boost_delta[eid] = boost_delta.get(eid, 0) + int(e["boost_used"])
+            for eid, e in prev.items():
+                score_delta[eid] = score_delta.get(eid, 0) - e["score_delta"]
+                boost_delta[eid] = boost_delta.get(eid, 0) - int(e["boost_used"])
+        return ledger, score_delta, boost_delta
+    
+    def _rating_base(self, date, history, first_play, inclusive=False):
+        """date 직전까지(inclusive면 date 경기까지)의 선수 레이팅 (가장 가까운 이전 체크포인트 + 그 사이 날짜 재생)
+        
+        Returns:
+            (시작 상태, 새로 저장할 체크포인트 행 목록, 사이 구간에서 재생한 경기 수)
+        """
+        seed, seed_changed = self._rating_seed()
+        checkpoints = [{"date": RATING_SEED_DATE, "states": seed}] if seed_changed else []
+        states, start = dict(seed), RATING_SEED_DATE
+        stored = self.db.get_rating_checkpoint(date, before=not inclusive)
+        if stored and stored["date"] > RATING_SEED_DATE:
+            states.update(stored["states"])
+            start = stored["date"]
+        
+        gap = rating_engine.matches_from_history(
+            {d: history[d] for d in history if start < d and (d <= date if inclusive else d < date)}
+        )
+        result = rating_engine.replay(
+            gap, self.score_rules, self.tier_rules,
+            rating_engine.states_from_checkpoint(states, self.tier_rules),
+            True, first_play, checkpoints=True,
+        )
+        checkpoints += [{"date": d, "states": s} for d, s in result.checkpoints]
+        return result.players, checkpoints, len(gap)
+    
+    def _rating_seed(self):
+        """재생 시작 점수 (저장된 값 + 새 선수는 현재 점수에서 점수 원장 변동을 빼서 역산)
+        
+        change1/change2는 부스트 전 기본 점수라 역산에는 부스트가 반영된 원장(score_delta)을 쓴다.
+        확정 경기 중 원장 기록이 없는 경기가 있는 선수는 역산할 수 없어 초기 점수에서 시작한다.
+        
+        Returns:
+            (사번 → 체크포인트 값, 새로 역산한 선수가 있으면 True)
+        """
+        stored = self.db.get_rating_checkpoint(RATING_SEED_DATE)
+        seed = dict(stored["states"]) if stored else {}
+        missing = {eid: p.score for eid, p in self.players.items() if eid not in seed}
+        if not missing:
+            return seed, False
+        seed.update(self._seed_states(missing, self._done_match_ids(missing)))
+        return seed, True
+    
+    def _done_match_ids(self, emp_ids, exclude=None):
+        """사번 → 참가한 확정 경기 id 집합 (exclude 경기 제외)"""
+        index = self.player_index
+        return {
+            eid: {m["id"] for _, m in index.get(eid, ()) if m.get("status") == "done" and m["id"] != exclude}
+            for eid in emp_ids
+        }
+    
+    def _seed_states(self, scores, done):
+        """점수(done 경기 변동이 반영된 값)에서 점수 원장 변동을 빼 재생 시작 점수 역산
+        
+        원장 기록이 없는 확정 경기가 있는 선수는 역산할 수 없어 초기 점수에서 시작한다.
+        
+        Returns:
+            {사번: 체크포인트 값 목록}
+        """
+        ledger = {}
+        for e in self.db.get_ledger_entries_for(sorted(set().union(*done.values()))):
+            ledger.setdefault(e["emp_id"], {})[e["match_id"]] = e["score_delta"]
+        states = {}
+        for eid, score in scores.items():
+            entries = ledger.get(eid, {})
+            if done[eid] <= entries.keys():
+                start = score - sum(entries[mid] for mid in done[eid])
+            else:
+                start = rating_engine.INITIAL_SCORE
+            states[eid] = [start, 0, 0, 0, 0]
+        return states
+    
+    def _seeded_players(self):
+        """재생 시작 점수 행에 저장된 사번 집합"""
+        seeded = self._seeded
+        if seeded is None:
+            stored = self.db.get_rating_checkpoint(RATING_SEED_DATE)
+            seeded = self._seeded = set(stored["states"]) if stored else set()
+        return seeded
+    
+    def _finalize_seed(self, match, players_dict, ledger):
+        """확정 트랜잭션에 함께 기록할 재생 시작 점수 (시작 점수가 아직 저장되지 않은 참가 선수만, 없으면 None)
+        
+        처음 확정될 때 고정해 두므로 이후 관리자의 점수 직접 수정은 과거 날짜 기준 점수에 섞이지 않는다.
+        """
+        seeded = self._seeded_players()
+        delta = {e["emp_id"]: e["score_delta"] for e in ledger}
+        scores = {eid: p.score - delta.get(eid, 0) for eid, p in players_dict.items() if eid not in seeded}
+        if not scores:
+            return None
+        return {"date": RATING_SEED_DATE, "states": self._seed_states(scores, self._done_match_ids(scores, match["id"]))}
+    
+    @staticmethod
+    def _ledger_by_match(entries):
+        """재생 원장 튜플 → 경기 id별 원장 항목 목록"""
+        grouped = {}
+        for mid, eid, delta, won, streak_before, boost_used in entries:
+            grouped.setdefault(mid, []).append({
+                "match_id": mid,
+                "emp_id": eid,
+                "score_delta": delta,
+                "is_win": won,
+                "streak_before": streak_before,
+                "boost_used": boost_used,
+            })
+        return grouped
+    
+    def _publish_rerate(self, match, plan, date_of):
+        """부분 재생 기록 결과를 캐시에 반영 (기록한 선수는 DB 트리거가 버전을 1 올림)"""
+        self._patch_players([{**row, "version": row["version"] + 1} for row in plan["player_rows"]])
+        updates = {m["id"]: {"change1": m["change1"], "change2": m["change2"]} for m in plan["match_changes"]}
+        updates[match["id"]] = plan["match_fields"]
+        for d in sorted({date_of[mid] for mid in updates}):
+            self._publish_date(
+                d, lambda old: [{**m, **updates[m["id"]]} if m["id"] in updates else m for m in old]
+            )
+    
+    # ========== 날짜 기준 랭킹 (레이팅 체크포인트) ==========
+    def rating_states_at(self, date):
+        """date 경기까지 반영된 선수 레이팅 {사번: rating_engine.PlayerState}
+        
+        저장된 가장 가까운 체크포인트를 그대로 쓰고 그 뒤 저장되지 않은 날짜만 메모리에서 재생한다.
+        조회 경로는 DB에 기록하지 않는다 (체크포인트는 경기 수정과 같은 트랜잭션에서만 기록 · 삭제).
+        결과는 데이터 버전이 바뀔 때까지 날짜별로 메모리에 캐시한다.
+        """
+        version = self.data_version
+        cached_version, by_date = self._rating_states
+        if cached_version != version:
+            by_date = {}
+            self._rating_states = (version, by_date)
+        if date in by_date:
+            return by_date[date]
+        
+        history = self.history
+        first_play = {eid: entries[0][0] for eid, entries in self.player_index.items() if entries}
+        states, _, _ = self._rating_base(date, history, first_play, inclusive=True)
+        by_date[date] = states
+        return states
+    
+    def ranking_at(self, date):
+        """date 시점 랭킹 (점수 내림차순, 동점은 사번 순)
+        
+        현재 등록된 선수 전원을 포함한다 (그날 이후 가입한 선수는 재생 시작 점수로).
+        
+        Returns:
+            [{"rank", "emp_id", "name", "score", "tier", "match_count", "win_count"}, ...]
+        """
+        players = self.players
+        states = self.rating_states_at(date)
+        ranked = sorted((s for eid, s in states.items() if eid in players), key=lambda s: (-s.score, s.emp_id))
+        return [
+            {
+                "rank": i + 1,
+                "emp_id": s.emp_id,
+                "name": players[s.emp_id].name,
+                "score": s.score,
+                "tier": s.tier,
+                "match_count": s.match_count,
+                "win_count": s.win_count,
+            }
+            for i, s in enumerate(ranked)
+        ]
+    
+    def rank_changes_between(self, from_date, to_date):
+        """두 날짜 사이 랭킹 변동
+        
+        Returns:
+            {사번: {"rank", "prev_rank", "rank_ch", "score", "score_ch"}}
+            (from_date에 순위가 없던 선수는 prev_rank None, rank_ch 0)
+        """
+        before = {r["emp_id"]: r for r in self.ranking_at(from_date)}
+        changes = {}
+        for r in self.ranking_at(to_date):
+            prev = before.get(r["emp_id"])
+            changes[r["emp_id"]] = {
+                "rank": r["rank"],
+                "prev_rank": prev["rank"] if prev else None,
+                "rank_ch": prev["rank"] - r["rank"] if prev else 0,
+                "score": r["score"],
+                "score_ch": r["score"] - prev["score"] if prev else 0,
+            }
+        return changes
     
     # ========== 부스트 / 유틸 ==========
     def get_first_play_date(self, eid):
         """첫 경기 날짜"""
-        dates = sorted(self.history.keys())
-        for d in dates:
-            for m in self.history[d]:
-                if eid in m["team1"] or eid in m["team2"]:
-                    return d
-        return None
+        entries = self.player_index.get(eid)
+        return entries[0][0] if entries else None
     
     def get_boost_multiplier(self, eid):
-        """부스트 배수 계산"""
-        player_row = self.db.get_player(eid)
-        if not player_row:
+        """이번 달 경기의 부스트 배수 (캐시된 선수 상태와 부스트 자격 표 기준, DB 조회 없음)"""
+        p = self.players.get(eid)
+        if p is None:
             return 1.0
-        
-        p = Player.from_db_row(player_row)
-        first_play = self.get_first_play_date(eid)
-        
-        if first_play:
-            try:
-                s_date = datetime.strptime(first_play, "%Y-%m-%d")
-                s_year, s_month = s_date.year, s_date.month
-            except:
-                try:
-                    s_date = datetime.strptime(first_play, "%Y-%m")
-                    s_year, s_month = s_date.year, s_date.month
-                except:
-                    s_year, s_month = datetime.now().year, 1
-        else:
+        return self._boost_multiplier_for(p)
+    
+    def _boost_multiplier_for(self, p, date=None):
+        """부스트 배수 계산 (이미 조회한 선수 객체의 boost_games 기준)
+
+        date: 경기 날짜 (재생과 같이 그 달 기준으로 판정, None이면 이번 달)
+        """
+        ym = rating_engine.year_month(date) if date else None
+        if ym is None:
             now = datetime.now()
-            s_year, s_month = now.year, now.month
-        
-        if s_year == datetime.now().year:
-            catch_up = (s_month - 1) * 4
-            limit = (13 - s_month) * 4
-            cap = min(catch_up, limit)
-            if p.boost_games < cap:
-                return 1.25
-        return 1.0
+            ym = (now.year, now.month)
+        return self.boost_table.multiplier(p.emp_id, p.boost_games, ym)
     
     # ========== 출석 / XP ==========
+    @_write_op
     def check_attendance(self, eid, date_str):
         """출석 체크"""
-        player_row = self.db.get_player(eid)
-        if not player_row:
-            return
-        
+        self._update_player_checked(eid, ATTENDANCE_COLUMNS, lambda row: self._attendance_updates(row, date_str))
+    
+    @staticmethod
+    def _attendance_updates(player_row, date_str):
+        """출석 반영 값 계산 (이미 이번 달 출석했으면 None)"""
         p = Player.from_db_row(player_row)
         current_month = date_str[:7]
         
         if p.last_attendance == current_month:
-            return
+            return None
         
         gain = 100
         if p.last_attendance:
@@ -710,27 +1840,26 @@ class DataManager:
         
         p.xp += gain
         
-        # DB 업데이트
-        self.db.update_player(
-            eid,
-            xp=p.xp,
-            last_attendance=p.last_attendance,
-            attendance_count=p.attendance_count,
-            consecutive_months=p.consecutive_months
-        )
+        return {
+            "xp": p.xp,
+            "last_attendance": p.last_attendance,
+            "attendance_count": p.attendance_count,
+            "consecutive_months": p.consecutive_months,
+        }
     
+    @_write_op
     def add_attendance_xp(self, date, attendees):
         """출석 XP 지급"""
         for eid in attendees:
             self.check_attendance(eid, date)
-        self._invalidate_cache()
         return True, "XP 지급 완료"
     
+    @_write_op
     def recalculate_all_xp(self):
         """전체 XP 재계산"""
         try:
             # 모든 선수 XP 초기화
-            players = self.db.get_all_players()
+            players = self.db.get_all_players(columns=("emp_id",))
             for p in players:
                 self.db.update_player(
                     p["emp_id"],
@@ -755,73 +1884,73 @@ class DataManager:
         except Exception as e:
             return False, str(e)
     
+    # ========== 규칙 변경 시뮬레이션 ==========
+    def simulate_rules(self, rule_sets, max_workers=None):
+        """후보 규칙들로 전체 확정 경기를 다시 재생한 순위 · 티어 분포 (DB에는 기록하지 않음)
+        
+        재생 시작 점수는 레이팅 체크포인트의 시작 점수를 쓰고, 순위 항목마다
+        이름과 현재 순위 대비 변동(rank_ch)을 붙인다.
+        
+        Args:
+            rule_sets: [{"name", "score_rules", "tier_rules"}, ...]
+        """
+        players = self.players
+        seed, _ = self._rating_seed()
+        first_play = {eid: entries[0][0] for eid, entries in self.player_index.items() if entries}
+        results = rule_simulator.simulate(
+            rating_engine.matches_from_history(self.history),
+            rule_sets,
+            {eid: values for eid, values in seed.items() if eid in players},
+            with_boost=True,
+            first_play=first_play,
+            max_workers=max_workers or config.RULE_SIMULATOR_WORKERS,
+        )
+        current = sorted(players.values(), key=lambda p: (-p.score, p.emp_id))
+        current_rank = {p.emp_id: i + 1 for i, p in enumerate(current)}
+        for result in results:
+            for r in result["ranking"]:
+                r["name"] = players[r["emp_id"]].name
+                r["rank_ch"] = current_rank[r["emp_id"]] - r["rank"]
+        return results
+    
     # ========== 통계 ==========
     def get_rank_changes(self):
-        """랭킹 변동 계산"""
-        players_dict = self.players
-        current_rank = {}
-        sorted_curr = sorted(players_dict.items(), key=lambda x: x[1].score, reverse=True)
-        for i, (eid, _) in enumerate(sorted_curr):
-            current_rank[eid] = i + 1
-        
-        prev_scores = {eid: p.score for eid, p in players_dict.items()}
-        
-        # 가장 최근 날짜의 경기 역산
-        if self.history:
-            latest_date = sorted(self.history.keys())[-1]
-            for m in self.history[latest_date]:
-                if m["status"] == "done":
-                    c1 = m.get("change1", 0)
-                    c2 = m.get("change2", 0)
-                    for pid in m["team1"]:
-                        if pid in prev_scores:
-                            prev_scores[pid] -= c1
-                    for pid in m["team2"]:
-                        if pid in prev_scores:
-                            prev_scores[pid] -= c2
-        
-        sorted_prev = sorted(prev_scores.items(), key=lambda x: x[1], reverse=True)
-        prev_rank = {eid: i + 1 for i, (eid, _) in enumerate(sorted_prev)}
-        
-        changes = {}
-        for eid in players_dict:
-            if eid in current_rank and eid in prev_rank:
-                changes[eid] = {"rank_ch": prev_rank[eid] - current_rank[eid]}
-        return changes
+        """최근 대회 랭킹 변동 (확정 경기가 있는 마지막 날짜 vs 그 이전 날짜 체크포인트)"""
+        history = self.history
+        dates = sorted(d for d, matches in history.items() if any(m.get("status") == "done" for m in matches))
+        if not dates:
+            return {}
+        prev = dates[-2] if len(dates) > 1 else RATING_SEED_DATE
+        return self.rank_changes_between(prev, dates[-1])
     
     def get_player_stats(self, eid):
         """선수 통계"""
         partners, rivals = {}, {}
         players_dict = self.players
         
-        for d in self.history:
-            for m in self.history[d]:
-                if m["status"] != "done":
-                    continue
-                if eid in m["team1"]:
-                    t_my, t_op = m["team1"], m["team2"]
-                    win = m["score1"] > m["score2"]
-                elif eid in m["team2"]:
-                    t_my, t_op = m["team2"], m["team1"]
-                    win = m["score2"] > m["score1"]
-                else:
+        for _, m in self.get_player_matches(eid, status="done"):
+            if eid in m["team1"]:
+                t_my, t_op = m["team1"], m["team2"]
+                win = m["score1"] > m["score2"]
+            else:
+                t_my, t_op = m["team2"], m["team1"]
+                win = m["score2"] > m["score1"]
+            
+            for p in t_my:
+                if p == eid:
                     continue
-                
-                for p in t_my:
-                    if p == eid:
-                        continue
-                    if p not in partners:
-                        partners[p] = {"g": 0, "w": 0}
-                    partners[p]["g"] += 1
-                    if win:
-                        partners[p]["w"] += 1
-                
-                if not win:
-                    for p in t_op:
-                        if p not in rivals:
-                            rivals[p] = {"g": 0, "w": 0}
-                        rivals[p]["g"] += 1
-                        rivals[p]["w"] += 1
+                if p not in partners:
+                    partners[p] = {"g": 0, "w": 0}
+                partners[p]["g"] += 1
+                if win:
+                    partners[p]["w"] += 1
+            
+            if not win:
+                for p in t_op:
+                    if p not in rivals:
+                        rivals[p] = {"g": 0, "w": 0}
+                    rivals[p]["g"] += 1
+                    rivals[p]["w"] += 1
         
         bp, bpr = "-", ""
         if partners:
@@ -844,36 +1973,34 @@ class DataManager:
         match_log = []
         players_dict = self.players
         
-        for d in sorted(self.history.keys(), reverse=True):
-            for m in self.history[d]:
-                if m["status"] != "done":
-                    continue
-                if eid in m["team1"] or eid in m["team2"]:
-                    is_t1 = eid in m["team1"]
-                    is_win = (is_t1 and m["score1"] > m["score2"]) or (not is_t1 and m["score2"] > m["score1"])
-                    my_team = m["team1"] if is_t1 else m["team2"]
-                    op_team = m["team2"] if is_t1 else m["team1"]
-                    
-                    try:
-                        my_names = ", ".join([players_dict[pid].name for pid in my_team if pid in players_dict])
-                        op_names = ", ".join([players_dict[pid].name for pid in op_team if pid in players_dict])
-                    except:
-                        continue
-                    
-                    my_score = m["score1"] if is_t1 else m["score2"]
-                    op_score = m["score2"] if is_t1 else m["score1"]
-                    change = m.get("change1", 0) if is_t1 else m.get("change2", 0)
-                    
-                    match_log.append({
-                        "date": d,
-                        "my_team": my_names,
-                        "op_team": op_names,
-                        "my_score": my_score,
-                        "op_score": op_score,
-                        "result": "승리" if is_win else "패배",
-                        "change": change,
-                        "group": m.get("group", "-"),
-                    })
+        # 날짜 역순 (같은 날짜 안에서는 경기 순서 유지)
+        entries = sorted(self.get_player_matches(eid, status="done"), key=lambda x: x[0], reverse=True)
+        for d, m in entries:
+            is_t1 = eid in m["team1"]
+            is_win = (is_t1 and m["score1"] > m["score2"]) or (not is_t1 and m["score2"] > m["score1"])
+            my_team = m["team1"] if is_t1 else m["team2"]
+            op_team = m["team2"] if is_t1 else m["team1"]
+            
+            try:
+                my_names = ", ".join([players_dict[pid].name for pid in my_team if pid in players_dict])
+                op_names = ", ".join([players_dict[pid].name for pid in op_team if pid in players_dict])
+            except:
+                continue
+            
+            my_score = m["score1"] if is_t1 else m["score2"]
+            op_score = m["score2"] if is_t1 else m["score1"]
+            change = m.get("change1", 0) if is_t1 else m.get("change2", 0)
+            
+            match_log.append({
+                "date": d,
+                "my_team": my_names,
+                "op_team": op_names,
+                "my_score": my_score,
+                "op_score": op_score,
+                "result": "승리" if is_win else "패배",
+                "change": change,
+                "group": m.get("group", "-"),
+            })
         return match_log
     
     def get_daily_summary(self, date):
@@ -914,6 +2041,7 @@ class DataManager:
         return stats
     
     # ========== 대진표 생성 ==========
+    @_write_op
     def generate_tournament(self, date, attendees, mode="밸런스"):
         """대진표 생성"""
         if len(attendees) < 4:
@@ -942,17 +2070,28 @@ class DataManager:
             else:
                 matches = self._get_random_matches(mems, target)
             
+            entries = []
             for m in matches:
-                self.db.add_match(
+                match_id = self.db.add_match(
                     date=date,
                     team1=m[0],
                     team2=m[1],
                     group_name=chr(65 + i)
                 )
-        
-        self._invalidate_cache()
+                if match_id:
+                    entries.append(self._new_match_entry(match_id, m[0], m[1], chr(65 + i)))
+            self._add_matches(date, entries)
         return True, f"[{date}] 대진표 생성 완료! ({len(attendees)}명, {len(groups)}조)"
-    
+
+    @_write_op
+    def add_match(self, date, team1, team2, group_name=None):
+        """경기 1건 수동 추가 (대진표 외 번외 경기)"""
+        match_id = self.db.add_match(date=date, team1=team1, team2=team2, group_name=group_name)
+        if not match_id:
+            return False
+        self._add_matches(date, [self._new_match_entry(match_id, team1, team2, group_name)])
+        return True
+
     def _split_groups(self, total):
         """조 분할 알고리즘"""
         best, min_fours = None, total
@@ -1,18 +1,209 @@
+import asyncio
 import os
-from typing import Optional, List, Dict, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Callable, Sequence, TypedDict
+
+import config
+
+
+# ========== 행 타입 / 컬럼 ==========
+class PlayerRow(TypedDict, total=False):
+    """players 행 (columns 지정 시 요청한 컬럼만 포함)"""
+    emp_id: str
+    name: str
+    score: int
+    xp: int
+    tier: str
+    is_active: bool
+    join_date: Optional[str]
+    match_count: int
+    win_count: int
+    streak: int
+    boost_games: int
+    last_attendance: Optional[str]
+    attendance_count: int
+    consecutive_months: int
+    total_played: int
+    role: str
+    pin_hash: Optional[str]
+    version: int  # 행 버전 (갱신마다 DB 트리거가 1 증가, 낙관적 동시성 제어용)
+
+
+class MatchRow(TypedDict, total=False):
+    """matches 행 (columns 지정 시 요청한 컬럼만 포함)"""
+    id: int
+    date: str
+    group_name: Optional[str]
+    team1_player1: Optional[str]
+    team1_player2: Optional[str]
+    team2_player1: Optional[str]
+    team2_player2: Optional[str]
+    score1: int
+    score2: int
+    change1: int
+    change2: int
+    status: str
+    input_by: Optional[str]
+    input_timestamp: Optional[str]
+    approved_by: Optional[str]
+    approved_timestamp: Optional[str]
+    dispute_reason: Optional[str]
+
+
+class LedgerRow(TypedDict):
+    """score_ledger 행 (기록 시각 created_at은 읽지 않음)"""
+    match_id: int
+    emp_id: str
+    score_delta: int
+    is_win: bool
+    streak_before: int
+    boost_used: bool
+
+
+class StartupConfig(TypedDict):
+    """DataManager 시작 시 한 번에 읽는 설정 (get_startup_config)"""
+    score_rules: Dict[str, int]
+    tier_rules: Dict[str, int]
+    super_admin: Optional[str]  # settings.super_admin (JSON 문자열)
+    data_version: int
+    has_players: bool
+
+
+class RatingCheckpoint(TypedDict):
+    """rating_checkpoints 행: 해당 날짜 경기까지 반영된 전체 선수 레이팅"""
+    date: str
+    states: Dict[str, List[int]]  # 사번 → rating_engine.CHECKPOINT_FIELDS 순 값
+
+
+PLAYER_COLUMNS = tuple(PlayerRow.__annotations__)
+MATCH_COLUMNS = tuple(MatchRow.__annotations__)
+LEDGER_COLUMNS = tuple(LedgerRow.__annotations__)
+
+Columns = Optional[Sequence[str]]  # None이면 전체 컬럼
+
+
+def projection(columns: Columns, allowed: Sequence[str]) -> str:
+    """select 컬럼 목록 문자열 ("*" 또는 "a, b")"""
+    if not columns:
+        return '*'
+    unknown = set(columns) - set(allowed)
+    if unknown:
+        raise ValueError(f"알 수 없는 컬럼 {sorted(unknown)}")
+    return ', '.join(columns)
+
+
+# ========== 공용 Supabase 클라이언트 ==========
+_client_lock = threading.Lock()
+_shared_client = None
+_pool_stats_lock = threading.Lock()
+_pool_stats = {"requests": 0, "new_connections": 0, "tls_handshakes": 0}
+
+
+def _trace_connection(event_name, info):
+    """httpcore trace 콜백: 새 TCP 연결/TLS 핸드셰이크 횟수 집계"""
+    if event_name == "connection.connect_tcp.complete":
+        key = "new_connections"
+    elif event_name == "connection.start_tls.complete":
+        key = "tls_handshakes"
+    else:
+        return
+    with _pool_stats_lock:
+        _pool_stats[key] += 1
+
+
+def _on_request(request):
+    with _pool_stats_lock:
+        _pool_stats["requests"] += 1
+    request.extensions["trace"] = _trace_connection
+
+
+def http_pool_stats() -> Dict[str, int]:
+    """공용 HTTP 연결 풀 통계 (요청 수 · 새 연결 수 · 재사용 요청 수)"""
+    with _pool_stats_lock:
+        stats = dict(_pool_stats)
+    stats["reused_connections"] = stats["requests"] - stats["new_connections"]
+    return stats
 
 
 def _get_supabase_client():
-    """Supabase 클라이언트 생성 (Streamlit secrets 또는 환경변수 사용)"""
-    from supabase import create_client
+    """Supabase 클라이언트 (프로세스 공용, Streamlit secrets 또는 환경변수 사용)
+
+    모든 Database 인스턴스가 keep-alive 연결 풀을 가진 하나의 클라이언트를 공유하므로
+    새 세션의 첫 조회도 이미 열린 TLS 연결을 재사용한다.
+    """
+    global _shared_client
+    with _client_lock:
+        if _shared_client is None:
+            _shared_client = _create_supabase_client()
+        return _shared_client
+
+
+def _supabase_credentials():
+    """Supabase URL/키 (Streamlit secrets 우선, 없으면 환경변수)"""
     try:
         import streamlit as st
-        url = st.secrets["SUPABASE_URL"]
-        key = st.secrets["SUPABASE_KEY"]
+        return st.secrets["SUPABASE_URL"], st.secrets["SUPABASE_KEY"]
     except Exception:
-        url = os.environ.get("SUPABASE_URL", "")
-        key = os.environ.get("SUPABASE_KEY", "")
-    return create_client(url, key)
+        return os.environ.get("SUPABASE_URL", ""), os.environ.get("SUPABASE_KEY", "")
+
+
+def _http_limits():
+    import httpx
+    return httpx.Limits(
+        max_connections=config.DB_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=config.DB_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=config.DB_HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def _create_supabase_client():
+    """연결 풀 설정을 적용한 httpx 클라이언트를 주입한 Supabase 클라이언트
+
+    httpx_client 옵션이 없는 초기 supabase 2.x에서는 라이브러리 기본 HTTP 클라이언트로 만든다
+    (연결 풀 설정 · 요청 집계(http_pool_stats)만 빠지고 동작은 같다).
+    """
+    import httpx
+    from supabase import create_client
+    url, key = _supabase_credentials()
+
+    try:
+        from supabase.lib.client_options import SyncClientOptions
+    except ImportError:
+        return create_client(url, key)
+
+    http_client = httpx.Client(
+        limits=_http_limits(),
+        timeout=config.DB_HTTP_TIMEOUT,
+        event_hooks={"request": [_on_request]},
+    )
+    try:
+        options = SyncClientOptions(httpx_client=http_client)
+    except TypeError:
+        http_client.close()
+        return create_client(url, key)
+    return create_client(url, key, options=options)
+
+
+def open_database(db_file=None, backend=None):
+    """설정(config.DB_BACKEND)에 맞는 저장소 생성 ("supabase" | "sqlite")"""
+    backend = backend or config.DB_BACKEND
+    if backend == "sqlite":
+        from database_sqlite import SQLiteDatabase
+        return SQLiteDatabase(db_file)
+    return Database(db_file)
+
+
+def open_async_database(db_file=None, backend=None):
+    """open_database()의 비동기 버전 (API 서버용)
+
+    supabase: httpx.AsyncClient로 PostgREST 직접 호출 / sqlite: 동기 구현을 스레드로 위임
+    """
+    backend = backend or config.DB_BACKEND
+    if backend == "sqlite":
+        return ThreadedAsyncDatabase(open_database(db_file, backend))
+    return AsyncDatabase()
 
 
 class Database:
@@ -21,6 +212,66 @@ class Database:
     def __init__(self, db_file=None):
         self.db_file = db_file or "supabase"  # 호환성 유지 (backup 체크용)
         self.client = _get_supabase_client()
+        self.round_trips = 0  # Supabase 왕복 요청 누적 횟수
+        self.first_query_ms = None  # 인스턴스 생성 후 첫 조회 소요 시간
+        self._stats_lock = threading.Lock()
+
+    def _execute(self, query):
+        """쿼리 실행 (왕복 횟수 · 첫 조회 지연 집계)"""
+        with self._stats_lock:
+            self.round_trips += 1
+            first = self.first_query_ms is None and self.round_trips == 1
+        if not first:
+            return query.execute()
+        started = time.perf_counter()
+        try:
+            return query.execute()
+        finally:
+            self.first_query_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    def _fetch_all(self, build_query: Callable[[bool], Any],
+                   page_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """전체 조회: range 페이지를 스레드 풀에서 병렬 요청한 뒤 순서대로 이어붙임
+
+        build_query(with_count)는 select/order(고유 정렬 키 포함)가 적용된 새 쿼리를 반환해야 한다.
+        첫 페이지에서 전체 건수(count=exact)를 받아 나머지 페이지 범위를 정한다.
+        PostgREST 응답 상한(max-rows)이 page_size보다 작아도 누락 없도록
+        첫 페이지에서 실제로 받은 행 수만큼씩 진행하고, 서버가 알려준 전체 건수까지 읽는다.
+        """
+        page_size = page_size or config.DB_PAGE_SIZE
+        first = self._execute(build_query(True).range(0, page_size - 1))
+        rows = list(first.data or [])
+        total = first.count
+        step = len(rows)  # 서버가 실제로 돌려주는 페이지 크기
+        if not step:
+            return rows
+
+        def fetch_page(start):
+            query = build_query(False).range(start, start + step - 1)
+            return self._execute(query).data or []
+
+        if total is None:
+            # 건수를 받지 못하면 덜 찬 페이지가 나올 때까지 받은 행 수만큼 순차 조회
+            page = rows
+            while len(page) == step:
+                page = fetch_page(len(rows))
+                rows.extend(page)
+            return rows
+
+        starts = list(range(step, total, step))
+        if starts:
+            workers = max(1, min(config.DB_FETCH_WORKERS, len(starts)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for start, page in zip(starts, pool.map(fetch_page, starts)):
+                    if len(rows) != start:
+                        break  # 앞 페이지가 덜 찼으면 이후 페이지는 버리고 아래에서 이어서 조회
+                    rows.extend(page)
+        while len(rows) < total:
+            page = fetch_page(len(rows))
+            if not page:
+                break
+            rows.extend(page)
+        return rows
 
     # ========== 선수 관리 ==========
     def add_player(self, emp_id: str, name: str, score: int = 1000,
@@ -28,7 +279,7 @@ class Database:
                    join_date: Optional[str] = None, role: str = 'player') -> bool:
         """선수 추가"""
         try:
-            self.client.table('players').insert({
+            self._execute(self.client.table('players').insert({
                 'emp_id': emp_id,
                 'name': name,
                 'score': score,
@@ -36,30 +287,64 @@ class Database:
                 'is_active': is_active,
                 'join_date': join_date,
                 'role': role,
-            }).execute()
+            }))
             return True
         except Exception:
             return False
 
-    def get_player(self, emp_id: str) -> Optional[Dict[str, Any]]:
-        """선수 조회"""
-        result = self.client.table('players').select('*').eq('emp_id', emp_id).execute()
+    def get_player(self, emp_id: str, columns: Columns = None) -> Optional[PlayerRow]:
+        """선수 조회 (columns: 필요한 컬럼만 요청)"""
+        select = projection(columns, PLAYER_COLUMNS)
+        result = self._execute(self.client.table('players').select(select).eq('emp_id', emp_id))
         return result.data[0] if result.data else None
 
-    def get_all_players(self, active_only: bool = False) -> List[Dict[str, Any]]:
-        """전체 선수 조회"""
-        query = self.client.table('players').select('*')
-        if active_only:
-            query = query.eq('is_active', True)
-        result = query.order('score', desc=True).execute()
+    def get_players(self, emp_ids: List[str], columns: Columns = None) -> List[PlayerRow]:
+        """여러 선수 일괄 조회 (in 필터, 1회 요청)"""
+        if not emp_ids:
+            return []
+        select = projection(columns, PLAYER_COLUMNS)
+        result = self._execute(self.client.table('players').select(select).in_('emp_id', list(emp_ids)))
         return result.data or []
 
-    def update_player(self, emp_id: str, **kwargs) -> bool:
-        """선수 정보 수정"""
+    def get_all_players(self, active_only: bool = False, columns: Columns = None) -> List[PlayerRow]:
+        """전체 선수 조회"""
+        select = projection(columns, PLAYER_COLUMNS)
+
+        def build(with_count):
+            query = self.client.table('players').select(select, count='exact' if with_count else None)
+            if active_only:
+                query = query.eq('is_active', True)
+            return query.order('score', desc=True).order('emp_id')
+        return self._fetch_all(build)
+
+    def has_players(self) -> bool:
+        """선수가 한 명이라도 있는지 (limit 1 조회)"""
+        result = self._execute(self.client.table('players').select('emp_id').limit(1))
+        return bool(result.data)
+
+    def update_player(self, emp_id: str, expected_version: Optional[int] = None, **kwargs) -> bool:
+        """선수 정보 수정
+
+        expected_version이 주어지면 현재 행 버전이 일치할 때만 반영한다 (compare-and-swap).
+        다른 쓰기가 먼저 반영되어 버전이 달라졌으면 False.
+        """
         if not kwargs:
             return False
         try:
-            self.client.table('players').update(kwargs).eq('emp_id', emp_id).execute()
+            query = self.client.table('players').update(kwargs).eq('emp_id', emp_id)
+            if expected_version is not None:
+                query = query.eq('version', expected_version)
+            result = self._execute(query)
+            return expected_version is None or bool(result.data)
+        except Exception:
+            return False
+
+    def upsert_players(self, rows: List[Dict[str, Any]]) -> bool:
+        """선수 여러 명 일괄 저장 (emp_id 기준 upsert, 1회 요청)"""
+        if not rows:
+            return True
+        try:
+            self._execute(self.client.table('players').upsert(rows, on_conflict='emp_id'))
             return True
         except Exception:
             return False
@@ -67,7 +352,7 @@ class Database:
     def delete_player(self, emp_id: str) -> bool:
         """선수 삭제"""
         try:
-            self.client.table('players').delete().eq('emp_id', emp_id).execute()
+            self._execute(self.client.table('players').delete().eq('emp_id', emp_id))
             return True
         except Exception:
             return False
@@ -82,7 +367,7 @@ class Database:
         t2_p2 = team2[1] if len(team2) > 1 else None
 
         try:
-            result = self.client.table('matches').insert({
+            result = self._execute(self.client.table('matches').insert({
                 'date': date,
                 'group_name': group_name,
                 'team1_player1': t1_p1,
@@ -90,20 +375,44 @@ class Database:
                 'team2_player1': t2_p1,
                 'team2_player2': t2_p2,
                 'status': 'pending',
-            }).execute()
+            }))
             return result.data[0]['id'] if result.data else None
         except Exception:
             return None
 
-    def get_matches_by_date(self, date: str) -> List[Dict[str, Any]]:
+    def get_matches_by_date(self, date: str, columns: Columns = None) -> List[MatchRow]:
         """날짜별 경기 조회"""
-        result = self.client.table('matches').select('*').eq('date', date).order('id').execute()
-        return result.data or []
+        select = projection(columns, MATCH_COLUMNS)
+        return self._fetch_all(
+            lambda with_count: self.client.table('matches')
+            .select(select, count='exact' if with_count else None)
+            .eq('date', date).order('id')
+        )
+
+    def get_match(self, match_id: int, columns: Columns = None) -> Optional[MatchRow]:
+        """경기 단건 조회"""
+        select = projection(columns, MATCH_COLUMNS)
+        result = self._execute(self.client.table('matches').select(select).eq('id', match_id))
+        return result.data[0] if result.data else None
+
+    def get_all_matches(self, page_size: Optional[int] = None, columns: Columns = None) -> List[MatchRow]:
+        """전체 경기 일괄 조회 ((date, id) 순, range 페이지 병렬 조회)"""
+        select = projection(columns, MATCH_COLUMNS)
+        return self._fetch_all(
+            lambda with_count: self.client.table('matches')
+            .select(select, count='exact' if with_count else None)
+            .order('date').order('id'),
+            page_size,
+        )
 
     def get_all_match_dates(self) -> List[str]:
         """모든 경기 날짜 조회"""
-        result = self.client.table('matches').select('date').execute()
-        dates = list(set(row['date'] for row in (result.data or [])))
+        rows = self._fetch_all(
+            lambda with_count: self.client.table('matches')
+            .select('date', count='exact' if with_count else None)
+            .order('date').order('id')
+        )
+        dates = list(set(row['date'] for row in rows))
         return sorted(dates, reverse=True)
 
     def update_match(self, match_id: int, **kwargs) -> bool:
@@ -111,7 +420,7 @@ class Database:
         if not kwargs:
             return False
         try:
-            self.client.table('matches').update(kwargs).eq('id', match_id).execute()
+            self._execute(self.client.table('matches').update(kwargs).eq('id', match_id))
             return True
         except Exception:
             return False
@@ -119,53 +428,381 @@ class Database:
     def delete_match(self, match_id: int) -> bool:
         """경기 삭제"""
         try:
-            self.client.table('matches').delete().eq('id', match_id).execute()
+            self._execute(self.client.table('matches').delete().eq('id', match_id))
             return True
         except Exception:
             return False
 
+    # ========== 점수 원장 ==========
+    def get_ledger_entries(self, match_id: int) -> List[LedgerRow]:
+        """경기별 점수 변동 기록 조회"""
+        select = projection(LEDGER_COLUMNS, LEDGER_COLUMNS)
+        result = self._execute(self.client.table('score_ledger').select(select).eq('match_id', match_id))
+        return result.data or []
+
+    def get_ledger_entries_for(self, match_ids: List[int]) -> List[LedgerRow]:
+        """여러 경기의 점수 변동 기록 일괄 조회 (in 필터, 200경기씩)"""
+        match_ids = list(match_ids)
+        select = projection(LEDGER_COLUMNS, LEDGER_COLUMNS)
+        entries = []
+        for i in range(0, len(match_ids), 200):
+            result = self._execute(
+                self.client.table('score_ledger').select(select).in_('match_id', match_ids[i:i + 200])
+            )
+            entries.extend(result.data or [])
+        return entries
+
+    # ========== 경기 확정 (트랜잭션) ==========
+    def finalize_match(self, match_id: int, match_fields: Dict[str, Any],
+                       player_rows: List[Dict[str, Any]], ledger_entries: List[Dict[str, Any]],
+                       expected_status: Optional[str] = None,
+                       seed: Optional[RatingCheckpoint] = None) -> bool:
+        """경기 상태 · 선수 점수 · 점수 원장을 단일 트랜잭션으로 기록 (Postgres 함수 RPC)
+
+        expected_status가 주어지면 현재 경기 상태가 일치할 때만 반영한다.
+        player_rows에 version이 있으면 선수 행 버전이 모두 일치할 때만 반영한다.
+        seed({"date", "states"})가 주어지면 재생 시작 점수 행에 아직 없는 선수만 추가한다.
+        """
+        try:
+            result = self._execute(self.client.rpc('finalize_match', {
+                'p_match_id': match_id,
+                'p_match': match_fields,
+                'p_players': player_rows,
+                'p_ledger': ledger_entries,
+                'p_expected_status': expected_status,
+                'p_seed': seed,
+            }))
+            return bool(result.data)
+        except Exception:
+            return False
+
+    # ========== 레이팅 체크포인트 ==========
+    def get_rating_checkpoint(self, date: str, before: bool = False) -> Optional[RatingCheckpoint]:
+        """date 이전(before=False면 date 포함) 가장 가까운 날짜의 레이팅 체크포인트"""
+        query = self.client.table('rating_checkpoints').select('date, states')
+        query = query.lt('date', date) if before else query.lte('date', date)
+        result = self._execute(query.order('date', desc=True).limit(1))
+        return result.data[0] if result.data else None
+
+    def rerate_match(self, match_id: int, match_fields: Dict[str, Any], expected_status: Optional[str],
+                     player_rows: List[Dict[str, Any]], player_versions: Dict[str, int],
+                     match_changes: List[Dict[str, Any]], ledger_entries: List[Dict[str, Any]],
+                     checkpoints: List[RatingCheckpoint], replace_from: str) -> bool:
+        """과거 경기 수정과 이후 경기 부분 재생 결과를 단일 트랜잭션으로 기록 (Postgres 함수 RPC)
+
+        경기 상태가 expected_status이고 player_versions의 선수 행 버전이 모두 일치할 때만 반영한다.
+        """
+        try:
+            result = self._execute(self.client.rpc('rerate_match', {
+                'p_match_id': match_id,
+                'p_match': match_fields,
+                'p_expected_status': expected_status,
+                'p_players': player_rows,
+                'p_versions': player_versions,
+                'p_matches': match_changes,
+                'p_ledger': ledger_entries,
+                'p_checkpoints': checkpoints,
+                'p_replace_from': replace_from,
+            }))
+            return bool(result.data)
+        except Exception:
+            return False
+
+    # ========== 전체 재계산 (트랜잭션) ==========
+    def apply_replay(self, player_rows: List[Dict[str, Any]], match_changes: List[Dict[str, Any]],
+                     ledger_entries: List[Dict[str, Any]]) -> Optional[int]:
+        """재계산한 선수 상태 · 경기 변동 · 점수 원장을 단일 트랜잭션으로 기록 (Postgres 함수 RPC)
+
+        점수 원장 전체를 교체하고 레이팅 체크포인트를 비운 뒤 데이터 버전을 올린다. 새 데이터 버전 반환 (실패 시 None).
+        """
+        try:
+            result = self._execute(self.client.rpc('apply_replay', {
+                'p_players': player_rows,
+                'p_matches': match_changes,
+                'p_ledger': ledger_entries,
+            }))
+            return int(result.data) if result.data is not None else None
+        except Exception:
+            return None
+
     # ========== 설정 관리 ==========
     def set_setting(self, key: str, value: str) -> bool:
         """설정 저장"""
         try:
-            self.client.table('settings').upsert({'key': key, 'value': value}).execute()
+            self._execute(self.client.table('settings').upsert({'key': key, 'value': value}))
             return True
         except Exception:
             return False
 
     def get_setting(self, key: str) -> Optional[str]:
         """설정 조회"""
-        result = self.client.table('settings').select('value').eq('key', key).execute()
+        result = self._execute(self.client.table('settings').select('value').eq('key', key))
         return result.data[0]['value'] if result.data else None
 
     def get_all_settings(self) -> Dict[str, str]:
         """전체 설정 조회"""
-        result = self.client.table('settings').select('*').execute()
-        return {row['key']: row['value'] for row in (result.data or [])}
+        rows = self._fetch_all(
+            lambda with_count: self.client.table('settings')
+            .select('key, value', count='exact' if with_count else None).order('key')
+        )
+        return {row['key']: row['value'] for row in rows}
+
+    # ========== 시작 설정 ==========
+    def get_startup_config(self) -> StartupConfig:
+        """규칙 · 슈퍼관리자 설정 · 데이터 버전 · 선수 유무를 1회 요청으로 조회 (Postgres 함수 RPC)
+
+        sql/startup_config.sql이 적용되지 않은 DB면 항목별 조회로 대체한다.
+        """
+        try:
+            data = self._execute(self.client.rpc('get_startup_config', {})).data
+        except Exception:
+            return {
+                'score_rules': self.get_score_rules(),
+                'tier_rules': self.get_tier_rules(),
+                'super_admin': self.get_setting('super_admin'),
+                'data_version': self.get_data_version(),
+                'has_players': self.has_players(),
+            }
+        return _startup_config_from_rpc(data)
+
+    # ========== 데이터 버전 ==========
+    def get_data_version(self) -> int:
+        """데이터 버전 조회 (없으면 0, settings 1행만 읽는 가벼운 조회)"""
+        value = self.get_setting('data_version')
+        return int(value) if value else 0
+
+    def bump_data_version(self) -> Optional[int]:
+        """데이터 버전을 원자적으로 1 증가시키고 새 값 반환 (Postgres 함수 RPC)"""
+        try:
+            result = self._execute(self.client.rpc('bump_data_version', {}))
+            return int(result.data) if result.data is not None else None
+        except Exception:
+            return None
 
     # ========== 규칙 관리 ==========
     def set_score_rule(self, key: str, value: int) -> bool:
         """점수 규칙 저장"""
         try:
-            self.client.table('score_rules').upsert({'key': key, 'value': value}).execute()
+            self._execute(self.client.table('score_rules').upsert({'key': key, 'value': value}))
             return True
         except Exception:
             return False
 
     def get_score_rules(self) -> Dict[str, int]:
         """점수 규칙 조회"""
-        result = self.client.table('score_rules').select('*').execute()
-        return {row['key']: row['value'] for row in (result.data or [])}
+        rows = self._fetch_all(
+            lambda with_count: self.client.table('score_rules')
+            .select('key, value', count='exact' if with_count else None).order('key')
+        )
+        return {row['key']: row['value'] for row in rows}
 
     def set_tier_rule(self, tier_name: str, threshold: int) -> bool:
         """티어 규칙 저장"""
         try:
-            self.client.table('tier_rules').upsert({'tier_name': tier_name, 'threshold': threshold}).execute()
+            self._execute(self.client.table('tier_rules').upsert({'tier_name': tier_name, 'threshold': threshold}))
             return True
         except Exception:
             return False
 
     def get_tier_rules(self) -> Dict[str, int]:
         """티어 규칙 조회"""
-        result = self.client.table('tier_rules').select('*').execute()
-        return {row['tier_name']: row['threshold'] for row in (result.data or [])}
+        rows = self._fetch_all(
+            lambda with_count: self.client.table('tier_rules')
+            .select('tier_name, threshold', count='exact' if with_count else None).order('tier_name')
+        )
+        return {row['tier_name']: row['threshold'] for row in rows}
+
+
+def _startup_config_from_rpc(data: Dict[str, Any]) -> StartupConfig:
+    return {
+        'score_rules': {k: int(v) for k, v in (data.get('score_rules') or {}).items()},
+        'tier_rules': {k: int(v) for k, v in (data.get('tier_rules') or {}).items()},
+        'super_admin': data.get('super_admin'),
+        'data_version': int(data.get('data_version') or 0),
+        'has_players': bool(data.get('has_players')),
+    }
+
+
+# ========== 비동기 (API 서버) ==========
+async def _on_async_request(request):
+    _on_request(request)
+
+
+class AsyncDatabase:
+    """Supabase 비동기 조회 (httpx.AsyncClient → PostgREST /rest/v1)
+
+    응답을 기다리는 동안 이벤트 루프가 다른 요청을 처리하므로 요청마다 워커 스레드를 잡지 않는다.
+    API 서버의 읽기 경로(시작 시 설정 · 캐시 적재 · 데이터 버전 확인 · 로그인)에 필요한 조회만 제공하고,
+    쓰기는 동기 Database(트랜잭션 RPC · 버전 확인 재시도)를 그대로 사용한다.
+    이벤트 루프마다 하나 만들고, 종료 시 aclose()로 연결을 닫는다.
+    """
+
+    def __init__(self, url: Optional[str] = None, key: Optional[str] = None, http_client=None):
+        import httpx
+        if url is None or key is None:
+            url, key = _supabase_credentials()
+        self.client = http_client or httpx.AsyncClient(
+            base_url=f"{url.rstrip('/')}/rest/v1",
+            headers={"apikey": key, "Authorization": f"Bearer {key}"},
+            limits=_http_limits(),
+            timeout=config.DB_HTTP_TIMEOUT,
+            event_hooks={"request": [_on_async_request]},
+        )
+        self.round_trips = 0
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _get(self, table: str, params: Dict[str, str], start: Optional[int] = None,
+                   end: Optional[int] = None, with_count: bool = False):
+        """GET 1회 → (행 목록, 전체 건수 또는 None)"""
+        headers = {}
+        if start is not None:
+            headers["Range-Unit"] = "items"
+            headers["Range"] = f"{start}-{end}"
+        if with_count:
+            headers["Prefer"] = "count=exact"
+        self.round_trips += 1
+        response = await self.client.get(f"/{table}", params=params, headers=headers)
+        response.raise_for_status()
+        total = response.headers.get("Content-Range", "").rpartition("/")[2]
+        return response.json(), int(total) if total.isdigit() else None
+
+    async def _fetch_all(self, table: str, params: Dict[str, str],
+                         page_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """전체 조회: 첫 페이지에서 건수를 받고 나머지 range 페이지를 asyncio.gather로 동시 요청
+
+        params의 order에는 고유 정렬 키가 포함되어야 한다 (Database._fetch_all과 같은 규칙).
+        응답 상한(max-rows)이 page_size보다 작으면 첫 페이지에서 받은 행 수만큼씩 진행한다.
+        """
+        page_size = page_size or config.DB_PAGE_SIZE
+        rows, total = await self._get(table, params, 0, page_size - 1, with_count=True)
+        step = len(rows)
+        if not step:
+            return rows
+
+        async def fetch_page(start):
+            page, _ = await self._get(table, params, start, start + step - 1)
+            return page
+
+        if total is None:
+            page = rows
+            while len(page) == step:
+                page = await fetch_page(len(rows))
+                rows.extend(page)
+            return rows
+
+        limit = asyncio.Semaphore(max(1, config.DB_FETCH_WORKERS))
+
+        async def fetch_limited(start):
+            async with limit:
+                return await fetch_page(start)
+
+        starts = list(range(step, total, step))
+        pages = await asyncio.gather(*(fetch_limited(s) for s in starts))
+        for start, page in zip(starts, pages):
+            if len(rows) != start:
+                break  # 앞 페이지가 덜 찼으면 이후 페이지는 버리고 아래에서 이어서 조회
+            rows.extend(page)
+        while len(rows) < total:
+            page = await fetch_page(len(rows))
+            if not page:
+                break
+            rows.extend(page)
+        return rows
+
+    async def _rpc(self, name: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        self.round_trips += 1
+        response = await self.client.post(f"/rpc/{name}", json=params or {})
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _select(columns: Columns, allowed: Sequence[str]) -> str:
+        return projection(columns, allowed).replace(' ', '')
+
+    async def get_player(self, emp_id: str, columns: Columns = None) -> Optional[PlayerRow]:
+        """선수 조회"""
+        rows, _ = await self._get('players', {
+            'select': self._select(columns, PLAYER_COLUMNS),
+            'emp_id': f'eq.{emp_id}',
+        })
+        return rows[0] if rows else None
+
+    async def get_all_players(self, active_only: bool = False, columns: Columns = None) -> List[PlayerRow]:
+        """전체 선수 조회"""
+        params = {'select': self._select(columns, PLAYER_COLUMNS), 'order': 'score.desc,emp_id.asc'}
+        if active_only:
+            params['is_active'] = 'eq.true'
+        return await self._fetch_all('players', params)
+
+    async def has_players(self) -> bool:
+        """선수가 한 명이라도 있는지 (limit 1 조회)"""
+        rows, _ = await self._get('players', {'select': 'emp_id', 'limit': '1'})
+        return bool(rows)
+
+    async def get_all_matches(self, page_size: Optional[int] = None, columns: Columns = None) -> List[MatchRow]:
+        """전체 경기 일괄 조회 ((date, id) 순)"""
+        params = {'select': self._select(columns, MATCH_COLUMNS), 'order': 'date.asc,id.asc'}
+        return await self._fetch_all('matches', params, page_size)
+
+    async def get_startup_config(self) -> StartupConfig:
+        """Database.get_startup_config()의 비동기 버전 (RPC가 없으면 항목별 조회를 asyncio.gather로 동시에)"""
+        try:
+            return _startup_config_from_rpc(await self._rpc('get_startup_config'))
+        except Exception:
+            score_rules, tier_rules, super_admin, data_version, has_players = await asyncio.gather(
+                self.get_score_rules(),
+                self.get_tier_rules(),
+                self.get_setting('super_admin'),
+                self.get_data_version(),
+                self.has_players(),
+            )
+            return {
+                'score_rules': score_rules,
+                'tier_rules': tier_rules,
+                'super_admin': super_admin,
+                'data_version': data_version,
+                'has_players': has_players,
+            }
+
+    async def get_setting(self, key: str) -> Optional[str]:
+        """설정 조회"""
+        rows, _ = await self._get('settings', {'select': 'value', 'key': f'eq.{key}'})
+        return rows[0]['value'] if rows else None
+
+    async def get_data_version(self) -> int:
+        """데이터 버전 조회 (없으면 0)"""
+        value = await self.get_setting('data_version')
+        return int(value) if value else 0
+
+    async def get_score_rules(self) -> Dict[str, int]:
+        """점수 규칙 조회"""
+        rows = await self._fetch_all('score_rules', {'select': 'key,value', 'order': 'key.asc'})
+        return {row['key']: row['value'] for row in rows}
+
+    async def get_tier_rules(self) -> Dict[str, int]:
+        """티어 규칙 조회"""
+        rows = await self._fetch_all('tier_rules', {'select': 'tier_name,threshold', 'order': 'tier_name.asc'})
+        return {row['tier_name']: row['threshold'] for row in rows}
+
+
+class ThreadedAsyncDatabase:
+    """동기 저장소를 AsyncDatabase와 같은 비동기 인터페이스로 감쌈 (SQLite: 로컬 파일이라 스레드로 위임)"""
+
+    def __init__(self, db):
+        self.db = db
+
+    @property
+    def round_trips(self) -> int:
+        return self.db.round_trips
+
+    async def aclose(self) -> None:
+        pass
+
+    def __getattr__(self, name):
+        method = getattr(self.db, name)
+
+        async def call(*args, **kwargs):
+            return await asyncio.to_thread(method, *args, **kwargs)
+        return call
@@ -0,0 +1,736 @@
+"""
+로컬 SQLite 저장소
+Supabase(supabase_setup.sql, sql/*.sql)와 같은 테이블 구성을 SQLite에 만들고,
+database.Database와 같은 인터페이스를 제공한다. (config.DB_BACKEND = "sqlite")
+Postgres 함수 finalize_match(sql/finalize_match.sql), rerate_match(sql/rerate_match.sql)와
+동일한 동작을 하나의 트랜잭션으로 제공한다.
+"""
+import json
+import sqlite3
+import threading
+from typing import Optional, List, Dict, Any
+
+import config
+from database import (
+    PLAYER_COLUMNS, MATCH_COLUMNS, LEDGER_COLUMNS, Columns, PlayerRow, MatchRow, LedgerRow, RatingCheckpoint, StartupConfig, projection,
+)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    emp_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER DEFAULT 1000,
+    xp INTEGER DEFAULT 0,
+    tier TEXT DEFAULT '브론즈',
+    is_active BOOLEAN DEFAULT 1,
+    join_date TEXT,
+    match_count INTEGER DEFAULT 0,
+    win_count INTEGER DEFAULT 0,
+    streak INTEGER DEFAULT 0,
+    boost_games INTEGER DEFAULT 0,
+    last_attendance TEXT,
+    attendance_count INTEGER DEFAULT 0,
+    consecutive_months INTEGER DEFAULT 0,
+    total_played INTEGER DEFAULT 0,
+    role TEXT DEFAULT 'player',
+    pin_hash TEXT,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    group_name TEXT,
+    team1_player1 TEXT,
+    team1_player2 TEXT,
+    team2_player1 TEXT,
+    team2_player2 TEXT,
+    score1 INTEGER DEFAULT 0,
+    score2 INTEGER DEFAULT 0,
+    change1 INTEGER DEFAULT 0,
+    change2 INTEGER DEFAULT 0,
+    status TEXT DEFAULT 'pending',
+    input_by TEXT,
+    input_timestamp TEXT,
+    approved_by TEXT,
+    approved_timestamp TEXT,
+    dispute_reason TEXT
+);
+
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS score_rules (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS tier_rules (
+    tier_name TEXT PRIMARY KEY,
+    threshold INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS score_ledger (
+    match_id INTEGER NOT NULL REFERENCES matches (id) ON DELETE CASCADE,
+    emp_id TEXT NOT NULL,
+    score_delta INTEGER NOT NULL,
+    is_win BOOLEAN NOT NULL,
+    streak_before INTEGER NOT NULL DEFAULT 0,
+    boost_used BOOLEAN NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (match_id, emp_id)
+);
+
+CREATE TABLE IF NOT EXISTS rating_checkpoints (
+    date TEXT PRIMARY KEY,
+    states TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_players_score ON players (score DESC);
+CREATE INDEX IF NOT EXISTS idx_matches_date_id ON matches (date, id);
+CREATE INDEX IF NOT EXISTS idx_matches_t1p1 ON matches (team1_player1);
+CREATE INDEX IF NOT EXISTS idx_matches_t1p2 ON matches (team1_player2);
+CREATE INDEX IF NOT EXISTS idx_matches_t2p1 ON matches (team2_player1);
+CREATE INDEX IF NOT EXISTS idx_matches_t2p2 ON matches (team2_player2);
+CREATE INDEX IF NOT EXISTS idx_score_ledger_emp_id ON score_ledger (emp_id);
+"""
+
+# 선수 행이 바뀔 때마다 버전 1 증가 (직접 version을 지정한 갱신은 그대로 둠)
+PLAYER_VERSION_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS trg_players_version
+AFTER UPDATE ON players
+FOR EACH ROW WHEN NEW.version = OLD.version
+BEGIN
+    UPDATE players SET version = OLD.version + 1 WHERE emp_id = NEW.emp_id;
+END;
+"""
+
+# finalize_match에서 갱신 가능한 경기 컬럼
+MATCH_FINAL_FIELDS = (
+    "score1", "score2", "change1", "change2", "status",
+    "input_by", "input_timestamp", "approved_by", "approved_timestamp",
+)
+
+
+def init_schema(conn: sqlite3.Connection) -> None:
+    """테이블 생성 (이미 있으면 유지, 예전 DB에는 빠진 컬럼 추가)"""
+    conn.executescript(SCHEMA)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(players)")}
+    if "version" not in columns:
+        conn.execute("ALTER TABLE players ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+    conn.executescript(PLAYER_VERSION_TRIGGER)
+
+
+def bump_data_version(conn: sqlite3.Connection) -> int:
+    """데이터 버전 1 증가 후 새 값 반환 (Postgres bump_data_version과 동일)
+
+    호출한 쪽 트랜잭션 안에서 실행되므로, 직접 SQL로 수정하는 스크립트는
+    commit 전에 호출하면 변경과 버전 갱신이 함께 반영된다.
+    """
+    row = conn.execute(
+        "INSERT INTO settings (key, value) VALUES ('data_version', '1') "
+        "ON CONFLICT (key) DO UPDATE SET value = CAST(value AS INTEGER) + 1 "
+        "RETURNING value"
+    ).fetchone()
+    return int(row[0])
+
+
+def read_data_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT value FROM settings WHERE key = 'data_version'").fetchone()
+    return int(row[0]) if row else 0
+
+
+def finalize_match(conn: sqlite3.Connection, match_id: int, match_fields: Dict[str, Any],
+                   player_rows: List[Dict[str, Any]], ledger_entries: List[Dict[str, Any]],
+                   expected_status: Optional[str] = None, seed: Optional[Dict[str, Any]] = None) -> bool:
+    """경기 상태 · 선수 점수 · 점수 원장을 단일 트랜잭션으로 기록 (Postgres finalize_match와 동일)
+
+    player_rows에 version이 있으면 현재 선수 행 버전이 모두 일치할 때만 반영하고, 아니면 False.
+    seed({"date", "states"})가 주어지면 재생 시작 점수 행에 아직 없는 선수만 추가한다.
+    """
+    unknown = set(match_fields) - set(MATCH_FINAL_FIELDS)
+    if unknown:
+        raise ValueError(f"finalize_match: 허용되지 않은 경기 컬럼 {sorted(unknown)}")
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute("SELECT status, date FROM matches WHERE id = ?", (match_id,)).fetchone()
+        if row is None or (expected_status is not None and row[0] != expected_status):
+            conn.rollback()
+            return False
+
+        if not _versions_match(conn, {r["emp_id"]: r["version"] for r in player_rows if r.get("version") is not None}):
+            conn.rollback()
+            return False
+
+        _update_player_scores(conn, player_rows)
+
+        conn.execute("DELETE FROM score_ledger WHERE match_id = ?", (match_id,))
+        _insert_ledger(conn, [{"match_id": match_id, **e} for e in ledger_entries])
+        _update_match_fields(conn, match_id, match_fields)
+
+        # 이 날짜부터의 레이팅 체크포인트는 더 이상 맞지 않음 (다음 부분 재생 때 다시 계산)
+        conn.execute("DELETE FROM rating_checkpoints WHERE date >= ?", (row[1],))
+        if seed:
+            conn.execute(
+                "INSERT INTO rating_checkpoints (date, states) VALUES (?, ?) "
+                "ON CONFLICT (date) DO UPDATE SET states = json_patch(excluded.states, rating_checkpoints.states)",
+                (seed["date"], json.dumps(seed["states"], separators=(",", ":"))),
+            )
+
+        conn.commit()
+        return True
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def rerate_match(conn: sqlite3.Connection, match_id: int, match_fields: Dict[str, Any],
+                 expected_status: Optional[str], player_rows: List[Dict[str, Any]],
+                 player_versions: Dict[str, int], match_changes: List[Dict[str, Any]],
+                 ledger_entries: List[Dict[str, Any]], checkpoints: List[Dict[str, Any]],
+                 replace_from: str) -> bool:
+    """과거 경기 수정 + 이후 경기 부분 재생 결과를 단일 트랜잭션으로 기록 (Postgres rerate_match와 동일)
+
+    경기 상태가 expected_status이고 player_versions의 선수 행 버전이 모두 일치할 때만 반영한다.
+    - 수정한 경기 필드, 상태가 바뀐 선수, change1/change2가 바뀐 경기 갱신
+    - ledger_entries에 등장한 경기와 수정한 경기의 점수 원장 교체
+    - replace_from 이후 체크포인트를 checkpoints로 교체 (그 이전 날짜 행은 덮어쓰기)
+    """
+    unknown = set(match_fields) - set(MATCH_FINAL_FIELDS)
+    if unknown:
+        raise ValueError(f"rerate_match: 허용되지 않은 경기 컬럼 {sorted(unknown)}")
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute("SELECT status FROM matches WHERE id = ?", (match_id,)).fetchone()
+        if row is None or (expected_status is not None and row[0] != expected_status):
+            conn.rollback()
+            return False
+        if not _versions_match(conn, player_versions):
+            conn.rollback()
+            return False
+
+        _update_match_fields(conn, match_id, match_fields)
+        _update_player_scores(conn, player_rows)
+        conn.executemany(
+            "UPDATE matches SET change1 = ?, change2 = ? WHERE id = ?",
+            [(m["change1"], m["change2"], m["id"]) for m in match_changes],
+        )
+
+        rewritten = {e["match_id"] for e in ledger_entries} | {match_id}
+        conn.executemany("DELETE FROM score_ledger WHERE match_id = ?", [(mid,) for mid in rewritten])
+        _insert_ledger(conn, ledger_entries)
+
+        conn.execute("DELETE FROM rating_checkpoints WHERE date >= ?", (replace_from,))
+        _upsert_checkpoints(conn, checkpoints)
+
+        conn.commit()
+        return True
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def _upsert_checkpoints(conn: sqlite3.Connection, checkpoints: List[Dict[str, Any]]) -> None:
+    conn.executemany(
+        "INSERT INTO rating_checkpoints (date, states) VALUES (?, ?) "
+        "ON CONFLICT (date) DO UPDATE SET states = excluded.states",
+        [(c["date"], json.dumps(c["states"], separators=(",", ":"))) for c in checkpoints],
+    )
+
+
+def _versions_match(conn: sqlite3.Connection, expected: Dict[str, int]) -> bool:
+    """선수 행 버전이 모두 기대값과 같은지 (트랜잭션 안에서 호출)"""
+    if not expected:
+        return True
+    current = {}
+    emp_ids = list(expected)
+    for i in range(0, len(emp_ids), 500):
+        chunk = emp_ids[i:i + 500]
+        placeholders = ", ".join("?" for _ in chunk)
+        current.update(conn.execute(
+            f"SELECT emp_id, version FROM players WHERE emp_id IN ({placeholders})", chunk
+        ).fetchall())
+    return all(current.get(eid) == version for eid, version in expected.items())
+
+
+def _update_player_scores(conn: sqlite3.Connection, player_rows: List[Dict[str, Any]]) -> None:
+    conn.executemany(
+        """
+        UPDATE players
+        SET score = ?, tier = ?, match_count = ?, win_count = ?, streak = ?, boost_games = ?
+        WHERE emp_id = ?
+        """,
+        [
+            (r["score"], r["tier"], r["match_count"], r["win_count"], r["streak"], r["boost_games"], r["emp_id"])
+            for r in player_rows
+        ],
+    )
+
+
+def _insert_ledger(conn: sqlite3.Connection, ledger_entries: List[Dict[str, Any]]) -> None:
+    conn.executemany(
+        """
+        INSERT INTO score_ledger (match_id, emp_id, score_delta, is_win, streak_before, boost_used)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (e["match_id"], e["emp_id"], e["score_delta"], e["is_win"], e["streak_before"], e["boost_used"])
+            for e in ledger_entries
+        ],
+    )
+
+
+def _update_match_fields(conn: sqlite3.Connection, match_id: int, match_fields: Dict[str, Any]) -> None:
+    if match_fields:
+        columns = [c for c in MATCH_FINAL_FIELDS if c in match_fields]
+        assignments = ", ".join(f"{c} = ?" for c in columns)
+        conn.execute(
+            f"UPDATE matches SET {assignments} WHERE id = ?",
+            [match_fields[c] for c in columns] + [match_id],
+        )
+
+
+def apply_replay(conn: sqlite3.Connection, player_rows: List[Dict[str, Any]],
+                 match_changes: List[Dict[str, Any]], ledger_entries: List[Dict[str, Any]]) -> int:
+    """전체 재계산 결과를 단일 트랜잭션으로 기록 (Postgres apply_replay와 동일)
+
+    선수 점수 · 경기 change1/change2를 덮어쓰고 점수 원장 전체를 교체한 뒤 데이터 버전을 올린다.
+    레이팅 체크포인트는 모두 지운다 (다음 부분 재생 때 새 점수 기준으로 다시 쌓임).
+    player_rows의 boost_games가 None이면 기존 값을 유지한다. 새 데이터 버전 반환.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(
+            """
+            UPDATE players
+            SET score = ?, tier = ?, match_count = ?, win_count = ?, streak = ?,
+                boost_games = COALESCE(?, boost_games)
+            WHERE emp_id = ?
+            """,
+            [
+                (r["score"], r["tier"], r["match_count"], r["win_count"], r["streak"],
+                 r.get("boost_games"), r["emp_id"])
+                for r in player_rows
+            ],
+        )
+        conn.executemany(
+            "UPDATE matches SET change1 = ?, change2 = ? WHERE id = ?",
+            [(m["change1"], m["change2"], m["id"]) for m in match_changes],
+        )
+        conn.execute("DELETE FROM score_ledger")
+        _insert_ledger(conn, ledger_entries)
+        conn.execute("DELETE FROM rating_checkpoints")  # 처음부터 다시 쌓임
+        version = bump_data_version(conn)
+        conn.commit()
+        return version
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def _player_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    data = dict(row)
+    if "is_active" in data and data["is_active"] is not None:
+        data["is_active"] = bool(data["is_active"])
+    return data
+
+
+def _ledger_from_row(row: sqlite3.Row) -> LedgerRow:
+    data = dict(row)
+    data["is_win"] = bool(data["is_win"])
+    data["boost_used"] = bool(data["boost_used"])
+    return data
+
+
+def _checked_columns(kwargs: Dict[str, Any], allowed) -> List[str]:
+    unknown = set(kwargs) - set(allowed)
+    if unknown:
+        raise ValueError(f"허용되지 않은 컬럼 {sorted(unknown)}")
+    return list(kwargs)
+
+
+class SQLiteDatabase:
+    """SQLite 데이터베이스 관리 클래스 (database.Database와 동일한 인터페이스)
+
+    WAL 모드로 열어 읽기가 쓰기를 막지 않으며, 모든 쿼리는 파라미터 바인딩을 사용해
+    sqlite3 문장 캐시(prepared statement)를 재사용한다.
+    """
+
+    def __init__(self, db_file=None):
+        self.db_file = db_file or config.DB_FILE
+        self.round_trips = 0  # 실행한 쿼리 수 (Supabase 백엔드와 같은 통계)
+        self._lock = threading.RLock()
+        self.conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_file,
+            timeout=config.DB_TIMEOUT,
+            check_same_thread=config.DB_CHECK_SAME_THREAD,
+            cached_statements=256,
+        )
+        conn.row_factory = sqlite3.Row
+        if self.db_file != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        init_schema(conn)
+        return conn
+
+    def _query(self, sql: str, params=()) -> List[sqlite3.Row]:
+        with self._lock:
+            self.round_trips += 1
+            return self.conn.execute(sql, params).fetchall()
+
+    def _write(self, sql: str, params=()) -> sqlite3.Cursor:
+        with self._lock:
+            self.round_trips += 1
+            try:
+                cur = self.conn.execute(sql, params)
+                self.conn.commit()
+                return cur
+            except Exception:
+                self.conn.rollback()
+                raise
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    # ========== 백업 ==========
+    def backup_to(self, dest_path: str) -> None:
+        """온라인 백업 (WAL 내용까지 포함한 일관된 사본)"""
+        with self._lock:
+            dest = sqlite3.connect(dest_path)
+            try:
+                self.conn.backup(dest)
+            finally:
+                dest.close()
+
+    def restore_from(self, src_path: str) -> None:
+        """백업 파일 내용으로 현재 DB를 교체 (데이터 버전은 되돌리지 않고 이어서 증가)"""
+        with self._lock:
+            version = read_data_version(self.conn)
+            src = sqlite3.connect(src_path)
+            try:
+                src.backup(self.conn)
+            finally:
+                src.close()
+            init_schema(self.conn)
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO settings (key, value) VALUES ('data_version', ?)",
+                    (str(max(version, read_data_version(self.conn)) + 1),),
+                )
+
+    # ========== 선수 관리 ==========
+    def add_player(self, emp_id: str, name: str, score: int = 1000,
+                   tier: str = '브론즈', is_active: bool = True,
+                   join_date: Optional[str] = None, role: str = 'player') -> bool:
+        """선수 추가"""
+        try:
+            self._write(
+                "INSERT INTO players (emp_id, name, score, tier, is_active, join_date, role) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (emp_id, name, score, tier, is_active, join_date, role),
+            )
+            return True
+        except Exception:
+            return False
+
+    def get_player(self, emp_id: str, columns: Columns = None) -> Optional[PlayerRow]:
+        """선수 조회 (columns: 필요한 컬럼만 조회)"""
+        select = projection(columns, PLAYER_COLUMNS)
+        rows = self._query(f"SELECT {select} FROM players WHERE emp_id = ?", (emp_id,))
+        return _player_from_row(rows[0]) if rows else None
+
+    def get_players(self, emp_ids: List[str], columns: Columns = None) -> List[PlayerRow]:
+        """여러 선수 일괄 조회"""
+        emp_ids = list(emp_ids)
+        if not emp_ids:
+            return []
+        select = projection(columns, PLAYER_COLUMNS)
+        placeholders = ", ".join("?" for _ in emp_ids)
+        rows = self._query(f"SELECT {select} FROM players WHERE emp_id IN ({placeholders})", emp_ids)
+        return [_player_from_row(r) for r in rows]
+
+    def get_all_players(self, active_only: bool = False, columns: Columns = None) -> List[PlayerRow]:
+        """전체 선수 조회"""
+        select = projection(columns, PLAYER_COLUMNS)
+        where = "WHERE is_active = 1 " if active_only else ""
+        rows = self._query(f"SELECT {select} FROM players {where}ORDER BY score DESC, emp_id")
+        return [_player_from_row(r) for r in rows]
+
+    def update_player(self, emp_id: str, expected_version: Optional[int] = None, **kwargs) -> bool:
+        """선수 정보 수정 (expected_version: 행 버전이 일치할 때만 반영)"""
+        if not kwargs:
+            return False
+        try:
+            columns = _checked_columns(kwargs, PLAYER_COLUMNS)
+            assignments = ", ".join(f"{c} = ?" for c in columns)
+            params = [kwargs[c] for c in columns] + [emp_id]
+            where = "emp_id = ?"
+            if expected_version is not None:
+                where += " AND version = ?"
+                params.append(expected_version)
+            cur = self._write(f"UPDATE players SET {assignments} WHERE {where}", params)
+            return expected_version is None or cur.rowcount > 0
+        except Exception:
+            return False
+
+    def upsert_players(self, rows: List[Dict[str, Any]]) -> bool:
+        """선수 여러 명 일괄 저장 (emp_id 기준 upsert, 1회 트랜잭션)"""
+        if not rows:
+            return True
+        try:
+            columns = _checked_columns(rows[0], PLAYER_COLUMNS)
+            updates = ", ".join(f"{c} = excluded.{c}" for c in columns if c != "emp_id")
+            sql = (
+                f"INSERT INTO players ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+                f"ON CONFLICT (emp_id) DO UPDATE SET {updates}"
+            )
+            with self._lock:
+                self.round_trips += 1
+                with self.conn:
+                    self.conn.executemany(sql, [[r[c] for c in columns] for r in rows])
+            return True
+        except Exception:
+            return False
+
+    def has_players(self) -> bool:
+        """선수가 한 명이라도 있는지"""
+        return bool(self._query("SELECT 1 FROM players LIMIT 1"))
+
+    def delete_player(self, emp_id: str) -> bool:
+        """선수 삭제"""
+        try:
+            self._write("DELETE FROM players WHERE emp_id = ?", (emp_id,))
+            return True
+        except Exception:
+            return False
+
+    # ========== 경기 관리 ==========
+    def add_match(self, date: str, team1: List[str], team2: List[str],
+                  group_name: Optional[str] = None, **kwargs) -> Optional[int]:
+        """경기 추가"""
+        t1_p1 = team1[0] if len(team1) > 0 else None
+        t1_p2 = team1[1] if len(team1) > 1 else None
+        t2_p1 = team2[0] if len(team2) > 0 else None
+        t2_p2 = team2[1] if len(team2) > 1 else None
+
+        try:
+            cur = self._write(
+                "INSERT INTO matches (date, group_name, team1_player1, team1_player2, "
+                "team2_player1, team2_player2, status) VALUES (?, ?, ?, ?, ?, ?, 'pending')",
+                (date, group_name, t1_p1, t1_p2, t2_p1, t2_p2),
+            )
+            return cur.lastrowid
+        except Exception:
+            return None
+
+    def get_matches_by_date(self, date: str, columns: Columns = None) -> List[MatchRow]:
+        """날짜별 경기 조회"""
+        select = projection(columns, MATCH_COLUMNS)
+        rows = self._query(f"SELECT {select} FROM matches WHERE date = ? ORDER BY id", (date,))
+        return [dict(r) for r in rows]
+
+    def get_match(self, match_id: int, columns: Columns = None) -> Optional[MatchRow]:
+        """경기 단건 조회"""
+        select = projection(columns, MATCH_COLUMNS)
+        rows = self._query(f"SELECT {select} FROM matches WHERE id = ?", (match_id,))
+        return dict(rows[0]) if rows else None
+
+    def get_all_matches(self, page_size: Optional[int] = None, columns: Columns = None) -> List[MatchRow]:
+        """전체 경기 일괄 조회 ((date, id) 순, 로컬이므로 페이지 분할 없음)"""
+        select = projection(columns, MATCH_COLUMNS)
+        rows = self._query(f"SELECT {select} FROM matches ORDER BY date, id")
+        return [dict(r) for r in rows]
+
+    def get_all_match_dates(self) -> List[str]:
+        """모든 경기 날짜 조회"""
+        rows = self._query("SELECT DISTINCT date FROM matches ORDER BY date DESC")
+        return [r["date"] for r in rows]
+
+    def update_match(self, match_id: int, **kwargs) -> bool:
+        """경기 정보 수정"""
+        if not kwargs:
+            return False
+        try:
+            columns = _checked_columns(kwargs, MATCH_COLUMNS)
+            assignments = ", ".join(f"{c} = ?" for c in columns)
+            self._write(
+                f"UPDATE matches SET {assignments} WHERE id = ?",
+                [kwargs[c] for c in columns] + [match_id],
+            )
+            return True
+        except Exception:
+            return False
+
+    def delete_match(self, match_id: int) -> bool:
+        """경기 삭제"""
+        try:
+            self._write("DELETE FROM matches WHERE id = ?", (match_id,))
+            return True
+        except Exception:
+            return False
+
+    # ========== 점수 원장 ==========
+    def get_ledger_entries(self, match_id: int) -> List[LedgerRow]:
+        """경기별 점수 변동 기록 조회"""
+        select = projection(LEDGER_COLUMNS, LEDGER_COLUMNS)
+        rows = self._query(f"SELECT {select} FROM score_ledger WHERE match_id = ?", (match_id,))
+        return [_ledger_from_row(r) for r in rows]
+
+    def get_ledger_entries_for(self, match_ids: List[int]) -> List[LedgerRow]:
+        """여러 경기의 점수 변동 기록 일괄 조회"""
+        match_ids = list(match_ids)
+        select = projection(LEDGER_COLUMNS, LEDGER_COLUMNS)
+        entries = []
+        for i in range(0, len(match_ids), 500):
+            chunk = match_ids[i:i + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self._query(f"SELECT {select} FROM score_ledger WHERE match_id IN ({placeholders})", chunk)
+            entries.extend(_ledger_from_row(r) for r in rows)
+        return entries
+
+    # ========== 경기 확정 (트랜잭션) ==========
+    def finalize_match(self, match_id: int, match_fields: Dict[str, Any],
+                       player_rows: List[Dict[str, Any]], ledger_entries: List[Dict[str, Any]],
+                       expected_status: Optional[str] = None,
+                       seed: Optional[RatingCheckpoint] = None) -> bool:
+        """경기 상태 · 선수 점수 · 점수 원장 (+ 새 선수 재생 시작 점수)을 단일 트랜잭션으로 기록"""
+        try:
+            with self._lock:
+                self.round_trips += 1
+                return finalize_match(self.conn, match_id, match_fields, player_rows,
+                                      ledger_entries, expected_status, seed)
+        except Exception:
+            return False
+
+    # ========== 레이팅 체크포인트 ==========
+    def get_rating_checkpoint(self, date: str, before: bool = False) -> Optional[RatingCheckpoint]:
+        """date 이전(before=False면 date 포함) 가장 가까운 날짜의 레이팅 체크포인트"""
+        op = "<" if before else "<="
+        rows = self._query(
+            f"SELECT date, states FROM rating_checkpoints WHERE date {op} ? ORDER BY date DESC LIMIT 1", (date,)
+        )
+        return {"date": rows[0]["date"], "states": json.loads(rows[0]["states"])} if rows else None
+
+    def rerate_match(self, match_id: int, match_fields: Dict[str, Any], expected_status: Optional[str],
+                     player_rows: List[Dict[str, Any]], player_versions: Dict[str, int],
+                     match_changes: List[Dict[str, Any]], ledger_entries: List[Dict[str, Any]],
+                     checkpoints: List[RatingCheckpoint], replace_from: str) -> bool:
+        """과거 경기 수정과 이후 경기 부분 재생 결과를 단일 트랜잭션으로 기록"""
+        try:
+            with self._lock:
+                self.round_trips += 1
+                return rerate_match(self.conn, match_id, match_fields, expected_status, player_rows,
+                                    player_versions, match_changes, ledger_entries, checkpoints, replace_from)
+        except Exception:
+            return False
+
+    # ========== 전체 재계산 (트랜잭션) ==========
+    def apply_replay(self, player_rows: List[Dict[str, Any]], match_changes: List[Dict[str, Any]],
+                     ledger_entries: List[Dict[str, Any]]) -> Optional[int]:
+        """재계산한 선수 상태 · 경기 변동 · 점수 원장을 한 번에 기록 (실패 시 None)"""
+        try:
+            with self._lock:
+                self.round_trips += 1
+                return apply_replay(self.conn, player_rows, match_changes, ledger_entries)
+        except Exception:
+            return None
+
+    # ========== 설정 관리 ==========
+    def set_setting(self, key: str, value: str) -> bool:
+        """설정 저장"""
+        try:
+            self._write(
+                "INSERT INTO settings (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+            return True
+        except Exception:
+            return False
+
+    def get_setting(self, key: str) -> Optional[str]:
+        """설정 조회"""
+        rows = self._query("SELECT value FROM settings WHERE key = ?", (key,))
+        return rows[0]["value"] if rows else None
+
+    def get_all_settings(self) -> Dict[str, str]:
+        """전체 설정 조회"""
+        rows = self._query("SELECT key, value FROM settings")
+        return {r["key"]: r["value"] for r in rows}
+
+    # ========== 시작 설정 ==========
+    def get_startup_config(self) -> StartupConfig:
+        """규칙 · 슈퍼관리자 설정 · 데이터 버전 · 선수 유무를 한 번에 조회"""
+        with self._lock:
+            self.round_trips += 1
+            conn = self.conn
+            super_admin = conn.execute("SELECT value FROM settings WHERE key = 'super_admin'").fetchone()
+            return {
+                "score_rules": dict(conn.execute("SELECT key, value FROM score_rules").fetchall()),
+                "tier_rules": dict(conn.execute("SELECT tier_name, threshold FROM tier_rules").fetchall()),
+                "super_admin": super_admin[0] if super_admin else None,
+                "data_version": read_data_version(conn),
+                "has_players": conn.execute("SELECT 1 FROM players LIMIT 1").fetchone() is not None,
+            }
+
+    # ========== 데이터 버전 ==========
+    def get_data_version(self) -> int:
+        """데이터 버전 조회 (없으면 0)"""
+        with self._lock:
+            self.round_trips += 1
+            return read_data_version(self.conn)
+
+    def bump_data_version(self) -> Optional[int]:
+        """데이터 버전을 원자적으로 1 증가시키고 새 값 반환"""
+        try:
+            with self._lock:
+                self.round_trips += 1
+                with self.conn:
+                    return bump_data_version(self.conn)
+        except Exception:
+            return None
+
+    # ========== 규칙 관리 ==========
+    def set_score_rule(self, key: str, value: int) -> bool:
+        """점수 규칙 저장"""
+        try:
+            self._write(
+                "INSERT INTO score_rules (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+            return True
+        except Exception:
+            return False
+
+    def get_score_rules(self) -> Dict[str, int]:
+        """점수 규칙 조회"""
+        rows = self._query("SELECT key, value FROM score_rules")
+        return {r["key"]: r["value"] for r in rows}
+
+    def set_tier_rule(self, tier_name: str, threshold: int) -> bool:
+        """티어 규칙 저장"""
+        try:
+            self._write(
+                "INSERT INTO tier_rules (tier_name, threshold) VALUES (?, ?) "
+                "ON CONFLICT (tier_name) DO UPDATE SET threshold = excluded.threshold",
+                (tier_name, threshold),
+            )
+            return True
+        except Exception:
+            return False
+
+    def get_tier_rules(self) -> Dict[str, int]:
+        """티어 규칙 조회"""
+        rows = self._query("SELECT tier_name, threshold FROM tier_rules")
+        return {r["tier_name"]: r["threshold"] for r in rows}
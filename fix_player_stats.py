@@ -6,11 +6,14 @@ import sqlite3
 import sys
 import io
 
+import config
+from database_sqlite import bump_data_version
+
 # Windows 콘솔 인코딩 설정
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-def fix_player_stats(db_file="knoc_badminton.db"):
+def fix_player_stats(db_file=config.DB_FILE):
     conn = sqlite3.connect(db_file)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
@@ -73,6 +76,7 @@ def fix_player_stats(db_file="knoc_badminton.db"):
             print(f"  ✅ {name} ({emp_id}): {stat['matches']}경기 {stat['wins']}승")
             updated_count += 1
     
+    bump_data_version(conn)  # 실행 중인 앱/API가 변경을 감지하도록
     conn.commit()
     conn.close()
     
@@ -3,7 +3,7 @@ import os
 import sys
 import shutil
 from datetime import datetime
-from database import Database
+from database import open_database
 import config
 
 # Windows 콘솔 인코딩 설정
@@ -57,7 +57,7 @@ def migrate_json_to_sqlite():
         os.remove(config.DB_FILE)
         print(f"⚠️ 기존 DB 백업: {db_backup}")
     
-    db = Database()
+    db = open_database(config.DB_FILE, backend="sqlite")
     print("✅ 데이터베이스 초기화 완료")
     
     # 5. 선수 데이터 마이그레이션
@@ -169,9 +169,12 @@ def migrate_json_to_sqlite():
             db.set_setting(key, json.dumps(value))
         print(f"  ✓ 설정: {len(settings)}개")
     
+    # 실행 중인 앱/API가 변경을 감지하도록 데이터 버전 갱신
+    db.bump_data_version()
+    
     # 9. 검증
     print(f"\n🔍 데이터 검증")
-    db_players = db.get_all_players()
+    db_players = db.get_all_players(columns=("emp_id",))
     db_dates = db.get_all_match_dates()
     
     print(f"  ✓ 선수 수: {len(db_players)} (원본: {len(players_data)})")
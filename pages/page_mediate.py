@@ -166,14 +166,8 @@ def render(dm):
             ids = [active_options[p1], active_options[p2], active_options[p3], active_options[p4]]
             if len(set(ids)) != 4:
                 st.error("선수 4명을 중복 없이 선택해주세요.")
-            else:
-                if selected_date not in dm.history:
-                    dm.history[selected_date] = []
-                dm.history[selected_date].append({
-                    "team1": ids[:2], "score1": 0, "change1": 0,
-                    "team2": ids[2:], "score2": 0, "change2": 0,
-                    "group": group.strip() or "번외", "status": "pending",
-                })
-                dm.save_data()
+            elif dm.add_match(selected_date, ids[:2], ids[2:], group.strip() or "번외"):
                 st.success("경기 추가 완료!")
                 st.rerun()
+            else:
+                st.error("경기 추가에 실패했습니다.")
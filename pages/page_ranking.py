@@ -66,55 +66,16 @@ def render(dm):
     # 랭킹 데이터 생성
     changes = dm.get_rank_changes()
     
-    # 전체 매치에서 통산 전적 계산
-    all_matches = []
-    for d in dm.history:
-        for m in dm.history[d]:
-            if m["status"] == "done":
-                all_matches.append(m)
-
-    player_stats = {}
-    for eid in dm.players:
-        wins, losses = 0, 0
-        for m in all_matches:
-            if eid in m["team1"] or eid in m["team2"]:
-                is_t1 = eid in m["team1"]
-                is_win = (is_t1 and m["score1"] > m["score2"]) or (not is_t1 and m["score2"] > m["score1"])
-                if is_win:
-                    wins += 1
-                else:
-                    losses += 1
-        rate = int(wins / max(wins + losses, 1) * 100)
-        player_stats[eid] = {"wins": wins, "losses": losses, "rate": rate}
-
-    # 최근 대회 성적 계산
+    # 통산 전적 · 최근 대회 성적 (DataManager 집계 캐시)
+    aggregates = dm.player_aggregates
+    player_stats = {
+        eid: {"wins": a["wins"], "losses": a["losses"], "rate": a["rate"]}
+        for eid, a in aggregates.items()
+    }
     last_perf_stats = {}
-    remaining = set(dm.players.keys())
-    for d in sorted(dm.history.keys(), reverse=True):
-        if not remaining:
-            break
-        daily_stats = {}
-        for m in dm.history[d]:
-            if m["status"] != "done":
-                continue
-            win_t1 = m["score1"] > m["score2"]
-            for pid in m["team1"] + m["team2"]:
-                if pid not in remaining:
-                    continue
-                if pid not in daily_stats:
-                    daily_stats[pid] = {"score": 0, "w": 0, "l": 0}
-                is_t1 = pid in m["team1"]
-                change = m.get("change1", 0) if is_t1 else m.get("change2", 0)
-                daily_stats[pid]["score"] += change
-                is_win = (is_t1 and win_t1) or (not is_t1 and not win_t1)
-                if is_win:
-                    daily_stats[pid]["w"] += 1
-                else:
-                    daily_stats[pid]["l"] += 1
-        for pid, s in daily_stats.items():
-            sign = "+" if s["score"] > 0 else ""
-            last_perf_stats[pid] = f"{sign}{s['score']} ({s['w']}승 {s['l']}패)"
-            remaining.discard(pid)
+    for eid, a in aggregates.items():
+        sign = "+" if a["last_change"] > 0 else ""
+        last_perf_stats[eid] = f"{sign}{a['last_change']} ({a['last_wins']}승 {a['last_losses']}패)"
 
     # 정렬
     if "XP" in sort_mode:
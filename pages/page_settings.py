@@ -1,4 +1,6 @@
+import time
 import streamlit as st
+import pandas as pd
 import config
 
 
@@ -62,6 +64,57 @@ def render(dm):
             dm.update_rules(new_score_rules, new_tier_rules)
             st.success("규칙이 저장되고 모든 선수의 등급이 재산정되었습니다!")
 
+        st.markdown("---")
+        st.markdown("#### 🧪 규칙 변경 미리보기")
+        st.caption("저장하기 전에 전체 경기 기록을 후보 규칙으로 다시 재생해 순위와 등급 분포를 비교합니다. DB는 변경되지 않습니다.")
+
+        candidates = st.session_state.setdefault("rule_candidates", [])
+        entered = {
+            "name": f"후보 {len(candidates) + 1}",
+            "score_rules": {**dm.score_rules, **score_values},
+            "tier_rules": dict(tier_values),
+        }
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button("➕ 입력한 규칙을 후보로 추가", width="stretch"):
+                candidates.append(entered)
+        with col2:
+            run_preview = st.button("👁️ 미리보기 실행", width="stretch")
+        with col3:
+            if st.button("🧹 후보 비우기", width="stretch"):
+                candidates.clear()
+
+        if candidates:
+            st.caption("비교할 후보: " + ", ".join(c["name"] for c in candidates))
+
+        if run_preview:
+            rule_sets = [{"name": "현재 규칙", "score_rules": dm.score_rules, "tier_rules": dm.tier_rules}]
+            rule_sets += candidates or [{**entered, "name": "입력한 규칙"}]
+            with st.spinner(f"규칙 {len(rule_sets)}개로 전체 경기 재생 중..."):
+                started = time.perf_counter()
+                results = dm.simulate_rules(rule_sets)
+                elapsed = time.perf_counter() - started
+            st.caption(f"⏱️ {elapsed:.1f}초")
+
+            st.markdown("##### 🏆 등급 분포")
+            tier_df = pd.DataFrame({r["name"]: r["tier_counts"] for r in results}).fillna(0).astype(int)
+            tier_df.index = [f"{config.TIER_ICONS.get(t, '')} {t}" for t in tier_df.index]
+            st.dataframe(tier_df, use_container_width=True)
+
+            st.markdown("##### 📊 순위 비교")
+            by_set = [{e["emp_id"]: e for e in r["ranking"]} for r in results]
+            rows = []
+            for entry in results[-1]["ranking"]:
+                row = {"이름": entry["name"]}
+                for r, index in zip(results, by_set):
+                    e = index[entry["emp_id"]]
+                    row[f"{r['name']} 순위"] = e["rank"]
+                    row[f"{r['name']} 점수"] = e["score"]
+                    row[f"{r['name']} 등급"] = e["tier"]
+                rows.append(row)
+            st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True,
+                         height=min(len(rows) * 40 + 60, 500))
+
     # ========== TAB 2: 데이터 관리 ==========
     with tab2:
         st.markdown("#### 🔄 XP 전체 재계산")
@@ -106,8 +159,7 @@ def render(dm):
                     st.code(result.stdout, language="text")
                     if result.returncode == 0:
                         st.success("점수 재계산이 완료되었습니다!")
-                        if "dm" in st.session_state:
-                            st.session_state["dm"]._invalidate_cache()
+                        dm.reload_after_external_change()
                         st.rerun()
                     else:
                         st.error("재계산 중 오류가 발생했습니다.")
@@ -146,9 +198,6 @@ def render(dm):
             if st.button("⏪ 이 시점으로 복원", width="stretch", type="secondary"):
                 if dm.restore_backup(selected_backup):
                     st.success("데이터가 복구되었습니다! 페이지를 새로고침합니다.")
-                    # 데이터 매니저 리로드
-                    if "dm" in st.session_state:
-                        del st.session_state["dm"]
                     st.rerun()
                 else:
                     st.error("백업 파일을 찾을 수 없습니다.")
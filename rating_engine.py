@@ -0,0 +1,299 @@
+"""
+레이팅 재생 엔진
+확정된 경기(날짜 · id 순)와 규칙을 받아 메모리에서 한 번에 재생하고
+최종 선수 상태와 경기별 변동(점수 원장)을 돌려준다.
+DB를 전혀 사용하지 않는 순수 계산이라 실시간 확정(DataManager)과
+전체 재계산(recalculate_scores.py)이 같은 규칙을 공유한다.
+"""
+from bisect import bisect_right
+from collections import namedtuple
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_TIER = "브론즈"
+INITIAL_SCORE = 1000
+UNDERDOG_GAP = 100  # 상대 팀 평균 점수가 이만큼 높으면 언더독 보너스
+BOOST_MULTIPLIER = 1.25
+BOOST_GAMES_PER_MONTH = 4  # 늦게 합류한 선수가 놓친 달마다 받을 수 있는 부스트 승리 수
+
+
+# 경기 1건 (id, 날짜, 팀1 사번 목록, 팀2 사번 목록, 팀1 점수, 팀2 점수)
+ReplayMatch = namedtuple("ReplayMatch", ["id", "date", "team1", "team2", "score1", "score2"])
+# 재생 결과: 선수 최종 상태, 경기별 (id, change1, change2), 원장 (match_id, emp_id, 변동, 승리, 이전 연승, 부스트),
+# 날짜별 체크포인트 [(date, {사번: CHECKPOINT_FIELDS 값 목록})] (checkpoints=True일 때만)
+ReplayResult = namedtuple("ReplayResult", ["players", "match_changes", "ledger", "checkpoints"])
+# 체크포인트에 저장하는 선수 상태 (티어는 점수와 현재 티어 규칙으로 다시 계산)
+CHECKPOINT_FIELDS = ("score", "match_count", "win_count", "streak", "boost_games")
+
+
+class ScoreRules(namedtuple("ScoreRules", ["win", "loss", "big_diff", "big_win", "underdog"])):
+    """점수 규칙 (settings의 score_rules 딕셔너리에서 필요한 값만)"""
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, rules: Dict[str, int]) -> "ScoreRules":
+        return cls(
+            win=rules.get("win", 20),
+            loss=rules.get("loss", 0),
+            big_diff=rules.get("big_diff", 10),
+            big_win=rules.get("big_win", 5),
+            underdog=rules.get("underdog", 15),
+        )
+
+
+def tier_table(tier_rules: Dict[str, int]):
+    """점수 → 티어 함수 (임계값 이분 탐색, 재생 중 반복 호출용)"""
+    # 임계값이 같으면 먼저 정의된 티어가 이기도록 (기존 내림차순 선형 탐색과 동일)
+    ordered = sorted((threshold, -pos, name) for pos, (name, threshold) in enumerate(tier_rules.items()))
+    thresholds = [t for t, _, _ in ordered]
+    names = [DEFAULT_TIER] + [name for _, _, name in ordered]
+
+    def tier_of(score: int) -> str:
+        return names[bisect_right(thresholds, score)]
+    return tier_of
+
+
+def tier_for(score: int, tier_rules: Dict[str, int]) -> str:
+    """점수 1건의 티어 (여러 번 계산할 때는 tier_table 결과를 재사용)"""
+    return tier_table(tier_rules)(score)
+
+
+class PlayerState:
+    """재생 중인 선수 상태 (DataManager.Player와 같은 속성 이름)"""
+    __slots__ = ("emp_id", "score", "tier", "match_count", "win_count", "streak", "boost_games")
+
+    def __init__(self, emp_id, score=INITIAL_SCORE, tier=DEFAULT_TIER, match_count=0,
+                 win_count=0, streak=0, boost_games=0):
+        self.emp_id = emp_id
+        self.score = score
+        self.tier = tier
+        self.match_count = match_count
+        self.win_count = win_count
+        self.streak = streak
+        self.boost_games = boost_games
+
+    def copy(self) -> "PlayerState":
+        return PlayerState(self.emp_id, self.score, self.tier, self.match_count,
+                           self.win_count, self.streak, self.boost_games)
+
+    def to_row(self) -> Dict[str, Any]:
+        return {s: getattr(self, s) for s in self.__slots__}
+
+    def values(self) -> List[int]:
+        """체크포인트 저장 형식 (CHECKPOINT_FIELDS 순)"""
+        return [self.score, self.match_count, self.win_count, self.streak, self.boost_games]
+
+    @classmethod
+    def from_values(cls, emp_id: str, values: List[int], tier_of) -> "PlayerState":
+        score, match_count, win_count, streak, boost_games = values
+        return cls(emp_id, score, tier_of(score), match_count, win_count, streak, boost_games)
+
+
+def states_from_checkpoint(states: Dict[str, List[int]], tier_rules: Dict[str, int]) -> Dict[str, PlayerState]:
+    """체크포인트 {사번: 값 목록} → 재생 시작 상태"""
+    tier_of = tier_table(tier_rules)
+    return {eid: PlayerState.from_values(eid, values, tier_of) for eid, values in states.items()}
+
+
+def fresh_states(emp_ids: Iterable[str], tier_rules: Dict[str, int],
+                 initial_score: int = INITIAL_SCORE) -> Dict[str, PlayerState]:
+    """처음부터 재생할 선수 초기 상태 (초기 점수, 기록 없음)"""
+    tier = tier_for(initial_score, tier_rules)
+    return {eid: PlayerState(eid, initial_score, tier) for eid in emp_ids}
+
+
+# ========== 경기 1건 규칙 (실시간 확정과 재생이 공유) ==========
+def match_changes(rules: ScoreRules, score1: int, score2: int, avg1: float, avg2: float):
+    """경기 결과 → (팀1 승리 여부, 승리 팀 기본 변동, 패배 팀 변동)
+
+    대승(점수 차 big_diff 이상)과 언더독(상대 평균이 UNDERDOG_GAP 이상 높음) 보너스는 승리 팀에만 붙는다.
+    """
+    win_t1 = score1 > score2
+    bonus = 0
+    if abs(score1 - score2) >= rules.big_diff:
+        bonus += rules.big_win
+    if (avg2 - avg1 if win_t1 else avg1 - avg2) >= UNDERDOG_GAP:
+        bonus += rules.underdog
+    return win_t1, rules.win + bonus, rules.loss
+
+
+def apply_result(p, is_win: bool, win_pt: int, loss_pt: int, multiplier: float, tier_of):
+    """선수 1명에게 경기 결과 반영 (p: score/match_count/... 속성을 가진 객체, 제자리 변경)
+
+    Returns:
+        (실제 점수 변동, 경기 전 연승, 부스트 사용 여부)
+    """
+    p.match_count += 1
+    streak_before = p.streak
+    boost_used = False
+    if is_win:
+        gain = int(win_pt * multiplier)
+        p.score += gain
+        p.win_count += 1
+        p.streak += 1
+        if multiplier > 1.0:
+            p.boost_games += 1
+            boost_used = True
+    else:
+        gain = loss_pt
+        p.score += loss_pt
+        p.streak = 0
+    p.tier = tier_of(p.score)
+    return gain, streak_before, boost_used
+
+
+def year_month(value: Optional[str]):
+    """"YYYY-MM-DD" / "YYYY-MM" → (연, 월), 형식이 다르면 None"""
+    if not value or len(value) < 7 or value[4] != "-":
+        return None
+    try:
+        return int(value[:4]), int(value[5:7])
+    except ValueError:
+        return None
+
+
+def boost_cap(first_play_ym, today_ym) -> int:
+    """부스트 승리 상한: 첫 경기가 올해면 놓친 달 × 4경기 (남은 달 × 4경기를 넘지 않음), 아니면 0
+
+    first_play_ym이 None이면 아직 경기가 없는 신규 선수로 보고 today_ym 기준으로 계산한다.
+    """
+    s_year, s_month = first_play_ym or today_ym
+    if s_year != today_ym[0]:
+        return 0
+    return min((s_month - 1) * BOOST_GAMES_PER_MONTH, (13 - s_month) * BOOST_GAMES_PER_MONTH)
+
+
+UNKNOWN_YM = (0, 0)  # 형식을 알 수 없는 첫 경기 날짜 (올해가 아니므로 상한 0)
+
+
+class BoostTable:
+    """선수별 부스트 자격 표: 첫 경기 (연, 월)과 기준 달의 보충 상한
+
+    상한은 기준 (연, 월)이 바뀔 때만 선수별로 한 번 계산해 두므로 배수 조회는 O(1)이다.
+    사용한 부스트 승리 수는 선수 상태(boost_games)가 가지고 있어 조회할 때 함께 넘긴다.
+    실시간 확정은 현재 달, 재생은 경기 날짜의 달을 기준으로 조회한다.
+    """
+    __slots__ = ("_first", "_caps")
+
+    def __init__(self, first_play: Optional[Dict[str, str]] = None):
+        self._first: Dict[str, tuple] = {}
+        self._caps = (None, {})  # (기준 연/월, 사번 → 상한), 기준 달이 바뀌면 통째로 교체
+        for eid, date in (first_play or {}).items():
+            self._first[eid] = year_month(date) or UNKNOWN_YM
+
+    def copy(self) -> "BoostTable":
+        table = BoostTable()
+        table._first = dict(self._first)
+        return table
+
+    def first_play(self, eid: str):
+        """첫 경기 (연, 월), 경기가 없으면 None"""
+        return self._first.get(eid)
+
+    def set_first_play(self, eid: str, date: Optional[str]) -> None:
+        """첫 경기 날짜 갱신 (None이면 경기 없음)"""
+        if date is None:
+            self._first.pop(eid, None)
+        else:
+            self._first[eid] = year_month(date) or UNKNOWN_YM
+        self._caps[1].pop(eid, None)
+
+    def multiplier(self, eid: str, boost_games: int, today_ym) -> float:
+        """부스트 배수 (상한 전까지 승리 점수 1.25배)"""
+        cap_ym, caps = self._caps
+        if cap_ym != today_ym:
+            caps = {}
+            self._caps = (today_ym, caps)
+        cap = caps.get(eid)
+        if cap is None:
+            cap = caps[eid] = boost_cap(self._first.get(eid), today_ym)
+        return BOOST_MULTIPLIER if boost_games < cap else 1.0
+
+
+# ========== 전체 재생 ==========
+def replay(matches: Iterable, score_rules: Dict[str, int], tier_rules: Dict[str, int],
+           players: Dict[str, PlayerState], with_boost: bool = False,
+           first_play: Optional[Dict[str, str]] = None, checkpoints: bool = False) -> ReplayResult:
+    """확정 경기들을 순서대로 한 번에 재생
+
+    Args:
+        matches: (id, date, team1, team2, score1, score2) 튜플/ReplayMatch, 날짜 · id 순
+        players: 시작 상태 (복사해서 사용, players에 없는 사번은 건너뜀)
+        with_boost: 부스트 배수 적용 (경기 날짜를 '오늘'로 보고 계산)
+        first_play: 사번 → 첫 경기 날짜 (없으면 재생한 경기 중 처음 등장한 날짜)
+        checkpoints: 날짜가 끝날 때마다 전체 선수 상태 스냅샷 기록
+
+    Returns:
+        ReplayResult(players, match_changes, ledger, checkpoints)
+    """
+    rules = ScoreRules.from_dict(score_rules)
+    tier_of = tier_table(tier_rules)
+    states = {eid: p.copy() for eid, p in players.items()}
+    boost = BoostTable(first_play)
+    first_seen = boost._first  # 처음 등장한 선수만 첫 경기 날짜를 기록하도록 직접 확인
+    multiplier_of = boost.multiplier
+    changes: List[tuple] = []
+    ledger: List[tuple] = []
+    snapshots: List[tuple] = []
+    current_date = None
+    add_change = changes.append
+    add_entry = ledger.append
+    get_state = states.get
+    loss_pt = rules.loss
+
+    for match_id, date, team1, team2, score1, score2 in matches:
+        if checkpoints and date != current_date:
+            if current_date is not None:
+                snapshots.append((current_date, {eid: p.values() for eid, p in states.items()}))
+            current_date = date
+        t1 = [p for p in map(get_state, team1) if p is not None]
+        t2 = [p for p in map(get_state, team2) if p is not None]
+        avg1 = sum([p.score for p in t1]) / (len(team1) or 1)
+        avg2 = sum([p.score for p in t2]) / (len(team2) or 1)
+        win_t1, win_pt, _ = match_changes(rules, score1, score2, avg1, avg2)
+
+        today_ym = year_month(date) if with_boost else None
+        for team, won in ((t1, win_t1), (t2, not win_t1)):
+            for p in team:
+                multiplier = 1.0
+                if with_boost:
+                    if p.emp_id not in first_seen:
+                        boost.set_first_play(p.emp_id, date)
+                    if won and today_ym is not None:
+                        multiplier = multiplier_of(p.emp_id, p.boost_games, today_ym)
+                gain, streak_before, boost_used = apply_result(p, won, win_pt, loss_pt, multiplier, tier_of)
+                add_entry((match_id, p.emp_id, gain, won, streak_before, boost_used))
+
+        add_change((match_id, win_pt if win_t1 else loss_pt, loss_pt if win_t1 else win_pt))
+
+    if checkpoints and current_date is not None:
+        snapshots.append((current_date, {eid: p.values() for eid, p in states.items()}))
+    return ReplayResult(states, changes, ledger, snapshots)
+
+
+def matches_from_history(history: Dict[str, List[Dict[str, Any]]]) -> List[ReplayMatch]:
+    """DataManager 경기 이력 → 재생 입력 (확정 경기만, 날짜 · id 순)
+
+    확정 경기만 먼저 골라낸 뒤 정렬한다 (확정 경기는 항상 DB id가 있다).
+    """
+    return [
+        ReplayMatch(m["id"], date, m["team1"], m["team2"], m["score1"], m["score2"])
+        for date in sorted(history)
+        for m in sorted((m for m in history[date] if m.get("status") == "done"), key=lambda m: m["id"])
+    ]
+
+
+def matches_from_rows(rows: Iterable[Dict[str, Any]]) -> List[ReplayMatch]:
+    """matches 테이블 행 → 재생 입력 (확정 경기만, 날짜 · id 순)"""
+    done = [r for r in rows if r.get("status") == "done"]
+    done.sort(key=lambda r: (r["date"], r["id"]))
+    return [
+        ReplayMatch(
+            r["id"],
+            r["date"],
+            [p for p in (r["team1_player1"], r["team1_player2"]) if p],
+            [p for p in (r["team2_player1"], r["team2_player2"]) if p],
+            r["score1"],
+            r["score2"],
+        )
+        for r in done
+    ]
@@ -1,43 +1,32 @@
 """
 선수 점수 전체 재계산 스크립트
 모든 경기 데이터를 기반으로 선수 점수를 처음부터 다시 계산합니다.
+재생은 DataManager와 같은 레이팅 엔진(rating_engine)으로 메모리에서 한 번에 하고,
+결과(선수 상태 · 경기 변동 · 점수 원장)는 한 번의 일괄 기록으로 반영합니다.
 """
-import sqlite3
 import sys
 import io
-from datetime import datetime
+import time
+
+import rating_engine
+from database import open_database
 
 # Windows 콘솔 인코딩 설정
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
+MATCH_COLUMNS = ("id", "date", "team1_player1", "team1_player2", "team2_player1", "team2_player2",
+                 "score1", "score2", "status")
+
 
 class ScoreRecalculator:
-    def __init__(self, db_file="knoc_badminton.db"):
-        self.conn = sqlite3.connect(db_file)
-        self.conn.row_factory = sqlite3.Row
-        self.cursor = self.conn.cursor()
+    def __init__(self, db=None):
+        # 설정된 백엔드(SQLite/Supabase) 그대로 사용
+        self.db = db or open_database()
         
         # 점수 규칙 로드
-        self.score_rules = self._load_score_rules()
-        self.tier_rules = self._load_tier_rules()
-    
-    def _load_score_rules(self):
-        """점수 규칙 로드"""
-        self.cursor.execute("SELECT key, value FROM score_rules")
-        return {row["key"]: row["value"] for row in self.cursor.fetchall()}
-    
-    def _load_tier_rules(self):
-        """티어 규칙 로드"""
-        self.cursor.execute("SELECT tier_name, threshold FROM tier_rules ORDER BY threshold DESC")
-        return [(row["tier_name"], row["threshold"]) for row in self.cursor.fetchall()]
-    
-    def _calculate_tier(self, score):
-        """점수에 따른 티어 계산"""
-        for tier_name, threshold in self.tier_rules:
-            if score >= threshold:
-                return tier_name
-        return "브론즈"
+        self.score_rules = self.db.get_score_rules()
+        self.tier_rules = self.db.get_tier_rules()
     
     def recalculate_all_scores(self, ignore_boost=True, dry_run=True):
         """
@@ -59,107 +48,26 @@ class ScoreRecalculator:
         print()
         
         # 1. 모든 선수 정보 가져오기
-        self.cursor.execute("SELECT emp_id, name, score FROM players")
-        players = {row["emp_id"]: {
-            "name": row["name"],
-            "old_score": row["score"],
-            "new_score": 1000,  # 초기 점수
-            "tier": "브론즈",
-            "match_count": 0,
-            "win_count": 0,
-            "streak": 0
-        } for row in self.cursor.fetchall()}
+        rows = self.db.get_all_players(columns=("emp_id", "name", "score"))
+        names = {r["emp_id"]: r["name"] for r in rows}
+        old_scores = {r["emp_id"]: r["score"] for r in rows}
         
         # 2. 모든 완료된 경기를 날짜 + ID 순서로 가져오기
-        self.cursor.execute("""
-            SELECT id, date, team1_player1, team1_player2, team2_player1, team2_player2,
-                   score1, score2, status
-            FROM matches
-            WHERE status = 'done'
-            ORDER BY date ASC, id ASC
-        """)
-        matches = self.cursor.fetchall()
+        matches = rating_engine.matches_from_rows(self.db.get_all_matches(columns=MATCH_COLUMNS))
         
         print(f"📊 총 {len(matches)}개의 완료된 경기를 재계산합니다...\n")
         
-        # 3. 각 경기마다 점수 재계산
-        for idx, match in enumerate(matches, 1):
-            team1 = [p for p in [match["team1_player1"], match["team1_player2"]] if p]
-            team2 = [p for p in [match["team2_player1"], match["team2_player2"]] if p]
-            
-            score1 = match["score1"]
-            score2 = match["score2"]
-            win_t1 = score1 > score2
-            diff = abs(score1 - score2)
-            
-            # 평균 점수 계산 (언더독 보너스용)
-            avg_s1 = sum(players[p]["new_score"] for p in team1 if p in players) / max(len(team1), 1)
-            avg_s2 = sum(players[p]["new_score"] for p in team2 if p in players) / max(len(team2), 1)
-            
-            # 보너스 계산
-            base_win = self.score_rules.get("win", 20)
-            base_loss = self.score_rules.get("loss", 0)
-            bonus = 0
-            
-            # 대승 보너스
-            if diff >= self.score_rules.get("big_diff", 10):
-                bonus += self.score_rules.get("big_win", 5)
-            
-            # 언더독 보너스
-            if win_t1 and (avg_s2 - avg_s1 >= 100):
-                bonus += self.score_rules.get("underdog", 15)
-            elif not win_t1 and (avg_s1 - avg_s2 >= 100):
-                bonus += self.score_rules.get("underdog", 15)
-            
-            change_win = base_win + bonus
-            change_loss = base_loss
-            
-            # Team 1 선수들 점수 업데이트
-            for pid in team1:
-                if pid in players:
-                    p = players[pid]
-                    p["match_count"] += 1
-                    
-                    if win_t1:
-                        # 부스트 적용 (ignore_boost=False인 경우만)
-                        multiplier = 1.0
-                        if not ignore_boost:
-                            # 간단한 부스트 로직: 처음 4경기만 1.25배
-                            if p["match_count"] <= 4:
-                                multiplier = 1.25
-                        
-                        gain = int(change_win * multiplier)
-                        p["new_score"] += gain
-                        p["win_count"] += 1
-                        p["streak"] += 1
-                    else:
-                        p["new_score"] += change_loss
-                        p["streak"] = 0
-                    
-                    p["tier"] = self._calculate_tier(p["new_score"])
-            
-            # Team 2 선수들 점수 업데이트
-            for pid in team2:
-                if pid in players:
-                    p = players[pid]
-                    p["match_count"] += 1
-                    
-                    if not win_t1:
-                        # 부스트 적용
-                        multiplier = 1.0
-                        if not ignore_boost:
-                            if p["match_count"] <= 4:
-                                multiplier = 1.25
-                        
-                        gain = int(change_win * multiplier)
-                        p["new_score"] += gain
-                        p["win_count"] += 1
-                        p["streak"] += 1
-                    else:
-                        p["new_score"] += change_loss
-                        p["streak"] = 0
-                    
-                    p["tier"] = self._calculate_tier(p["new_score"])
+        # 3. 초기 점수에서 모든 경기 재생 (부스트는 경기 날짜 기준으로 판정)
+        started = time.perf_counter()
+        result = rating_engine.replay(
+            matches,
+            self.score_rules,
+            self.tier_rules,
+            rating_engine.fresh_states(names, self.tier_rules),
+            with_boost=not ignore_boost,
+        )
+        print(f"⏱️  재생 {(time.perf_counter() - started) * 1000:.1f}ms")
+        players = result.players
         
         # 4. 결과 출력
         print("\n" + "=" * 60)
@@ -167,18 +75,18 @@ class ScoreRecalculator:
         print("=" * 60)
         
         changes = []
-        for emp_id, data in players.items():
-            if data["match_count"] > 0:  # 경기한 선수만 표시
-                diff = data["new_score"] - data["old_score"]
+        for emp_id, p in players.items():
+            if p.match_count > 0:  # 경기한 선수만 표시
+                diff = p.score - old_scores[emp_id]
                 changes.append({
                     "emp_id": emp_id,
-                    "name": data["name"],
-                    "old_score": data["old_score"],
-                    "new_score": data["new_score"],
+                    "name": names[emp_id],
+                    "old_score": old_scores[emp_id],
+                    "new_score": p.score,
                     "diff": diff,
-                    "tier": data["tier"],
-                    "matches": data["match_count"],
-                    "wins": data["win_count"]
+                    "tier": p.tier,
+                    "matches": p.match_count,
+                    "wins": p.win_count
                 })
         
         # 점수 변화가 큰 순서로 정렬
@@ -195,22 +103,23 @@ class ScoreRecalculator:
             print("💾 데이터베이스 업데이트 중...")
             print("=" * 60)
             
-            for emp_id, data in players.items():
-                self.cursor.execute("""
-                    UPDATE players
-                    SET score = ?, tier = ?, match_count = ?, win_count = ?, streak = ?
-                    WHERE emp_id = ?
-                """, (
-                    data["new_score"],
-                    data["tier"],
-                    data["match_count"],
-                    data["win_count"],
-                    data["streak"],
-                    emp_id
-                ))
-            
-            self.conn.commit()
-            print("✅ 데이터베이스 업데이트 완료!")
+            # 부스트를 무시한 재계산은 원장에 부스트 사용이 없으므로 기존 boost_games를 유지
+            player_rows = [
+                {**p.to_row(), "boost_games": None if ignore_boost else p.boost_games}
+                for p in players.values()
+            ]
+            match_changes = [{"id": mid, "change1": c1, "change2": c2} for mid, c1, c2 in result.match_changes]
+            ledger = [
+                {"match_id": mid, "emp_id": eid, "score_delta": delta, "is_win": won,
+                 "streak_before": streak_before, "boost_used": boost_used}
+                for mid, eid, delta, won, streak_before, boost_used in result.ledger
+            ]
+            # 한 번의 일괄 기록 (데이터 버전도 함께 올려 실행 중인 앱/API가 변경을 감지)
+            version = self.db.apply_replay(player_rows, match_changes, ledger)
+            if version is None:
+                print("❌ 데이터베이스 업데이트 실패 (변경 없음)")
+            else:
+                print(f"✅ 데이터베이스 업데이트 완료! (데이터 버전 {version})")
         else:
             print("\n" + "=" * 60)
             print("ℹ️  시뮬레이션 모드: 실제 DB는 변경되지 않았습니다.")
@@ -220,8 +129,10 @@ class ScoreRecalculator:
         return changes
     
     def close(self):
-        """DB 연결 종료"""
-        self.conn.close()
+        """DB 연결 종료 (SQLite만 해당)"""
+        close = getattr(self.db, "close", None)
+        if close:
+            close()
 
 
 def main():
@@ -0,0 +1,111 @@
+"""
+규칙 변경 시뮬레이터
+전체 확정 경기 이력을 여러 후보 규칙(score_rules/tier_rules)으로 동시에 다시 재생해
+규칙별 최종 순위와 티어 분포를 돌려준다.
+DB를 전혀 사용하지 않는 순수 계산이며, 후보 규칙마다 프로세스 풀의 작업 1개로 병렬 재생한다
+(경기 이력은 워커마다 한 번만 전달).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import rating_engine
+
+# 재생할 경기 수 × 후보 수가 이보다 적으면 프로세스 시작 비용이 더 커서 현재 프로세스에서 순서대로 재생
+POOL_MIN_WORK = 200_000
+
+# 워커 프로세스 전역 (initializer로 한 번 받은 재생 입력)
+_worker_input = None
+
+
+def _init_worker(matches, players, with_boost, first_play):
+    global _worker_input
+    _worker_input = (matches, players, with_boost, first_play)
+
+
+def _run_worker(score_rules, tier_rules):
+    matches, players, with_boost, first_play = _worker_input
+    return simulate_one(matches, score_rules, tier_rules, players, with_boost, first_play)
+
+
+def simulate_one(matches, score_rules: Dict[str, int], tier_rules: Dict[str, int],
+                 players: Dict[str, List[int]], with_boost: bool = True,
+                 first_play: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """규칙 1세트로 전체 재생
+
+    Args:
+        matches: rating_engine 재생 입력 (날짜 · id 순)
+        players: 사번 → 시작 상태 값 목록 (rating_engine.CHECKPOINT_FIELDS 순)
+
+    Returns:
+        {"ranking": [{"rank", "emp_id", "score", "tier", "match_count", "win_count"}, ...],
+         "tier_counts": {티어: 인원 (높은 티어부터)}}
+    """
+    states = rating_engine.states_from_checkpoint(players, tier_rules)
+    result = rating_engine.replay(matches, score_rules, tier_rules, states, with_boost, first_play)
+    ranked = sorted(result.players.values(), key=lambda p: (-p.score, p.emp_id))
+
+    tier_counts = {name: 0 for name, _ in sorted(tier_rules.items(), key=lambda x: x[1], reverse=True)}
+    tier_counts.setdefault(rating_engine.DEFAULT_TIER, 0)
+    for p in ranked:
+        tier_counts[p.tier] = tier_counts.get(p.tier, 0) + 1
+    return {
+        "ranking": [
+            {
+                "rank": i + 1,
+                "emp_id": p.emp_id,
+                "score": p.score,
+                "tier": p.tier,
+                "match_count": p.match_count,
+                "win_count": p.win_count,
+            }
+            for i, p in enumerate(ranked)
+        ],
+        "tier_counts": tier_counts,
+    }
+
+
+def simulate(matches, rule_sets: List[Dict[str, Any]], players: Dict[str, List[int]],
+             with_boost: bool = True, first_play: Optional[Dict[str, str]] = None,
+             max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """여러 후보 규칙으로 동시에 전체 재생
+
+    Args:
+        rule_sets: [{"name", "score_rules", "tier_rules"}, ...]
+        max_workers: 프로세스 수 (None이면 min(후보 수, CPU 수), 1이면 현재 프로세스에서 순서대로,
+            None일 때 작업량이 POOL_MIN_WORK 미만이어도 현재 프로세스에서)
+
+    Returns:
+        rule_sets 순서대로 {"name", "score_rules", "tier_rules", "ranking", "tier_counts"}
+    """
+    if not rule_sets:
+        return []
+    if max_workers is None and len(matches) * len(rule_sets) < POOL_MIN_WORK:
+        workers = 1
+    else:
+        workers = max_workers or min(len(rule_sets), os.cpu_count() or 1)
+
+    if workers <= 1 or len(rule_sets) == 1:
+        outcomes = [
+            simulate_one(matches, r["score_rules"], r["tier_rules"], players, with_boost, first_play)
+            for r in rule_sets
+        ]
+    else:
+        matches = [tuple(m) for m in matches]  # namedtuple 대신 튜플로 전달 (피클 크기 절약)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(matches, players, with_boost, first_play),
+        ) as pool:
+            futures = [pool.submit(_run_worker, r["score_rules"], r["tier_rules"]) for r in rule_sets]
+            outcomes = [f.result() for f in futures]
+
+    return [
+        {
+            "name": r.get("name") or f"규칙 {i + 1}",
+            "score_rules": r["score_rules"],
+            "tier_rules": r["tier_rules"],
+            **outcome,
+        }
+        for i, (r, outcome) in enumerate(zip(rule_sets, outcomes))
+    ]
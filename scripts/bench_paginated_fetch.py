@@ -0,0 +1,129 @@
+"""
+range 페이지 병렬 조회 벤치마크
+
+로컬 PostgREST 스텁 서버(경기 100,000행)를 띄우고
+Database.get_all_matches()를 스레드 수별로 측정한다.
+
+실행: python scripts/bench_paginated_fetch.py [--rows 100000] [--latency-ms 30]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+
+
+def make_rows(count):
+    """(date, id) 순으로 정렬된 가짜 경기 행 생성"""
+    rows = []
+    for i in range(1, count + 1):
+        day = i // 40
+        rows.append({
+            "id": i,
+            "date": f"{2020 + day // 336}-{day // 28 % 12 + 1:02d}-{day % 28 + 1:02d}",
+            "group_name": "A",
+            "team1_player1": f"E{i % 97:03d}",
+            "team1_player2": f"E{i % 89:03d}",
+            "team2_player1": f"E{i % 83:03d}",
+            "team2_player2": f"E{i % 79:03d}",
+            "score1": 21,
+            "score2": i % 20,
+            "change1": 12,
+            "change2": -8,
+            "status": "done",
+        })
+    return rows
+
+
+def make_handler(rows, latency):
+    """range(offset/limit 또는 Range 헤더)와 count=exact만 흉내내는 스텁 핸들러"""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if not url.path.endswith("/matches"):
+                self.send_error(404)
+                return
+
+            params = parse_qs(url.query)
+            start, end = 0, len(rows) - 1
+            if "offset" in params or "limit" in params:
+                start = int(params.get("offset", ["0"])[0])
+                end = start + int(params.get("limit", [str(len(rows))])[0]) - 1
+            else:
+                m = re.match(r"(\d+)-(\d+)", self.headers.get("Range", ""))
+                if m:
+                    start, end = int(m.group(1)), int(m.group(2))
+
+            time.sleep(latency)
+            page = rows[start:end + 1]
+            body = json.dumps(page).encode("utf-8")
+
+            total = len(rows) if "count=exact" in self.headers.get("Prefer", "") else "*"
+            last = start + len(page) - 1
+            content_range = f"{start}-{last}/{total}" if page else f"*/{total}"
+
+            self.send_response(206 if page and len(page) < len(rows) else 200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Range", content_range)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return StubHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="range 페이지 병렬 조회 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000, help="스텁 경기 행 수")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="요청당 인위적 지연 (ms)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="비교할 스레드 수")
+    parser.add_argument("--repeat", type=int, default=3, help="스레드 수별 반복 횟수")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(rows, args.latency_ms / 1000))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    os.environ["SUPABASE_URL"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ["SUPABASE_KEY"] = "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoiYW5vbiJ9.stub"
+
+    from database import Database
+    db = Database()
+
+    print(f"행 수: {args.rows:,} / 페이지: {config.DB_PAGE_SIZE} / 지연: {args.latency_ms}ms")
+    baseline = None
+    try:
+        for workers in args.workers:
+            config.DB_FETCH_WORKERS = workers
+            timings = []
+            for _ in range(args.repeat):
+                db.round_trips = 0
+                started = time.perf_counter()
+                fetched = db.get_all_matches()
+                timings.append(time.perf_counter() - started)
+                if len(fetched) != args.rows or fetched[-1]["id"] != args.rows:
+                    raise SystemExit(f"❌ 행 누락: {len(fetched)} / {args.rows}")
+
+            best = min(timings)
+            baseline = baseline or best
+            print(f"  workers={workers:<2}  {best * 1000:8.1f}ms  요청 {db.round_trips}회  x{baseline / best:.2f}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
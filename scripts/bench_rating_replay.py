@@ -0,0 +1,74 @@
+"""
+레이팅 재생 엔진 벤치마크
+
+가짜 선수/확정 경기를 메모리에 만들고 rating_engine.replay 한 번으로
+전체 재생(최종 선수 상태 + 경기별 변동 + 점수 원장)에 걸리는 시간을 잰다. DB는 사용하지 않는다.
+
+실행: python scripts/bench_rating_replay.py [--matches 1000000] [--players 300] [--with-boost]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+import rating_engine  # noqa: E402
+
+
+def make_matches(n, emp_ids, seed):
+    """날짜 · id 순 복식 경기 n개 (한 날짜에 32경기)"""
+    rng = random.Random(seed)
+    matches = []
+    for i in range(n):
+        d = i // 32
+        date = f"{2000 + d // 336}-{(d // 28) % 12 + 1:02d}-{d % 28 + 1:02d}"
+        a, b, c, e = rng.sample(emp_ids, 4)
+        if rng.random() < 0.5:
+            s1, s2 = 21, rng.randint(0, 19)
+        else:
+            s1, s2 = rng.randint(0, 19), 21
+        matches.append(rating_engine.ReplayMatch(i + 1, date, [a, b], [c, e], s1, s2))
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="레이팅 재생 엔진 벤치마크")
+    parser.add_argument("--matches", type=int, default=1_000_000, help="확정 경기 수")
+    parser.add_argument("--players", type=int, default=300, help="선수 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--with-boost", action="store_true", help="부스트 배수 적용")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    emp_ids = [f"R{i:04d}" for i in range(args.players)]
+    print(f"경기 {args.matches:,}개 · 선수 {args.players}명 생성 중...")
+    matches = make_matches(args.matches, emp_ids, args.seed)
+    players = rating_engine.fresh_states(emp_ids, config.TIER_RULES)
+
+    best = None
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        result = rating_engine.replay(
+            matches, config.SCORE_RULES, config.TIER_RULES, players,
+            with_boost=args.with_boost,
+        )
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+        print(f"  재생 {elapsed:.2f}s ({args.matches / elapsed:,.0f} 경기/s)")
+
+    total_matches = sum(p.match_count for p in result.players.values())
+    ledger_sum = sum(e[2] for e in result.ledger)
+    score_sum = sum(p.score - players[eid].score for eid, p in result.players.items())
+    top = max(result.players.values(), key=lambda p: p.score)
+    print(f"최고 {best:.2f}s · 원장 {len(result.ledger):,}건 · 최고 점수 {top.emp_id} {top.score}pt ({top.tier})")
+    if total_matches != 4 * args.matches or ledger_sum != score_sum:
+        print("❌ 원장 합계와 최종 점수가 다름")
+        sys.exit(1)
+    print("✅ 원장 합계 = 최종 점수 변동")
+
+
+if __name__ == "__main__":
+    main()
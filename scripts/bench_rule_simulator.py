@@ -0,0 +1,72 @@
+"""
+규칙 변경 시뮬레이터 벤치마크
+
+가짜 선수/확정 경기를 메모리에 만들고 후보 규칙 N개로 rule_simulator.simulate를
+순서대로(프로세스 1개) 한 번, 프로세스 풀로 한 번 실행해 걸린 시간과 결과 일치 여부를 비교한다. DB는 사용하지 않는다.
+
+실행: python scripts/bench_rule_simulator.py [--matches 200000] [--players 300] [--rule-sets 4] [--workers N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+import rating_engine  # noqa: E402
+import rule_simulator  # noqa: E402
+from bench_rating_replay import make_matches  # noqa: E402
+
+
+def candidate_rules(n):
+    """현재 규칙 + 승리 점수 · 티어 기준을 조금씩 바꾼 후보 n-1개"""
+    sets = [{"name": "현재 규칙", "score_rules": config.SCORE_RULES, "tier_rules": config.TIER_RULES}]
+    for i in range(1, n):
+        sets.append({
+            "name": f"후보 {i}",
+            "score_rules": {**config.SCORE_RULES, "win": config.SCORE_RULES["win"] + 5 * i},
+            "tier_rules": {name: threshold + 50 * i for name, threshold in config.TIER_RULES.items()},
+        })
+    return sets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="규칙 변경 시뮬레이터 벤치마크")
+    parser.add_argument("--matches", type=int, default=200_000, help="확정 경기 수")
+    parser.add_argument("--players", type=int, default=300, help="선수 수")
+    parser.add_argument("--rule-sets", type=int, default=4, help="후보 규칙 수 (현재 규칙 포함)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: min(후보 수, CPU 수))")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    emp_ids = [f"R{i:04d}" for i in range(args.players)]
+    print(f"경기 {args.matches:,}개 · 선수 {args.players}명 · 후보 규칙 {args.rule_sets}개 (CPU {os.cpu_count()}개)")
+    matches = make_matches(args.matches, emp_ids, args.seed)
+    players = {eid: [rating_engine.INITIAL_SCORE, 0, 0, 0, 0] for eid in emp_ids}
+    rule_sets = candidate_rules(args.rule_sets)
+
+    started = time.perf_counter()
+    sequential = rule_simulator.simulate(matches, rule_sets, players, max_workers=1)
+    seq_elapsed = time.perf_counter() - started
+    print(f"  순서대로   {seq_elapsed:.2f}s")
+
+    workers = args.workers or min(args.rule_sets, os.cpu_count() or 1)
+    started = time.perf_counter()
+    pooled = rule_simulator.simulate(matches, rule_sets, players, max_workers=workers)
+    pool_elapsed = time.perf_counter() - started
+    print(f"  프로세스 {workers}개 {pool_elapsed:.2f}s (x{seq_elapsed / pool_elapsed:.1f})")
+
+    for r in pooled:
+        top = r["ranking"][0]
+        tiers = " · ".join(f"{t} {n}" for t, n in r["tier_counts"].items())
+        print(f"  {r['name']:<6} 1위 {top['emp_id']} {top['score']}pt | {tiers}")
+
+    if pooled != sequential:
+        print("❌ 프로세스 풀 결과가 순서대로 실행한 결과와 다름")
+        sys.exit(1)
+    print("✅ 프로세스 풀 결과 = 순서대로 실행한 결과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+시작 시간 벤치마크 (첫 응답까지 걸린 시간)
+
+매 회 새 파이썬 프로세스에서 import부터 첫 응답까지를 측정한다.
+- dm: DataManager() 생성(시작 설정 조회) → 첫 랭킹(선수 캐시 적재) (추가 패키지 없이 실행)
+- api: api_server 시작(lifespan: 시작 설정 조회 + 캐시 적재) → GET /ranking 첫 응답 (fastapi 필요)
+- app: Streamlit AppTest로 app.py 첫 실행(새 세션 → 첫 화면 렌더링) 완료 (streamlit 필요)
+fastapi/streamlit이 없으면 해당 대상은 건너뛴다.
+
+기본은 설정된 DB(config.DB_BACKEND)를 그대로 사용하고,
+--sqlite면 임시 SQLite DB에 가짜 선수/경기를 채워 네트워크 없이 측정한다.
+
+실행: python scripts/bench_startup.py [--target dm api app] [--repeat 5] [--sqlite]
+"""
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def _configure(tmp_dir):
+    import config
+    config.DB_BACKEND = "sqlite"
+    config.DB_FILE = os.path.join(tmp_dir, "knoc_badminton.db")
+    config.BACKUP_DIR = os.path.join(tmp_dir, "backups")
+    config.DATA_FILE = os.path.join(tmp_dir, "data.json")
+    config.CACHE_NOTIFY_FILE = os.path.join(tmp_dir, "cache_notify.db")
+
+
+def seed(tmp_dir, players, dates):
+    """임시 SQLite DB에 선수와 확정된 대진표 채우기"""
+    import random
+    _configure(tmp_dir)
+    from data_manager import DataManager
+
+    random.seed(1)
+    dm = DataManager()
+    emp_ids = [f"B{i:04d}" for i in range(players)]
+    for i, eid in enumerate(emp_ids):
+        dm.add_player(eid, f"선수{i}", score=1000 + random.randint(0, 400))
+    for d in range(dates):
+        date = f"{2020 + d // 12}-{d % 12 + 1:02d}-10"
+        dm.generate_tournament(date, random.sample(emp_ids, min(players, 32)))
+        for idx, m in enumerate(dm.history[date]):
+            dm.admin_force_confirm(date, idx, 21, random.randint(0, 19), "bench")
+    dm.db.close()
+
+
+REQUIRES = {"dm": None, "api": "fastapi", "app": "streamlit"}
+
+
+def measure_dm():
+    """DataManager: 생성(시작 설정 조회) + 첫 랭킹 (api_server/app.py가 공통으로 거치는 경로)"""
+    started = time.perf_counter()
+    from data_manager import DataManager
+    imported = time.perf_counter()
+    dm = DataManager()
+    ready = time.perf_counter()
+    startup_trips = dm.db.round_trips
+    ranking = sorted(dm.players.items(), key=lambda x: x[1].score, reverse=True)
+    done = time.perf_counter()
+    if not ranking:
+        raise SystemExit("선수가 없습니다 (--sqlite로 가짜 데이터를 채워 측정)")
+    return {
+        "import_ms": (imported - started) * 1000,
+        "startup_ms": (ready - imported) * 1000,
+        "first_response_ms": (done - started) * 1000,
+        "db_round_trips": dm.db.round_trips,
+        "startup_round_trips": startup_trips,
+    }
+
+
+def measure_api():
+    """api_server: 앱 시작 + 첫 GET /ranking"""
+    started = time.perf_counter()
+    from fastapi.testclient import TestClient
+    import api_server
+    imported = time.perf_counter()
+    with TestClient(api_server.app) as client:  # with 진입 시 lifespan(시작 처리) 실행
+        ready = time.perf_counter()
+        response = client.get("/ranking")
+        done = time.perf_counter()
+        response.raise_for_status()
+        dm = api_server.get_watcher().dm
+        trips = dm.db.round_trips + dm.adb.round_trips
+    return {
+        "import_ms": (imported - started) * 1000,
+        "startup_ms": (ready - imported) * 1000,
+        "first_response_ms": (done - started) * 1000,
+        "db_round_trips": trips,
+    }
+
+
+def measure_app():
+    """app.py: 새 세션의 첫 스크립트 실행(첫 화면) 완료"""
+    started = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    imported = time.perf_counter()
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+    at.run()
+    done = time.perf_counter()
+    if at.exception:
+        raise SystemExit(f"app.py 실행 오류: {at.exception[0].message}")
+    return {
+        "import_ms": (imported - started) * 1000,
+        "startup_ms": (done - imported) * 1000,
+        "first_response_ms": (done - started) * 1000,
+        "db_round_trips": None,
+    }
+
+
+def child(target, tmp_dir):
+    os.chdir(ROOT)
+    if tmp_dir:
+        _configure(tmp_dir)
+    result = {"dm": measure_dm, "api": measure_api, "app": measure_app}[target]()
+    print(json.dumps(result))
+
+
+def run_once(target, tmp_dir):
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", target]
+    if tmp_dir:
+        cmd += ["--db-dir", tmp_dir]
+    out = subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT)
+    if out.returncode != 0:
+        raise SystemExit(f"❌ {target} 측정 실패\n{out.stderr[-2000:]}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간(첫 응답까지) 벤치마크")
+    parser.add_argument("--target", nargs="+", choices=list(REQUIRES), default=list(REQUIRES))
+    parser.add_argument("--repeat", type=int, default=5, help="대상별 반복 횟수 (매번 새 프로세스)")
+    parser.add_argument("--sqlite", action="store_true", help="임시 SQLite DB에 가짜 데이터를 채워 측정")
+    parser.add_argument("--players", type=int, default=300, help="--sqlite: 선수 수")
+    parser.add_argument("--dates", type=int, default=36, help="--sqlite: 대회 날짜 수")
+    parser.add_argument("--child", choices=list(REQUIRES), help=argparse.SUPPRESS)
+    parser.add_argument("--db-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.db_dir)
+        return
+
+    tmp_dir = None
+    if args.sqlite:
+        tmp_dir = tempfile.mkdtemp(prefix="knoc_startup_")
+        print(f"임시 DB 준비 중 (선수 {args.players}명, 대회 {args.dates}회)...")
+        seed(tmp_dir, args.players, args.dates)
+
+    print(f"대상별 {args.repeat}회 (새 프로세스) · 중앙값 기준")
+    for target in args.target:
+        module = REQUIRES[target]
+        if module and importlib.util.find_spec(module) is None:
+            print(f"  {target:<4} 건너뜀 ({module} 미설치)")
+            continue
+        runs = [run_once(target, tmp_dir) for _ in range(args.repeat)]
+        first = statistics.median(r["first_response_ms"] for r in runs)
+        startup = statistics.median(r["startup_ms"] for r in runs)
+        imports = statistics.median(r["import_ms"] for r in runs)
+        trips = runs[-1]["db_round_trips"]
+        trips_text = f" · DB 요청 {trips}회" if trips is not None else ""
+        if "startup_round_trips" in runs[-1]:
+            trips_text += f" (시작 {runs[-1]['startup_round_trips']}회)"
+        print(f"  {target:<4} 첫 응답 {first:8.1f}ms (import {imports:7.1f}ms + 시작/렌더링 {startup:7.1f}ms)"
+              f"{trips_text} · 최소 {min(r['first_response_ms'] for r in runs):.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
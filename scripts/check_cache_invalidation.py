@@ -0,0 +1,113 @@
+"""
+워커 간 캐시 무효화 확인 스크립트
+
+임시 SQLite DB와 알림 파일을 만들고, API 워커처럼 DataManager + CacheWatcher를 가진
+프로세스 N개를 띄운다. 메인 프로세스에서 선수를 추가/강제 재로딩했을 때
+모든 워커가 알림을 받아 새 데이터를 보는지 확인한다.
+
+실행: python scripts/check_cache_invalidation.py [--workers 4] [--timeout 10]
+"""
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def _configure(tmp_dir):
+    import config
+    config.DB_BACKEND = "sqlite"
+    config.DB_FILE = os.path.join(tmp_dir, "knoc_badminton.db")
+    config.BACKUP_DIR = os.path.join(tmp_dir, "backups")
+    config.CACHE_NOTIFY_FILE = os.path.join(tmp_dir, "cache_notify.db")
+
+
+def worker(tmp_dir, ready, commands, results):
+    """API 워커 흉내: 명령(찾을 사번)을 받으면 get_dm()처럼 check() 후 캐시에서 조회"""
+    _configure(tmp_dir)
+    from cache_notifier import CacheWatcher
+    from data_manager import DataManager
+
+    # DB 버전 주기 확인은 끄고 알림만으로 갱신되는지 본다
+    watcher = CacheWatcher(DataManager(), db_check_interval=3600)
+    len(watcher.dm.players)  # 캐시 적재
+    ready.put(os.getpid())
+
+    while True:
+        command = commands.get()
+        if command is None:
+            return
+        emp_id, timeout = command
+        started = time.perf_counter()
+        found = False
+        while time.perf_counter() - started < timeout:
+            watcher.check()
+            if emp_id in watcher.dm.players:
+                found = True
+                break
+            time.sleep(0.01)
+        results.put((os.getpid(), emp_id, found, time.perf_counter() - started, dict(watcher.stats)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커 간 캐시 무효화 확인")
+    parser.add_argument("--workers", type=int, default=4, help="워커 프로세스 수")
+    parser.add_argument("--timeout", type=float, default=10.0, help="워커별 대기 한도 (초)")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="knoc_notify_")
+    _configure(tmp_dir)
+    from cache_notifier import CacheWatcher
+    from data_manager import DataManager
+
+    writer = CacheWatcher(DataManager())
+    writer.dm.add_player("seed", "시드")
+
+    ctx = mp.get_context("spawn")
+    ready, results = ctx.Queue(), ctx.Queue()
+    queues = [ctx.Queue() for _ in range(args.workers)]
+    procs = [ctx.Process(target=worker, args=(tmp_dir, ready, q, results)) for q in queues]
+    for p in procs:
+        p.start()
+    for _ in procs:
+        ready.get(timeout=60)
+    print(f"워커 {args.workers}개 준비 완료 ({tmp_dir})")
+
+    ok = True
+    try:
+        # 1) 한 워커의 쓰기 → 다른 모든 워커가 알림으로 갱신
+        writer.dm.add_player("new1", "신규1")
+        for q in queues:
+            q.put(("new1", args.timeout))
+        ok &= _report("쓰기 알림", [results.get() for _ in procs])
+
+        # 2) 알림 없이 DB를 직접 바꾼 뒤 /admin/reload → 모든 워커 전체 재로딩
+        writer.dm.db.add_player("new2", "신규2")
+        writer.request_reload()
+        for q in queues:
+            q.put(("new2", args.timeout))
+        ok &= _report("강제 재로딩", [results.get() for _ in procs])
+    finally:
+        for q in queues:
+            q.put(None)
+        for p in procs:
+            p.join(timeout=10)
+
+    print("✅ 모든 워커가 변경을 반영했습니다." if ok else "❌ 반영되지 않은 워커가 있습니다.")
+    sys.exit(0 if ok else 1)
+
+
+def _report(label, rows):
+    print(f"\n[{label}]")
+    for pid, emp_id, found, elapsed, stats in sorted(rows):
+        mark = "✓" if found else "✗"
+        print(f"  {mark} pid={pid} {emp_id} {elapsed * 1000:7.1f}ms {stats}")
+    return all(found for _, _, found, _, _ in rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+동시 점수 입력/승인 스트레스 테스트
+
+임시 SQLite DB에 선수와 대진표를 만들고, 하나의 DataManager를 공유하는 여러 스레드가
+동시에 점수 입력 → 승인(같은 경기에 중복 승인 포함)을 보내는 동안
+읽기 스레드는 잠금 없이 캐시를 계속 순회한다.
+--managers N이면 같은 DB 파일을 여는 DataManager N개(워커 프로세스 흉내)에 요청을 나눠 보내
+인스턴스 잠금이 없는 선수 행 갱신 충돌(버전 확인 후 재계산)까지 확인한다.
+기본은 모든 날짜의 경기를 섞어 확정하므로(최악의 경우), 참가 선수가 이후 날짜에 이미 확정 경기를 가진
+과거 경기 확정은 부분 재생(전역 잠금)으로 처리된다. --in-order면 날짜 순서대로 확정한다(실제 운영과 유사).
+끝난 뒤 다음을 확인한다.
+
+- 모든 경기가 정확히 한 번만 확정됨
+- 캐시의 선수 상태 == DB의 선수 상태 == 점수 원장 합계
+- 새로 읽은 경기 이력 == 캐시의 경기 이력
+- 읽기 스레드 오류 없음
+
+실행: python scripts/stress_concurrent_approvals.py [--players 32] [--dates 4] [--threads 16] [--managers 1] [--in-order]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+
+
+def _configure(tmp_dir):
+    config.DB_BACKEND = "sqlite"
+    config.DB_FILE = os.path.join(tmp_dir, "knoc_badminton.db")
+    config.BACKUP_DIR = os.path.join(tmp_dir, "backups")
+    config.DATA_FILE = os.path.join(tmp_dir, "data.json")
+
+
+def _reader(dm, stop, counters):
+    """잠금 없이 캐시를 계속 읽는 스레드 (순회 중 변경되면 RuntimeError 발생)"""
+    while not stop.is_set():
+        try:
+            snap = dm.snapshot()
+            for eid, p in snap.players.items():
+                _ = p.score + p.match_count
+            for date, matches in snap.history.items():
+                for m in matches:
+                    _ = m["status"]
+            for eid, entries in snap.player_index.items():
+                _ = len(entries)
+            _ = sum(a["wins"] for a in dm.player_aggregates.values())
+            counters["reads"] += 1
+        except Exception as e:
+            counters["errors"] += 1
+            counters["last_error"] = repr(e)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 점수 입력/승인 스트레스 테스트")
+    parser.add_argument("--players", type=int, default=32, help="선수 수")
+    parser.add_argument("--dates", type=int, default=4, help="대회 날짜 수")
+    parser.add_argument("--threads", type=int, default=16, help="쓰기 스레드 수")
+    parser.add_argument("--readers", type=int, default=4, help="읽기 스레드 수")
+    parser.add_argument("--managers", type=int, default=1, help="같은 DB를 공유하는 DataManager 수")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--in-order", action="store_true", help="날짜 순서대로 확정 (같은 날짜 안에서만 섞음)")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    tmp_dir = tempfile.mkdtemp(prefix="knoc_stress_")
+    _configure(tmp_dir)
+    from data_manager import DataManager
+
+    dm = DataManager()
+    emp_ids = [f"S{i:03d}" for i in range(args.players)]
+    for i, eid in enumerate(emp_ids):
+        dm.add_player(eid, f"선수{i}", score=1000 + random.randint(0, 300))
+    dates = [f"2030-{d + 1:02d}-15" for d in range(args.dates)]
+    for date in dates:
+        dm.generate_tournament(date, emp_ids)
+
+    managers = [dm] + [DataManager() for _ in range(args.managers - 1)]
+    jobs = [(date, idx) for date in dates for idx in range(len(dm.history[date]))]
+    random.shuffle(jobs)
+    if args.in_order:
+        jobs.sort(key=lambda job: job[0])
+    print(f"선수 {args.players}명 · 경기 {len(jobs)}개 · 쓰기 스레드 {args.threads} · "
+          f"읽기 스레드 {args.readers} · DataManager {len(managers)}개")
+
+    before = {eid: (p.score, p.match_count) for eid, p in dm.players.items()}
+    results = {"submitted": 0, "approved": 0}
+    results_lock = threading.Lock()
+
+    def play(numbered_job):
+        n, (date, idx) = numbered_job
+        writer = managers[n % len(managers)]
+        writer.refresh_if_stale()
+        m = writer.history[date][idx]
+        s1, s2 = random.choice([(21, random.randint(0, 19)), (random.randint(0, 19), 21)])
+        ok = writer.submit_score_for_approval(date, idx, s1, s2, m["team1"][0])
+        approved = 0
+        # 같은 경기를 (다른 인스턴스에서도) 두 번 승인 시도 → 정확히 한 번만 반영되어야 함
+        for k in range(2):
+            approver = managers[(n + k) % len(managers)]
+            approver.refresh_if_stale()
+            if approver.approve_match(date, idx, m["team2"][0]):
+                approved += 1
+        with results_lock:
+            results["submitted"] += int(ok)
+            results["approved"] += approved
+
+    stop = threading.Event()
+    counters = {"reads": 0, "errors": 0, "last_error": None}
+    readers = [threading.Thread(target=_reader, args=(dm, stop, counters)) for _ in range(args.readers)]
+    for t in readers:
+        t.start()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        list(pool.map(play, enumerate(jobs)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    for t in readers:
+        t.join()
+
+    conflicts = sum(m.cache_stats["score_conflicts"] for m in managers)
+    rerates = sum(m.cache_stats["rerates"] for m in managers)
+    print(f"처리 시간 {elapsed:.2f}s ({len(jobs) / elapsed:.1f} 경기/s), 읽기 {counters['reads']}회, "
+          f"선수 행 충돌 재시도 {conflicts}회, 과거 날짜 부분 재생 {rerates}회")
+    for m in managers:
+        m.refresh_if_stale()
+
+    failures = []
+    if results["submitted"] != len(jobs):
+        failures.append(f"점수 입력 {results['submitted']}/{len(jobs)}")
+    if results["approved"] != len(jobs):
+        failures.append(f"승인 반영 {results['approved']}건 (기대 {len(jobs)}건)")
+    if counters["errors"]:
+        failures.append(f"읽기 오류 {counters['errors']}건: {counters['last_error']}")
+
+    statuses = {m["status"] for date in dates for m in dm.history[date]}
+    if statuses != {"done"}:
+        failures.append(f"미확정 경기 상태 {statuses}")
+
+    ledger = {
+        r["emp_id"]: (r["total"], r["games"])
+        for r in dm.db.conn.execute(
+            "SELECT emp_id, SUM(score_delta) AS total, COUNT(*) AS games FROM score_ledger GROUP BY emp_id"
+        )
+    }
+    db_players = {row["emp_id"]: row for row in dm.db.get_all_players()}
+    for eid, p in dm.players.items():
+        row = db_players[eid]
+        cached = (p.score, p.match_count, p.win_count, p.streak, p.boost_games)
+        stored = (row["score"], row["match_count"], row["win_count"], row["streak"], row["boost_games"])
+        if cached != stored:
+            failures.append(f"{eid} 캐시 {cached} != DB {stored}")
+        total, games = ledger.get(eid, (0, 0))
+        if (before[eid][0] + total, before[eid][1] + games) != (row["score"], row["match_count"]):
+            failures.append(f"{eid} 원장 합계 불일치 (점수 {row['score']}, 원장 {before[eid][0]}+{total})")
+
+    fresh = DataManager()
+    if fresh.history != dm.history:
+        failures.append("새로 읽은 경기 이력과 캐시가 다름")
+    if fresh.player_aggregates != dm.player_aggregates:
+        failures.append("새로 읽은 집계와 캐시가 다름")
+
+    if failures:
+        print("❌ 실패")
+        for f in failures[:20]:
+            print(f"  - {f}")
+        sys.exit(1)
+    print("✅ 유실/중복 반영 없음, 캐시 = DB = 점수 원장")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+-- Supabase SQL: 전체 재계산 결과 일괄 기록 함수 (sql/score_ledger.sql, sql/data_version.sql, sql/rating_checkpoints.sql 실행 후 적용)
+-- recalculate_scores.py가 레이팅 엔진으로 재생한 결과를 하나의 트랜잭션으로 기록한다.
+-- 선수 점수/티어/승/연승(boost_games는 값이 있을 때만), 경기 change1/change2를 덮어쓰고
+-- 점수 원장 전체를 교체하고 레이팅 체크포인트를 비운 뒤 데이터 버전을 올려 새 값을 반환한다.
+create or replace function public.apply_replay(
+  p_players jsonb,
+  p_matches jsonb,
+  p_ledger jsonb
+) returns bigint
+language plpgsql
+as $$
+begin
+  update public.players p
+  set score = r.score,
+      tier = r.tier,
+      match_count = r.match_count,
+      win_count = r.win_count,
+      streak = r.streak,
+      boost_games = coalesce(r.boost_games, p.boost_games)
+  from jsonb_to_recordset(coalesce(p_players, '[]'::jsonb)) as r(
+    emp_id text, score integer, tier text, match_count integer,
+    win_count integer, streak integer, boost_games integer
+  )
+  where p.emp_id = r.emp_id;
+
+  update public.matches m
+  set change1 = r.change1,
+      change2 = r.change2
+  from jsonb_to_recordset(coalesce(p_matches, '[]'::jsonb)) as r(id bigint, change1 integer, change2 integer)
+  where m.id = r.id;
+
+  delete from public.score_ledger where true;
+  insert into public.score_ledger (match_id, emp_id, score_delta, is_win, streak_before, boost_used)
+  select r.match_id, r.emp_id, r.score_delta, r.is_win, r.streak_before, r.boost_used
+  from jsonb_to_recordset(coalesce(p_ledger, '[]'::jsonb)) as r(
+    match_id bigint, emp_id text, score_delta integer, is_win boolean, streak_before integer, boost_used boolean
+  );
+
+  delete from public.rating_checkpoints where true;
+
+  return public.bump_data_version();
+end;
+$$;
@@ -0,0 +1,13 @@
+-- Supabase SQL: 데이터 버전 카운터
+-- settings.data_version을 원자적으로 1 증가시키고 새 값을 반환한다.
+-- DataManager는 쓰기마다 호출하고, 다른 세션/워커는 이 값만 조회해 캐시 재로딩 여부를 정한다.
+create or replace function public.bump_data_version()
+returns bigint
+language sql
+as $$
+  insert into public.settings (key, value)
+  values ('data_version', '1')
+  on conflict (key) do update
+    set value = (public.settings.value::bigint + 1)::text
+  returning value::bigint;
+$$;
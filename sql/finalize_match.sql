@@ -0,0 +1,94 @@
+-- Supabase SQL: 경기 확정 함수 (sql/score_ledger.sql, sql/player_version.sql, sql/rating_checkpoints.sql 실행 후 적용)
+-- 경기 상태, 참가 선수 점수/티어/승/연승/부스트, 점수 원장을 하나의 트랜잭션으로 기록한다.
+-- p_expected_status가 주어지면 현재 경기 상태가 일치할 때만 반영하고, 아니면 false를 반환한다.
+-- p_players 행에 version이 있으면 선수 행 버전이 모두 일치할 때만 반영하고, 아니면 false를 반환한다.
+-- 경기 날짜 이후의 레이팅 체크포인트는 지운다 (다음 부분 재생 때 다시 계산).
+-- p_seed({"date", "states"})가 주어지면 재생 시작 점수 행에 아직 없는 선수만 추가한다 (기존 값 유지).
+drop function if exists public.finalize_match(bigint, jsonb, jsonb, jsonb, text);
+create or replace function public.finalize_match(
+  p_match_id bigint,
+  p_match jsonb,
+  p_players jsonb,
+  p_ledger jsonb,
+  p_expected_status text default null,
+  p_seed jsonb default null
+) returns boolean
+language plpgsql
+as $$
+declare
+  v_status text;
+  v_date text;
+begin
+  select status, date into v_status, v_date
+  from public.matches
+  where id = p_match_id
+  for update;
+
+  if not found then
+    return false;
+  end if;
+  if p_expected_status is not null and v_status is distinct from p_expected_status then
+    return false;
+  end if;
+
+  -- 선수 행을 사번 순으로 잠근 뒤 버전 확인 (교착 방지)
+  perform 1
+  from public.players p
+  where p.emp_id in (
+    select r.emp_id from jsonb_to_recordset(coalesce(p_players, '[]'::jsonb)) as r(emp_id text)
+  )
+  order by p.emp_id
+  for update;
+
+  if exists (
+    select 1
+    from jsonb_to_recordset(coalesce(p_players, '[]'::jsonb)) as r(emp_id text, version bigint)
+    left join public.players p on p.emp_id = r.emp_id
+    where r.version is not null and p.version is distinct from r.version
+  ) then
+    return false;
+  end if;
+
+  update public.players p
+  set score = r.score,
+      tier = r.tier,
+      match_count = r.match_count,
+      win_count = r.win_count,
+      streak = r.streak,
+      boost_games = r.boost_games
+  from jsonb_to_recordset(coalesce(p_players, '[]'::jsonb)) as r(
+    emp_id text, score integer, tier text, match_count integer,
+    win_count integer, streak integer, boost_games integer
+  )
+  where p.emp_id = r.emp_id;
+
+  delete from public.score_ledger where match_id = p_match_id;
+  insert into public.score_ledger (match_id, emp_id, score_delta, is_win, streak_before, boost_used)
+  select p_match_id, r.emp_id, r.score_delta, r.is_win, r.streak_before, r.boost_used
+  from jsonb_to_recordset(coalesce(p_ledger, '[]'::jsonb)) as r(
+    emp_id text, score_delta integer, is_win boolean, streak_before integer, boost_used boolean
+  );
+
+  update public.matches m
+  set score1 = case when p_match ? 'score1' then (p_match->>'score1')::integer else m.score1 end,
+      score2 = case when p_match ? 'score2' then (p_match->>'score2')::integer else m.score2 end,
+      change1 = case when p_match ? 'change1' then (p_match->>'change1')::integer else m.change1 end,
+      change2 = case when p_match ? 'change2' then (p_match->>'change2')::integer else m.change2 end,
+      status = case when p_match ? 'status' then p_match->>'status' else m.status end,
+      input_by = case when p_match ? 'input_by' then p_match->>'input_by' else m.input_by end,
+      input_timestamp = case when p_match ? 'input_timestamp' then p_match->>'input_timestamp' else m.input_timestamp end,
+      approved_by = case when p_match ? 'approved_by' then p_match->>'approved_by' else m.approved_by end,
+      approved_timestamp = case when p_match ? 'approved_timestamp' then p_match->>'approved_timestamp' else m.approved_timestamp end
+  where m.id = p_match_id;
+
+  delete from public.rating_checkpoints where date >= v_date;
+
+  if p_seed is not null then
+    insert into public.rating_checkpoints (date, states)
+    values (p_seed->>'date', p_seed->'states')
+    on conflict (date) do update set states = excluded.states || public.rating_checkpoints.states;
+  end if;
+
+  return true;
+end;
+$$;
@@ -0,0 +1,24 @@
+-- Supabase SQL: 선수 행 버전 (낙관적 동시성 제어)
+-- players가 갱신될 때마다 version을 1 증가시킨다.
+-- 점수 반영은 읽은 시점의 version과 일치할 때만 기록하고(compare-and-swap),
+-- 다른 워커가 먼저 갱신했으면 최신 값으로 다시 계산한다.
+alter table public.players
+  add column if not exists version bigint not null default 0;
+
+create or replace function public.bump_player_version()
+returns trigger
+language plpgsql
+as $$
+begin
+  -- 직접 version을 지정한 갱신(복원 등)은 그대로 둔다
+  if new.version is not distinct from old.version then
+    new.version := old.version + 1;
+  end if;
+  return new;
+end;
+$$;
+
+drop trigger if exists players_version_trg on public.players;
+create trigger players_version_trg
+  before update on public.players
+  for each row execute function public.bump_player_version();
@@ -0,0 +1,11 @@
+-- Supabase SQL: 레이팅 체크포인트 테이블
+-- 날짜별로 그 날짜 경기까지 반영된 전체 선수 레이팅을 저장한다. (states: 사번 → [score, match_count, win_count, streak, boost_games])
+-- date '0000-00-00' 행은 재생 시작 점수. 과거 경기를 수정하면 가장 가까운 이전 체크포인트부터 다시 재생한다.
+create table if not exists public.rating_checkpoints (
+  date text primary key,
+  states jsonb not null
+);
+
+-- 체크포인트는 경기 확정/재생 함수(finalize_match, rerate_match)의 트랜잭션 안에서만 기록 · 삭제한다.
+-- 이전 버전에서 만든 조회 경로용 저장 함수는 제거 (무효화와 경합해 오래된 체크포인트를 남길 수 있음)
+drop function if exists public.save_rating_checkpoints(jsonb, bigint);
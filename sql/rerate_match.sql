@@ -0,0 +1,100 @@
+-- Supabase SQL: 과거 경기 수정 + 부분 재생 결과 기록 함수
+-- (sql/score_ledger.sql, sql/player_version.sql, sql/rating_checkpoints.sql 실행 후 적용)
+-- 이후 날짜에 확정 경기가 있는 경기를 수정하면, DataManager가 가장 가까운 체크포인트부터 재생한 결과를
+-- 하나의 트랜잭션으로 기록한다. 경기 상태가 p_expected_status이고 p_versions(사번 → 버전)의
+-- 선수 행 버전이 모두 일치할 때만 반영하고, 아니면 false를 반환한다.
+create or replace function public.rerate_match(
+  p_match_id bigint,
+  p_match jsonb,
+  p_expected_status text,
+  p_players jsonb,
+  p_versions jsonb,
+  p_matches jsonb,
+  p_ledger jsonb,
+  p_checkpoints jsonb,
+  p_replace_from text
+) returns boolean
+language plpgsql
+as $$
+declare
+  v_status text;
+begin
+  select status into v_status
+  from public.matches
+  where id = p_match_id
+  for update;
+
+  if not found then
+    return false;
+  end if;
+  if p_expected_status is not null and v_status is distinct from p_expected_status then
+    return false;
+  end if;
+
+  -- 선수 행을 사번 순으로 잠근 뒤 버전 확인 (교착 방지)
+  perform 1
+  from public.players p
+  where p.emp_id in (select jsonb_object_keys(coalesce(p_versions, '{}'::jsonb)))
+  order by p.emp_id
+  for update;
+
+  if exists (
+    select 1
+    from jsonb_each_text(coalesce(p_versions, '{}'::jsonb)) as v(emp_id, version)
+    left join public.players p on p.emp_id = v.emp_id
+    where p.version is distinct from v.version::bigint
+  ) then
+    return false;
+  end if;
+
+  update public.matches m
+  set score1 = case when p_match ? 'score1' then (p_match->>'score1')::integer else m.score1 end,
+      score2 = case when p_match ? 'score2' then (p_match->>'score2')::integer else m.score2 end,
+      change1 = case when p_match ? 'change1' then (p_match->>'change1')::integer else m.change1 end,
+      change2 = case when p_match ? 'change2' then (p_match->>'change2')::integer else m.change2 end,
+      status = case when p_match ? 'status' then p_match->>'status' else m.status end,
+      input_by = case when p_match ? 'input_by' then p_match->>'input_by' else m.input_by end,
+      input_timestamp = case when p_match ? 'input_timestamp' then p_match->>'input_timestamp' else m.input_timestamp end,
+      approved_by = case when p_match ? 'approved_by' then p_match->>'approved_by' else m.approved_by end,
+      approved_timestamp = case when p_match ? 'approved_timestamp' then p_match->>'approved_timestamp' else m.approved_timestamp end
+  where m.id = p_match_id;
+
+  update public.players p
+  set score = r.score,
+      tier = r.tier,
+      match_count = r.match_count,
+      win_count = r.win_count,
+      streak = r.streak,
+      boost_games = r.boost_games
+  from jsonb_to_recordset(coalesce(p_players, '[]'::jsonb)) as r(
+    emp_id text, score integer, tier text, match_count integer,
+    win_count integer, streak integer, boost_games integer
+  )
+  where p.emp_id = r.emp_id;
+
+  update public.matches m
+  set change1 = r.change1,
+      change2 = r.change2
+  from jsonb_to_recordset(coalesce(p_matches, '[]'::jsonb)) as r(id bigint, change1 integer, change2 integer)
+  where m.id = r.id;
+
+  delete from public.score_ledger l
+  where l.match_id = p_match_id
+     or l.match_id in (
+       select r.match_id from jsonb_to_recordset(coalesce(p_ledger, '[]'::jsonb)) as r(match_id bigint)
+     );
+  insert into public.score_ledger (match_id, emp_id, score_delta, is_win, streak_before, boost_used)
+  select r.match_id, r.emp_id, r.score_delta, r.is_win, r.streak_before, r.boost_used
+  from jsonb_to_recordset(coalesce(p_ledger, '[]'::jsonb)) as r(
+    match_id bigint, emp_id text, score_delta integer, is_win boolean, streak_before integer, boost_used boolean
+  );
+
+  delete from public.rating_checkpoints where date >= p_replace_from;
+  insert into public.rating_checkpoints (date, states)
+  select r.date, r.states
+  from jsonb_to_recordset(coalesce(p_checkpoints, '[]'::jsonb)) as r(date text, states jsonb)
+  on conflict (date) do update set states = excluded.states;
+
+  return true;
+end;
+$$;
@@ -0,0 +1,16 @@
+-- Supabase SQL: 점수 원장 테이블 생성
+-- 경기 확정 시 선수별로 실제 반영된 변동을 기록하고, 롤백 시 그대로 되돌린다.
+create table if not exists public.score_ledger (
+  match_id bigint not null references public.matches (id) on delete cascade,
+  emp_id text not null,
+  score_delta integer not null,
+  is_win boolean not null,
+  streak_before integer not null default 0,
+  boost_used boolean not null default false,
+  created_at timestamptz not null default now(),
+  primary key (match_id, emp_id)
+);
+
+create index if not exists score_ledger_emp_id_idx on public.score_ledger (emp_id);
+
+alter table public.score_ledger disable row level security;
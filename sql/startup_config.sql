@@ -0,0 +1,16 @@
+-- Supabase SQL: 시작 설정 일괄 조회 함수
+-- DataManager 시작 시 필요한 점수/티어 규칙, 슈퍼관리자 설정, 데이터 버전, 선수 유무를
+-- 한 번의 RPC로 돌려준다 (항목별 조회 5회 → 1회).
+create or replace function public.get_startup_config()
+returns jsonb
+language sql
+stable
+as $$
+  select jsonb_build_object(
+    'score_rules', coalesce((select jsonb_object_agg(key, value) from public.score_rules), '{}'::jsonb),
+    'tier_rules', coalesce((select jsonb_object_agg(tier_name, threshold) from public.tier_rules), '{}'::jsonb),
+    'super_admin', (select value from public.settings where key = 'super_admin'),
+    'data_version', coalesce((select value::bigint from public.settings where key = 'data_version'), 0),
+    'has_players', exists (select 1 from public.players)
+  );
+$$;
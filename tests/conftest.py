@@ -0,0 +1,44 @@
+"""
+테스트 공용 픽스처
+임시 디렉터리의 SQLite DB를 쓰는 DataManager (Supabase 없이 실행)
+"""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+
+
+@pytest.fixture
+def dm(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DB_BACKEND", "sqlite")
+    monkeypatch.setattr(config, "DB_FILE", str(tmp_path / "knoc_badminton.db"))
+    monkeypatch.setattr(config, "BACKUP_DIR", str(tmp_path / "backups"))
+    monkeypatch.setattr(config, "DATA_FILE", str(tmp_path / "data.json"))
+    monkeypatch.setattr(config, "CACHE_NOTIFY_FILE", str(tmp_path / "cache_notify.db"))
+    from data_manager import DataManager
+    manager = DataManager()
+    yield manager
+    manager.db.close()
+
+
+@pytest.fixture
+def boosted_dm(dm):
+    """2024년 대회 경기가 확정된 DataManager (그해 처음 뛴 선수들이라 부스트 승리 포함)"""
+    rng = random.Random(7)
+    emp_ids = [f"N{i:02d}" for i in range(8)]
+    for i, eid in enumerate(emp_ids):
+        dm.add_player(eid, f"신규{i}", score=1000 + 40 * (i % 3))
+    for date in ("2024-03-01", "2024-03-15"):
+        dm.generate_tournament(date, emp_ids)
+        for idx, _ in enumerate(dm.history[date]):
+            if rng.random() < 0.5:
+                score1, score2 = 21, rng.randint(0, 19)
+            else:
+                score1, score2 = rng.randint(0, 19), 21
+            dm.admin_force_confirm(date, idx, score1, score2, "test")
+    return dm
@@ -0,0 +1,70 @@
+"""API 서버 읽기 경로: 비동기 적재 스냅샷과 쓰기와 겹치지 않는 비동기 재로딩"""
+import asyncio
+import threading
+
+from data_manager import DataManager
+from database import open_async_database
+
+
+def _async_dm():
+    async def create():
+        return await DataManager.create_async(open_async_database())
+    return asyncio.run(create())
+
+
+def test_snapshot_async_reloads_after_invalidation(dm):
+    emp_ids = [f"A{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    dm.generate_tournament("2024-07-01", list(emp_ids))
+    dm.admin_force_confirm("2024-07-01", 0, 21, 8, "test")
+
+    adm = _async_dm()
+    adm._invalidate_cache()
+    sync_trips, async_trips = adm.db.round_trips, adm.adb.round_trips
+    snap = asyncio.run(adm.snapshot_async())
+
+    # 동기 DB는 쓰지 않고 비동기 DB로만 다시 적재
+    assert adm.db.round_trips == sync_trips
+    assert adm.adb.round_trips > async_trips
+    assert set(snap.players) == set(emp_ids)
+    assert [m["id"] for m in snap.history["2024-07-01"]] == [m["id"] for m in dm.history["2024-07-01"]]
+    assert snap.aggregates["A0"]["wins"] + snap.aggregates["A0"]["losses"] == 1
+    assert adm._aggregate_cache is snap.aggregates
+    adm.db.close()
+    adm.adb.db.close()
+
+
+def test_reload_async_waits_for_in_flight_match_op(dm, monkeypatch):
+    emp_ids = [f"B{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    dm.generate_tournament("2024-07-01", list(emp_ids))
+
+    adm = _async_dm()
+    entered, release = threading.Event(), threading.Event()
+    commit = adm._commit_with_retry
+
+    def slow_commit(*args, **kwargs):
+        entered.set()
+        release.wait(5)
+        return commit(*args, **kwargs)
+
+    monkeypatch.setattr(adm, "_commit_with_retry", slow_commit)
+    confirm = threading.Thread(target=adm.admin_force_confirm, args=("2024-07-01", 0, 21, 5, "admin"))
+    confirm.start()
+    assert entered.wait(5)
+
+    async def reload_while_writing():
+        task = asyncio.ensure_future(adm.reload_async())
+        await asyncio.sleep(0.3)
+        pending = not task.done()  # 확정이 끝날 때까지 캐시를 비우지 않음
+        release.set()
+        await task
+        return pending
+
+    assert asyncio.run(reload_while_writing())
+    confirm.join(5)
+    assert adm.history["2024-07-01"][0]["status"] == "done"
+    adm.db.close()
+    adm.adb.db.close()
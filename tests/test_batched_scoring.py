@@ -0,0 +1,39 @@
+"""경기 확정의 선수 읽기/쓰기 일괄 처리: 참가 선수 수와 무관하게 고정 왕복 횟수"""
+
+
+def _tournament(dm):
+    emp_ids = [f"K{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    dm.generate_tournament("2024-12-07", emp_ids)
+    dm.admin_force_confirm("2024-12-07", 0, 21, 6, "test")  # 재생 시작 점수 조회는 첫 확정 때 한 번
+    return emp_ids
+
+
+def test_confirm_reads_players_once_and_commits_once(dm, monkeypatch):
+    emp_ids = _tournament(dm)
+    reads = []
+    get_players = dm.db.get_players
+
+    def counted(ids, *args, **kwargs):
+        reads.append(sorted(ids))
+        return get_players(ids, *args, **kwargs)
+
+    monkeypatch.setattr(dm.db, "get_players", counted)
+    trips = dm.db.round_trips
+    assert dm.admin_force_confirm("2024-12-07", 1, 15, 21, "test")
+
+    assert reads == [sorted(emp_ids)]
+    # 선수 일괄 조회 + 확정 트랜잭션 + 데이터 버전 증가
+    assert dm.db.round_trips - trips == 3
+
+
+def test_upsert_players_writes_all_rows_in_one_round_trip(dm):
+    _tournament(dm)
+    rows = [{"emp_id": f"K{i}", "name": f"K{i}", "score": 1200 + i, "tier": "골드"} for i in range(4)]
+    trips = dm.db.round_trips
+
+    assert dm.db.upsert_players(rows)
+    assert dm.db.round_trips - trips == 1
+    stored = {r["emp_id"]: (r["score"], r["tier"]) for r in dm.db.get_players([r["emp_id"] for r in rows])}
+    assert stored == {r["emp_id"]: (r["score"], r["tier"]) for r in rows}
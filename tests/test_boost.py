@@ -0,0 +1,40 @@
+"""부스트 판정은 실시간 확정과 재생 모두 경기 날짜의 달 기준이어야 한다"""
+import random
+
+
+def _confirm_past_year(dm):
+    """2024년에 처음 뛴 선수들의 2024년 경기를 지금 확정 (확정 시점은 다음 해 이후)"""
+    rng = random.Random(11)
+    emp_ids = [f"P{i:02d}" for i in range(8)]
+    for i, eid in enumerate(emp_ids):
+        dm.add_player(eid, f"과거{i}", score=1000 + 40 * (i % 3))
+    for date in ("2024-03-02", "2024-03-16", "2024-04-06"):
+        dm.generate_tournament(date, list(emp_ids))
+        for idx, _ in enumerate(dm.history[date]):
+            if rng.random() < 0.5:
+                score1, score2 = 21, rng.randint(0, 19)
+            else:
+                score1, score2 = rng.randint(0, 19), 21
+            dm.admin_force_confirm(date, idx, score1, score2, "test")
+    return dm
+
+
+def test_past_year_match_uses_match_month_boost(dm):
+    _confirm_past_year(dm)
+    # 첫 경기가 2024년 3월이라 2024년 경기의 승리는 부스트 대상 (오늘 기준이면 연도가 달라 0)
+    assert any(p.boost_games > 0 for p in dm.players.values())
+    assert dm.get_boost_multiplier("P00") == 1.0  # 이번 달 기준 배수는 그대로
+
+
+def test_past_year_live_scores_match_replay(dm):
+    _confirm_past_year(dm)
+    live = {eid: (p.score, p.boost_games) for eid, p in dm.players.items()}
+
+    states = dm.rating_states_at(max(dm.history))
+    assert {eid: (s.score, s.boost_games) for eid, s in states.items()} == live
+
+    # 과거 경기 수정으로 이후 날짜를 다시 재생해도 수정하지 않은 선수 점수는 재생과 같아야 한다
+    dm.admin_force_confirm("2024-03-02", 0, 21, 3, "admin")
+    assert dm.cache_stats["rerates"] == 1
+    states = dm.rating_states_at(max(dm.history))
+    assert {eid: s.score for eid, s in states.items()} == {eid: p.score for eid, p in dm.players.items()}
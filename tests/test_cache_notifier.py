@@ -0,0 +1,41 @@
+"""CacheWatcher.check_async는 알림 카운터 조회(SQLite)를 이벤트 루프 밖에서 실행해야 한다"""
+import asyncio
+import threading
+
+from cache_notifier import DATA_CHANNEL, CacheNotifier, CacheWatcher
+
+
+class FakeDM:
+    def __init__(self):
+        self.refreshes = 0
+
+    def add_write_listener(self, listener):
+        pass
+
+    async def refresh_if_stale_async(self):
+        self.refreshes += 1
+        return True
+
+
+def test_check_async_reads_counters_off_event_loop(tmp_path):
+    notifier = CacheNotifier(str(tmp_path / "notify.db"))
+    watcher = CacheWatcher(FakeDM(), notifier, db_check_interval=3600)
+    notifier.publish(DATA_CHANNEL)  # 다른 워커의 쓰기 알림
+
+    threads = []
+    versions = notifier.versions
+
+    def recording_versions():
+        threads.append(threading.get_ident())
+        return versions()
+
+    notifier.versions = recording_versions
+
+    async def run():
+        return threading.get_ident(), await watcher.check_async()
+
+    loop_thread, reloaded = asyncio.run(run())
+    assert reloaded
+    assert watcher.dm.refreshes == 1
+    assert threads and loop_thread not in threads
+    notifier.close()
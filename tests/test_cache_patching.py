@@ -0,0 +1,53 @@
+"""쓰기 후 캐시 부분 갱신: 전체 재적재 없이 바뀐 선수/경기만 새 사본으로 게시"""
+from data_manager import DataManager
+
+
+def _tournament(dm):
+    emp_ids = [f"C{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    dm.generate_tournament("2024-08-01", emp_ids)
+    _ = dm.players, dm.history
+    return emp_ids
+
+
+def _player_fields(players):
+    # version은 마지막으로 읽은 행 버전 (점수 기록 전에는 항상 DB에서 다시 읽으므로 비교하지 않음)
+    return {eid: {k: v for k, v in vars(p).items() if k != "version"} for eid, p in players.items()}
+
+
+def _rebuilds(dm):
+    return dm.cache_stats["players_rebuilds"], dm.cache_stats["history_rebuilds"]
+
+
+def test_writes_patch_caches_without_rebuilding(dm):
+    emp_ids = _tournament(dm)
+    rebuilds = _rebuilds(dm)
+
+    dm.submit_score_for_approval("2024-08-01", 0, 21, 11, emp_ids[0])
+    dm.approve_match("2024-08-01", 0, emp_ids[2])
+    dm.update_player_info(emp_ids[3], new_name="바뀐이름")
+    dm.add_player("C9", "새선수")
+    dm.delete_match_from_history("2024-08-01", 1)
+
+    assert _rebuilds(dm) == rebuilds
+    fresh = DataManager()
+    assert fresh.history == dm.history
+    assert _player_fields(fresh.players) == _player_fields(dm.players)
+
+
+def test_published_snapshot_is_not_mutated(dm):
+    emp_ids = _tournament(dm)
+    before = dm.snapshot()
+    scores = {eid: p.score for eid, p in before.players.items()}
+    match_count = len(before.history["2024-08-01"])
+
+    dm.admin_force_confirm("2024-08-01", 0, 21, 4, "test")
+    dm.delete_match_from_history("2024-08-01", 1)
+
+    # 이전 스냅샷은 그대로, 새 값은 새 사본에만
+    assert {eid: p.score for eid, p in before.players.items()} == scores
+    assert len(before.history["2024-08-01"]) == match_count
+    assert before.history["2024-08-01"][0]["status"] == "pending"
+    assert dm.history["2024-08-01"][0]["status"] == "done"
+    assert dm.players[emp_ids[0]].score != scores[emp_ids[0]]
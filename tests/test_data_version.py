@@ -0,0 +1,35 @@
+"""데이터 버전은 실제로 기록된 쓰기에서만 올라가야 한다 (다른 워커/세션의 전체 재로딩 방지)"""
+from data_manager import DataManager
+
+
+def _pending_match(dm):
+    emp_ids = [f"V{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    dm.generate_tournament("2024-05-01", emp_ids)
+    dm.submit_score_for_approval("2024-05-01", 0, 21, 10, "V0")
+    return "2024-05-01", 0
+
+
+def test_committed_write_bumps_version(dm):
+    date, idx = _pending_match(dm)
+    version = dm.db.get_data_version()
+
+    assert dm.approve_match(date, idx, "V2")
+    assert dm.db.get_data_version() == version + 1
+    assert dm.data_version == version + 1
+
+
+def test_rejected_writes_do_not_bump_version(dm):
+    date, idx = _pending_match(dm)
+    other = DataManager()  # 같은 DB를 쓰는 다른 세션
+    assert other.approve_match(date, idx, "V2")
+    version = dm.db.get_data_version()
+
+    # 이미 확정된 경기에 대한 중복 승인: 캐시가 오래돼 시도는 하지만 DB 상태 확인에서 거절
+    assert not dm.approve_match(date, idx, "V3")
+    # 변경 없는 쓰기 · 잘못된 경기 번호
+    dm.update_player_info("V0")
+    assert not dm.approve_match(date, 99, "V3")
+
+    assert dm.db.get_data_version() == version
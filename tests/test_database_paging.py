@@ -0,0 +1,75 @@
+"""range 페이지 전체 조회: 서버 응답 상한(max-rows)이 page_size보다 작아도 누락이 없어야 한다"""
+import asyncio
+
+import pytest
+
+import database
+
+ROWS = [{"id": i} for i in range(2350)]
+
+
+class FakeQuery:
+    """supabase 쿼리 빌더 흉내 (range 요청을 받아도 최대 cap행만 응답)"""
+
+    def __init__(self, cap, with_count):
+        self.cap = cap
+        self.with_count = with_count
+        self.start, self.end = 0, len(ROWS) - 1
+
+    def range(self, start, end):
+        self.start, self.end = start, end
+        return self
+
+    def execute(self):
+        data = ROWS[self.start:min(self.end + 1, self.start + self.cap)]
+        return type("Result", (), {"data": data, "count": len(ROWS) if self.with_count else None})()
+
+
+class FakeResponse:
+    def __init__(self, data, start, total):
+        self._data = data
+        end = start + len(data) - 1
+        self.headers = {"Content-Range": f"{start}-{end}/{total if total is not None else '*'}"}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+class FakeHttp:
+    """PostgREST GET 흉내 (Range 헤더를 받아도 최대 cap행만 응답)"""
+
+    def __init__(self, cap, with_count=True):
+        self.cap = cap
+        self.with_count = with_count
+
+    async def get(self, path, params=None, headers=None):
+        start, end = (int(x) for x in headers["Range"].split("-"))
+        data = ROWS[start:min(end + 1, start + self.cap)]
+        total = len(ROWS) if self.with_count and "Prefer" in headers else None
+        return FakeResponse(data, start, total)
+
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setattr(database, "_get_supabase_client", lambda: None)
+    return database.Database()
+
+
+@pytest.mark.parametrize("with_count", [True, False])
+@pytest.mark.parametrize("cap", [300, 1000, 5000])
+def test_fetch_all_reads_every_row_under_server_cap(db, cap, with_count):
+    rows = db._fetch_all(lambda count: FakeQuery(cap, with_count and count), page_size=1000)
+    assert rows == ROWS
+
+
+@pytest.mark.parametrize("with_count", [True, False])
+@pytest.mark.parametrize("cap", [300, 1000, 5000])
+def test_async_fetch_all_reads_every_row_under_server_cap(cap, with_count):
+    adb = database.AsyncDatabase.__new__(database.AsyncDatabase)
+    adb.client = FakeHttp(cap, with_count)
+    adb.round_trips = 0
+    rows = asyncio.run(adb._fetch_all("matches", {"order": "id.asc"}, page_size=1000))
+    assert rows == ROWS
@@ -0,0 +1,58 @@
+"""경기 확정 트랜잭션: 경기 상태 · 선수 점수 · 점수 원장이 모두 반영되거나 하나도 반영되지 않는다"""
+from data_manager import SCORE_COLUMNS
+
+
+def _setup(dm):
+    emp_ids = [f"T{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    dm.generate_tournament("2025-01-11", emp_ids)
+    match_id = dm.history["2025-01-11"][0]["id"]
+    rows = dm.db.get_players(emp_ids, columns=SCORE_COLUMNS)
+    return match_id, rows
+
+
+def _snapshot(dm, match_id):
+    conn = dm.db.conn
+    return (
+        dict(conn.execute("SELECT status, score1, score2 FROM matches WHERE id = ?", (match_id,)).fetchone()),
+        sorted(tuple(r) for r in conn.execute("SELECT emp_id, score, version FROM players")),
+        conn.execute("SELECT COUNT(*) FROM score_ledger").fetchone()[0],
+    )
+
+
+def _args(rows, score_delta=10):
+    player_rows = [{**r, "score": r["score"] + score_delta} for r in rows]
+    ledger = [{"emp_id": r["emp_id"], "score_delta": score_delta, "is_win": True,
+               "streak_before": 0, "boost_used": False} for r in rows]
+    return player_rows, ledger
+
+
+def test_finalize_writes_everything_together(dm):
+    match_id, rows = _setup(dm)
+    player_rows, ledger = _args(rows)
+
+    assert dm.db.finalize_match(match_id, {"status": "done", "score1": 21, "score2": 9},
+                                player_rows, ledger, expected_status="pending")
+    match, players, ledger_count = _snapshot(dm, match_id)
+    assert match == {"status": "done", "score1": 21, "score2": 9}
+    assert {emp_id: score for emp_id, score, _ in players} == {r["emp_id"]: r["score"] + 10 for r in rows}
+    assert ledger_count == 4
+
+
+def test_rejected_or_failed_finalize_leaves_no_trace(dm):
+    match_id, rows = _setup(dm)
+    before = _snapshot(dm, match_id)
+    player_rows, ledger = _args(rows)
+    fields = {"status": "done", "score1": 21, "score2": 9}
+
+    # 경기 상태 불일치
+    assert not dm.db.finalize_match(match_id, fields, player_rows, ledger, expected_status="pending_approval")
+    # 선수 행 버전 불일치 (다른 워커가 먼저 갱신)
+    stale = [{**r, "version": r["version"] - 1} for r in player_rows]
+    assert not dm.db.finalize_match(match_id, fields, stale, ledger, expected_status="pending")
+    # 선수 점수 기록 후 원장 기록 실패 → 전체 롤백
+    broken = ledger[:3] + [{**ledger[3], "emp_id": None}]
+    assert not dm.db.finalize_match(match_id, fields, player_rows, broken, expected_status="pending")
+
+    assert _snapshot(dm, match_id) == before
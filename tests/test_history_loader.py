@@ -0,0 +1,36 @@
+"""경기 이력 일괄 적재: 날짜 수와 무관하게 한 번의 조회로 날짜별 이력을 만든다"""
+import config
+from data_manager import DataManager
+
+
+def _tournaments(dm, dates):
+    emp_ids = [f"H{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    for date in dates:
+        dm.generate_tournament(date, emp_ids)
+
+
+def test_bulk_load_is_one_round_trip_for_many_dates(dm):
+    dates = [f"2024-{m:02d}-{d:02d}" for m in range(1, 7) for d in (3, 17)]
+    _tournaments(dm, dates)
+
+    fresh = DataManager()
+    history = fresh.history
+
+    assert fresh.cache_stats["last_history_round_trips"] == 1
+    assert sorted(history) == dates
+    for date in dates:
+        ids = [m["id"] for m in history[date]]
+        assert ids == sorted(ids)
+
+
+def test_bulk_load_matches_per_date_load(dm, monkeypatch):
+    _tournaments(dm, ["2024-01-05", "2024-02-09", "2024-03-01"])
+    dm.admin_force_confirm("2024-02-09", 1, 21, 13, "test")
+    bulk = DataManager().history
+
+    monkeypatch.setattr(config, "HISTORY_BULK_LOAD", False)
+    per_date = DataManager()
+    assert per_date.history == bulk
+    assert per_date.cache_stats["last_history_round_trips"] == 1 + len(bulk)  # 날짜 목록 + 날짜별
@@ -0,0 +1,17 @@
+"""점수 원장 조회: 필요한 컬럼만 읽는다"""
+from database import LEDGER_COLUMNS
+
+
+def test_ledger_entries_project_explicit_columns(dm):
+    emp_ids = [f"G{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    dm.generate_tournament("2024-02-01", emp_ids)
+    dm.admin_force_confirm("2024-02-01", 0, 21, 9, "test")
+    match_id = dm.history["2024-02-01"][0]["id"]
+
+    entries = dm.db.get_ledger_entries(match_id)
+    assert len(entries) == 4
+    assert all(tuple(e) == LEDGER_COLUMNS for e in entries)  # created_at 제외
+    assert all(isinstance(e["is_win"], bool) for e in entries)
+    assert dm.db.get_ledger_entries_for([match_id]) == entries
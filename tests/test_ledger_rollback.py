@@ -0,0 +1,49 @@
+"""점수 원장 기반 롤백: 확정 후 초기화하면 선수 상태가 확정 전과 정확히 같아야 한다"""
+
+STATE = ("score", "tier", "match_count", "win_count", "streak", "boost_games")
+
+
+def _state(dm):
+    return {eid: tuple(getattr(p, k) for k in STATE) for eid, p in dm.players.items()}
+
+
+def _tournament(dm):
+    emp_ids = [f"R{i}" for i in range(4)]
+    for i, eid in enumerate(emp_ids):
+        dm.add_player(eid, eid, score=1000 + 150 * i)
+    dm.generate_tournament("2024-11-02", emp_ids)
+    return emp_ids
+
+
+def _ledger_count(dm, match_id):
+    return dm.db.conn.execute("SELECT COUNT(*) FROM score_ledger WHERE match_id = ?", (match_id,)).fetchone()[0]
+
+
+def test_reset_restores_exact_state_and_clears_ledger(dm):
+    _tournament(dm)
+    dm.admin_force_confirm("2024-11-02", 0, 21, 14, "test")
+    before = _state(dm)
+    match_id = dm.history["2024-11-02"][1]["id"]
+
+    assert dm.admin_force_confirm("2024-11-02", 1, 8, 21, "test")
+    assert _ledger_count(dm, match_id) == 4
+    dm.delete_match_from_history("2024-11-02", 1, keep_match=True)
+
+    assert _state(dm) == before
+    assert _ledger_count(dm, match_id) == 0
+    m = dm.history["2024-11-02"][1]
+    assert (m["status"], m["score1"], m["score2"], m["change1"], m["change2"]) == ("pending", 0, 0, 0, 0)
+
+
+def test_rollback_subtracts_recorded_delta_after_manual_edit(dm):
+    emp_ids = _tournament(dm)
+    start = dm.players[emp_ids[0]].score
+    dm.admin_force_confirm("2024-11-02", 0, 21, 10, "test")
+    delta = dm.players[emp_ids[0]].score - start
+
+    dm.update_player_info(emp_ids[0], new_score=dm.players[emp_ids[0]].score + 50)  # 경기 외 조정
+    dm.delete_match_from_history("2024-11-02", 0, keep_match=True)
+
+    # 원장에 기록된 변동만 되돌리고 관리자 조정은 유지
+    assert dm.players[emp_ids[0]].score == start + 50
+    assert delta != 0
@@ -0,0 +1,102 @@
+"""경기 중재 화면의 수동 경기 추가는 DataManager 쓰기로 기록되고 공유 캐시를 직접 바꾸지 않아야 한다"""
+import contextlib
+import importlib
+import sys
+import types
+
+import rating_engine
+
+
+class FakeStreamlit(types.ModuleType):
+    """page_mediate가 쓰는 streamlit 호출만 흉내 (수동 경기 추가 폼 제출)"""
+
+    def __init__(self, date, picks):
+        super().__init__("streamlit")
+        self.session_state = {"role": "admin", "emp_id": "admin"}
+        self._date = date
+        self._picks = picks  # 선택 상자 key → 사번
+        self.messages = []
+
+    def selectbox(self, label, options, key=None):
+        if key is None:
+            return self._date
+        return next(o for o in options if o.endswith(f"({self._picks[key]})"))
+
+    def columns(self, n):
+        return [contextlib.nullcontext() for _ in range(n)]
+
+    def expander(self, *args, **kwargs):
+        return contextlib.nullcontext()
+
+    def form(self, *args, **kwargs):
+        return contextlib.nullcontext()
+
+    def number_input(self, label, value=0, **kwargs):
+        return value
+
+    def text_input(self, label, value="", **kwargs):
+        return value
+
+    def button(self, *args, **kwargs):
+        return False
+
+    def form_submit_button(self, *args, **kwargs):
+        return True
+
+    def success(self, text):
+        self.messages.append(("success", text))
+
+    def error(self, text):
+        self.messages.append(("error", text))
+
+    def markdown(self, *args, **kwargs):
+        pass
+
+    info = markdown
+
+    def rerun(self):
+        pass
+
+
+def _render_manual_match(dm, monkeypatch, date, emp_ids):
+    picks = {f"manual_p{i + 1}": eid for i, eid in enumerate(emp_ids)}
+    st = FakeStreamlit(date, picks)
+    monkeypatch.setitem(sys.modules, "streamlit", st)
+    monkeypatch.delitem(sys.modules, "pages.page_mediate", raising=False)
+    importlib.import_module("pages.page_mediate").render(dm)
+    return st
+
+
+def test_manual_match_goes_through_data_manager(dm, monkeypatch):
+    emp_ids = [f"M{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, f"선수{eid}")
+    dm.generate_tournament("2024-06-01", list(emp_ids))
+    for idx, _ in enumerate(dm.history["2024-06-01"]):
+        dm.admin_force_confirm("2024-06-01", idx, 21, 12, "test")
+    before = dm.history
+    count = len(before["2024-06-01"])
+    version = dm.data_version
+
+    st = _render_manual_match(dm, monkeypatch, "2024-06-01", emp_ids)
+
+    assert ("success", "경기 추가 완료!") in st.messages
+    assert len(before["2024-06-01"]) == count  # 이미 게시된 스냅샷은 그대로
+    added = dm.history["2024-06-01"][-1]
+    assert added["id"] and added["status"] == "pending" and added["group"] == "번외"
+    assert dm.db.get_match(added["id"], columns=("status",))["status"] == "pending"
+    assert dm.data_version == version + 1
+
+    # 대기 경기가 섞여 있어도 재생 입력 · 순위 변동 · 시뮬레이션이 동작
+    assert set(dm.get_rank_changes()) == set(emp_ids)
+    assert dm.simulate_rules([{"score_rules": dm.score_rules, "tier_rules": dm.tier_rules}], max_workers=1)
+
+
+def test_replay_input_ignores_unsaved_pending_matches():
+    history = {
+        "2024-06-01": [
+            {"team1": ["A"], "team2": ["B"], "score1": 0, "score2": 0, "status": "pending"},
+            {"id": 2, "team1": ["A"], "team2": ["B"], "score1": 21, "score2": 9, "status": "done"},
+        ]
+    }
+    assert [m.id for m in rating_engine.matches_from_history(history)] == [2]
@@ -0,0 +1,17 @@
+"""랭킹 화면 통산 전적 집계 (선수 프로필 집계와 같은 규칙)"""
+from data_manager import DataManager
+
+
+def _match(mid, score1, score2):
+    return {"id": mid, "team1": ["A", "B"], "team2": ["C", "D"], "score1": score1, "score2": score2,
+            "change1": 0, "change2": 0, "status": "done"}
+
+
+def test_tie_is_not_a_win_for_either_team():
+    history = {"2024-01-01": [_match(1, 21, 15), _match(2, 18, 18), _match(3, 10, 21)]}
+    aggregates = DataManager._build_player_aggregates(history)
+
+    for eid in ("A", "B", "C", "D"):
+        assert aggregates[eid]["wins"] == 1
+        assert aggregates[eid]["losses"] == 2
+        assert aggregates[eid]["last_wins"] == 1
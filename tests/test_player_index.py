@@ -0,0 +1,39 @@
+"""선수별 경기 인덱스: 쓰기마다 부분 갱신한 인덱스가 경기 이력에서 새로 만든 것과 같아야 한다"""
+from data_manager import DataManager
+
+
+def _index_ids(index):
+    return {eid: [(d, m["id"]) for d, m in entries] for eid, entries in index.items() if entries}
+
+
+def test_index_stays_in_sync_with_history(dm):
+    emp_ids = [f"X{i}" for i in range(6)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    dm.generate_tournament("2024-09-14", emp_ids[:4])
+    dm.generate_tournament("2024-09-01", emp_ids[2:])  # 더 이른 날짜를 나중에 생성
+    _ = dm.player_index
+    dm.admin_force_confirm("2024-09-01", 0, 21, 9, "test")
+    dm.delete_match_from_history("2024-09-14", 1)
+    assert dm.add_match("2024-09-14", emp_ids[:2], emp_ids[4:])
+
+    rebuilt = DataManager._build_player_index(dm.history)
+    assert _index_ids(dm.player_index) == _index_ids(rebuilt)
+    assert _index_ids(DataManager().player_index) == _index_ids(rebuilt)
+
+    dates = [d for d, _ in dm.player_index["X2"]]
+    assert dates == sorted(dates) and dates[0] == "2024-09-01"
+    assert dm.player_index["X2"][0][1] is dm.history["2024-09-01"][0]  # 캐시의 경기 객체 그대로
+
+
+def test_player_matches_filter_by_status(dm):
+    emp_ids = [f"Y{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    dm.generate_tournament("2024-10-05", emp_ids)
+    dm.admin_force_confirm("2024-10-05", 2, 21, 17, "test")
+
+    done = dm.get_player_matches("Y0", status="done")
+    assert [m["id"] for _, m in done] == [dm.history["2024-10-05"][2]["id"]]
+    assert len(dm.get_player_matches("Y0")) == len(dm.player_index["Y0"])
+    assert dm.get_player_matches("없는사번") == []
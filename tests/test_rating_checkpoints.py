@@ -0,0 +1,84 @@
+"""날짜 기준 랭킹(레이팅 체크포인트)이 실시간 점수와 일치하는지"""
+import json
+
+
+def test_ranking_at_latest_date_matches_live_scores(boosted_dm):
+    dm = boosted_dm
+    assert any(p.boost_games > 0 for p in dm.players.values())
+
+    latest = max(dm.history)
+    ranking = dm.ranking_at(latest)
+
+    assert {r["emp_id"]: r["score"] for r in ranking} == {eid: p.score for eid, p in dm.players.items()}
+    assert [r["rank"] for r in ranking] == list(range(1, len(ranking) + 1))
+
+
+def test_historical_rerate_keeps_ranking_in_line_with_live(boosted_dm):
+    dm = boosted_dm
+    first, latest = min(dm.history), max(dm.history)
+    m = dm.history[first][0]
+    dm.admin_force_confirm(first, 0, m["score2"], m["score1"], "admin")  # 승패 뒤집기
+
+    assert dm.cache_stats["rerates"] == 1
+    ranking = dm.ranking_at(latest)
+    assert {r["emp_id"]: r["score"] for r in ranking} == {eid: p.score for eid, p in dm.players.items()}
+
+
+def test_rank_changes_ignore_manual_score_edit(boosted_dm):
+    dm = boosted_dm
+    before = dm.get_rank_changes()
+
+    eid = next(iter(dm.players))
+    dm.update_player_info(eid, new_score=dm.players[eid].score + 300)
+
+    # 재생 시작 점수는 처음 확정될 때 확정 트랜잭션에서 고정된다 (조회 경로는 기록하지 않음)
+    assert dm.get_rank_changes() == before
+
+
+def _checkpoint_rows(dm):
+    return dm.db.conn.execute("SELECT date, states FROM rating_checkpoints ORDER BY date").fetchall()
+
+
+def test_as_of_queries_do_not_write_checkpoints(boosted_dm):
+    dm = boosted_dm
+    rows = _checkpoint_rows(dm)
+
+    for date in sorted(dm.history):
+        dm.ranking_at(date)
+    dm.get_rank_changes()
+
+    assert _checkpoint_rows(dm) == rows
+
+
+def test_ranking_keeps_every_registered_player(boosted_dm):
+    dm = boosted_dm
+    first = min(dm.history)
+    dm.add_player("LATE", "늦은 가입", score=1500)  # 경기 기록 없이 오늘 가입
+
+    assert "LATE" in {r["emp_id"] for r in dm.ranking_at(first)}
+    changes = dm.get_rank_changes()
+    assert set(changes) == set(dm.players)
+    assert changes["LATE"]["score_ch"] == 0
+
+
+def test_deleting_past_match_invalidates_later_checkpoints(boosted_dm):
+    dm = boosted_dm
+    first, latest = min(dm.history), max(dm.history)
+    dm.admin_force_confirm(first, 1, 3, 21, "admin")  # 부분 재생 → 이후 날짜 체크포인트 기록
+    assert any(date >= first for date, _ in _checkpoint_rows(dm))
+    live_before = {eid: p.score for eid, p in dm.players.items()}
+
+    dm.delete_match_from_history(first, 0)
+
+    # 남은 체크포인트는 삭제 후 이력을 재생 시작 점수부터 다시 재생한 결과와 같아야 한다
+    stored = {date: json.loads(states) for date, states in _checkpoint_rows(dm) if date >= first}
+    assert stored  # 삭제(롤백 부분 재생) 트랜잭션이 다시 기록한 체크포인트
+    dm.db.conn.execute("DELETE FROM rating_checkpoints WHERE date >= ?", (first,))
+    dm.db.conn.commit()
+    dm._rating_states = (None, {})
+    for date, states in stored.items():
+        replayed = dm.rating_states_at(date)
+        assert {eid: values[0] for eid, values in states.items()} == {eid: s.score for eid, s in replayed.items()}
+    ranking = dm.ranking_at(latest)
+    assert {r["emp_id"]: r["score"] for r in ranking} == {eid: p.score for eid, p in dm.players.items()}
+    assert {eid: p.score for eid, p in dm.players.items()} != live_before
@@ -0,0 +1,40 @@
+"""선수 행 버전 (낙관적 동시성): 읽은 뒤 다른 세션이 먼저 갱신하면 최신 값으로 다시 계산"""
+from data_manager import DataManager
+
+
+def test_update_player_checks_expected_version(dm):
+    dm.add_player("O1", "O1")
+    version = dm.db.get_player("O1")["version"]
+
+    assert dm.db.update_player("O1", expected_version=version, score=1010)
+    assert dm.db.get_player("O1")["version"] == version + 1  # 갱신마다 트리거가 1 증가
+    assert not dm.db.update_player("O1", expected_version=version, score=1020)
+    assert dm.db.get_player("O1")["score"] == 1010
+
+
+def test_confirm_recomputes_after_concurrent_player_write(dm, monkeypatch):
+    emp_ids = [f"O{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    dm.generate_tournament("2025-03-08", emp_ids)
+    other = DataManager()  # 같은 DB를 쓰는 다른 워커
+
+    fetch = dm._fetch_players
+    fetched = []
+
+    def fetch_then_interleave(ids):
+        players = fetch(ids)
+        if not fetched:
+            other.update_player_info("O0", new_score=1200)  # 읽은 직후 다른 워커가 먼저 기록
+        fetched.append(players["O0"].score)
+        return players
+
+    monkeypatch.setattr(dm, "_fetch_players", fetch_then_interleave)
+    assert dm.admin_force_confirm("2025-03-08", 0, 21, 11, "admin")
+
+    assert fetched == [1000, 1200]
+    assert dm.cache_stats["score_conflicts"] == 1
+    ledger = {e["emp_id"]: e["score_delta"] for e in dm.db.get_ledger_entries(dm.history["2025-03-08"][0]["id"])}
+    assert dm.db.get_player("O0")["score"] == 1200 + ledger["O0"]  # 다른 워커의 기록을 덮어쓰지 않음
+    assert dm.players["O0"].score == 1200 + ledger["O0"]
+    other.db.close()
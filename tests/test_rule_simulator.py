@@ -0,0 +1,25 @@
+"""규칙 변경 시뮬레이터: 현재 규칙 그대로면 실제 순위를 재현해야 한다"""
+
+
+def test_current_rules_reproduce_live_standings(boosted_dm):
+    dm = boosted_dm
+    assert any(p.boost_games > 0 for p in dm.players.values())
+
+    result, = dm.simulate_rules([
+        {"name": "현재 규칙", "score_rules": dm.score_rules, "tier_rules": dm.tier_rules},
+    ])
+
+    live = sorted(dm.players.values(), key=lambda p: (-p.score, p.emp_id))
+    assert [(r["emp_id"], r["score"], r["tier"]) for r in result["ranking"]] == [
+        (p.emp_id, p.score, p.tier) for p in live
+    ]
+    assert all(r["rank_ch"] == 0 for r in result["ranking"])
+
+
+def test_process_pool_matches_in_process(boosted_dm):
+    dm = boosted_dm
+    rule_sets = [
+        {"name": "현재 규칙", "score_rules": dm.score_rules, "tier_rules": dm.tier_rules},
+        {"name": "승리 30", "score_rules": {**dm.score_rules, "win": 30}, "tier_rules": dm.tier_rules},
+    ]
+    assert dm.simulate_rules(rule_sets, max_workers=2) == dm.simulate_rules(rule_sets, max_workers=1)
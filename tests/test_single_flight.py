@@ -0,0 +1,39 @@
+"""빈 캐시 동시 요청: 한 스레드만 DB에서 다시 읽고 나머지는 그 결과를 공유한다"""
+import threading
+import time
+
+from data_manager import DataManager
+
+
+def test_concurrent_cold_reads_rebuild_once(dm, monkeypatch):
+    for i in range(4):
+        dm.add_player(f"Z{i}", f"Z{i}")
+
+    cold = DataManager()  # 캐시가 비어 있고 이전 스냅샷도 없는 새 세션
+    calls = []
+    get_all_players = cold.db.get_all_players
+
+    def slow_get_all_players(*args, **kwargs):
+        calls.append(threading.get_ident())
+        time.sleep(0.2)  # 재구성이 길어져 다른 스레드가 그 사이에 요청
+        return get_all_players(*args, **kwargs)
+
+    monkeypatch.setattr(cold.db, "get_all_players", slow_get_all_players)
+    start = threading.Barrier(8)
+    seen = []
+
+    def read():
+        start.wait()
+        seen.append(cold.players)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+    assert len(calls) == 1
+    assert cold.cache_stats["players_rebuilds"] == 1
+    assert cold.cache_stats["coalesced_rebuilds"] == 7
+    assert all(players is seen[0] for players in seen) and set(seen[0]) == {f"Z{i}" for i in range(4)}
+    cold.db.close()
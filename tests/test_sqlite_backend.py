@@ -0,0 +1,63 @@
+"""로컬 SQLite 저장소: Database와 같은 인터페이스로 선수 · 경기 · 설정을 기록하고 읽는다"""
+import pytest
+
+
+def test_player_crud_and_projection(dm):
+    db = dm.db
+    assert db.add_player("Q1", "일번", score=1100)
+    assert not db.add_player("Q1", "중복")  # 같은 사번은 실패를 돌려줌
+
+    assert db.get_player("Q1", columns=("emp_id", "score")) == {"emp_id": "Q1", "score": 1100}
+    assert db.get_player("Q1")["is_active"] is True
+    assert db.update_player("Q1", score=1150, is_active=False)
+    row = db.get_player("Q1")
+    assert (row["score"], row["is_active"]) == (1150, False)
+    assert db.get_all_players(active_only=True) == []
+
+    with pytest.raises(ValueError):
+        db.get_player("Q1", columns=("emp_id", "password"))
+    assert not db.update_player("Q1", password="x")
+
+    assert db.delete_player("Q1")
+    assert db.get_player("Q1") is None and not db.has_players()
+
+
+def test_match_crud_and_ordering(dm):
+    db = dm.db
+    later = db.add_match("2025-02-08", ["a", "b"], ["c", "d"], group_name="A")
+    earlier = db.add_match("2025-02-01", ["a", "c"], ["b", "d"], group_name="B")
+
+    assert [m["id"] for m in db.get_all_matches()] == [earlier, later]
+    assert db.get_all_match_dates() == ["2025-02-08", "2025-02-01"]
+    assert db.update_match(later, score1=21, score2=18, status="pending_approval")
+    assert db.get_match(later, columns=("status", "score1")) == {"status": "pending_approval", "score1": 21}
+    assert db.delete_match(earlier)
+    assert [m["id"] for m in db.get_matches_by_date("2025-02-01")] == []
+
+
+def test_settings_rules_and_data_version(dm):
+    db = dm.db
+    assert db.set_setting("notice", "hello") and db.set_setting("notice", "bye")
+    assert db.get_setting("notice") == "bye" and db.get_setting("없음") is None
+    assert db.set_score_rule("win", 25) and db.set_tier_rule("골드", 1300)
+    assert db.get_score_rules()["win"] == 25 and db.get_tier_rules()["골드"] == 1300
+
+    version = db.get_data_version()
+    assert db.bump_data_version() == version + 1
+    startup = db.get_startup_config()
+    assert startup["data_version"] == version + 1 and startup["score_rules"]["win"] == 25
+
+
+def test_restore_from_backup_keeps_data_version_increasing(dm, tmp_path):
+    db = dm.db
+    db.add_player("Q2", "이번")
+    backup = str(tmp_path / "snapshot.db")
+    db.backup_to(backup)
+    db.delete_player("Q2")
+    for _ in range(3):
+        db.bump_data_version()
+    version = db.get_data_version()
+
+    db.restore_from(backup)
+    assert db.get_player("Q2")["name"] == "이번"
+    assert db.get_data_version() > version  # 다른 세션이 복원을 변경으로 감지
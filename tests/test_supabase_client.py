@@ -0,0 +1,66 @@
+"""Supabase 클라이언트 생성: httpx_client 옵션이 없는 초기 supabase 2.x에서도 생성되어야 한다"""
+import sys
+import types
+
+import pytest
+
+import database
+
+
+class FakeHttpClient:
+    def __init__(self, **kwargs):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class OldOptions:
+    """httpx_client 인자가 없는 초기 2.x의 SyncClientOptions"""
+
+    def __init__(self, schema="public"):
+        self.schema = schema
+
+
+class NewOptions:
+    def __init__(self, schema="public", httpx_client=None):
+        self.httpx_client = httpx_client
+
+
+@pytest.fixture
+def fake_supabase(monkeypatch):
+    created = []
+    httpx = types.SimpleNamespace(Client=FakeHttpClient, Limits=lambda **kwargs: kwargs)
+    supabase = types.SimpleNamespace(
+        create_client=lambda url, key, options=None: created.append(options) or "client"
+    )
+    client_options = types.ModuleType("supabase.lib.client_options")
+    monkeypatch.setitem(sys.modules, "httpx", httpx)
+    monkeypatch.setitem(sys.modules, "supabase", supabase)
+    monkeypatch.setitem(sys.modules, "supabase.lib", types.ModuleType("supabase.lib"))
+    monkeypatch.setitem(sys.modules, "supabase.lib.client_options", client_options)
+    monkeypatch.setattr(database, "_supabase_credentials", lambda: ("https://example.supabase.co", "key"))
+    return created, client_options
+
+
+def test_injects_pooled_http_client_when_supported(fake_supabase):
+    created, client_options = fake_supabase
+    client_options.SyncClientOptions = NewOptions
+
+    assert database._create_supabase_client() == "client"
+    assert isinstance(created[0].httpx_client, FakeHttpClient)
+
+
+def test_falls_back_to_default_client_on_early_2x(fake_supabase):
+    created, client_options = fake_supabase
+    client_options.SyncClientOptions = OldOptions
+
+    assert database._create_supabase_client() == "client"
+    assert created == [None]
+
+
+def test_falls_back_when_sync_client_options_missing(fake_supabase):
+    created, _ = fake_supabase
+
+    assert database._create_supabase_client() == "client"
+    assert created == [None]
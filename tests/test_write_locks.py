@@ -0,0 +1,116 @@
+"""경기 단위 쓰기와 전역 쓰기의 잠금 관계"""
+import threading
+
+
+def _confirmed_two_dates(dm):
+    emp_ids = [f"L{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    for date in ("2024-03-01", "2024-04-01"):
+        dm.generate_tournament(date, emp_ids)
+        for idx, _ in enumerate(dm.history[date]):
+            dm.admin_force_confirm(date, idx, 21, 10, "test")
+    return emp_ids
+
+
+def test_historical_edit_reruns_under_global_write(dm, monkeypatch):
+    _confirmed_two_dates(dm)
+    seen = []
+    plan_rerate = dm._plan_rerate
+
+    def checked(*args, **kwargs):
+        seen.append(dm._write_gate.owned())
+        return plan_rerate(*args, **kwargs)
+
+    monkeypatch.setattr(dm, "_plan_rerate", checked)
+    assert dm.admin_force_confirm("2024-03-01", 0, 10, 21, "admin")
+    assert seen and all(seen)
+    assert dm.cache_stats["rerates"] == 1
+
+
+def test_global_write_waits_for_in_flight_match_op(dm, monkeypatch):
+    emp_ids = [f"W{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    dm.generate_tournament("2024-05-01", emp_ids)
+
+    entered, release = threading.Event(), threading.Event()
+    commit = dm._commit_with_retry
+
+    def slow_commit(*args, **kwargs):
+        entered.set()
+        release.wait(5)
+        return commit(*args, **kwargs)
+
+    monkeypatch.setattr(dm, "_commit_with_retry", slow_commit)
+    order = []
+    confirm = threading.Thread(
+        target=lambda: order.append(("confirm", dm.admin_force_confirm("2024-05-01", 0, 21, 5, "admin")))
+    )
+    rules = threading.Thread(
+        target=lambda: order.append(("rules", dm.update_rules(dict(dm.score_rules), dict(dm.tier_rules))))
+    )
+    confirm.start()
+    assert entered.wait(5)
+    rules.start()
+    rules.join(0.3)
+    assert rules.is_alive()  # 경기 확정이 끝날 때까지 규칙 변경은 대기
+
+    release.set()
+    confirm.join(5)
+    rules.join(5)
+    assert [name for name, _ in order] == ["confirm", "rules"]
+
+
+def test_match_op_refuses_when_index_shifts_before_lock(dm, monkeypatch):
+    emp_ids = [f"S{i}" for i in range(4)]
+    for eid in emp_ids:
+        dm.add_player(eid, eid)
+    dm.generate_tournament("2024-06-01", emp_ids)
+    first, second, third = (m["id"] for m in dm.history["2024-06-01"][:3])
+
+    lock_keys = dm._match_lock_keys
+    calls = []
+
+    def keys_then_delete(date, match_idx):
+        result = lock_keys(date, match_idx)
+        if not calls:
+            calls.append(match_idx)
+            dm.delete_match_from_history(date, 0)  # 키를 구한 뒤 잠그기 전에 앞 경기가 삭제됨
+        return result
+
+    monkeypatch.setattr(dm, "_match_lock_keys", keys_then_delete)
+    # 1번 자리는 이제 잠그지 않은 다른 경기이므로 확정하지 않는다
+    assert dm.admin_force_confirm("2024-06-01", 1, 21, 5, "admin") is False
+    assert dm.cache_stats["shifted_matches"] == 1
+
+    by_id = {m["id"]: m for m in dm.history["2024-06-01"]}
+    assert first not in by_id
+    assert by_id[second]["status"] == "pending"
+    assert by_id[third]["status"] == "pending"
+
+
+def test_historical_confirm_without_later_games_stays_on_match_lock(dm, monkeypatch):
+    early, late = [f"E{i}" for i in range(4)], [f"F{i}" for i in range(4)]
+    for eid in early + late:
+        dm.add_player(eid, eid)
+    dm.generate_tournament("2024-03-01", early)
+    dm.generate_tournament("2024-04-01", late)
+    for idx, _ in enumerate(dm.history["2024-04-01"]):
+        dm.admin_force_confirm("2024-04-01", idx, 21, 10, "test")
+
+    plan_rerate = dm._plan_rerate
+    monkeypatch.setattr(dm, "_plan_rerate", lambda *a, **k: (_ for _ in ()).throw(AssertionError("rerate")))
+    # 이후 날짜 확정 경기는 있지만 이 경기 선수들은 뛰지 않았으므로 부분 재생 없이 확정
+    assert dm.admin_force_confirm("2024-03-01", 0, 21, 7, "admin")
+    assert dm.cache_stats["rerates"] == 0
+
+    ranking = dm.ranking_at("2024-04-01")
+    assert {r["emp_id"]: r["score"] for r in ranking} == {eid: p.score for eid, p in dm.players.items()}
+
+    # 이 경기 선수가 이후에 뛴 경기가 생기면 다시 부분 재생 경로
+    monkeypatch.setattr(dm, "_plan_rerate", plan_rerate)
+    dm.generate_tournament("2024-05-01", early)
+    dm.admin_force_confirm("2024-05-01", 0, 21, 12, "test")
+    assert dm.admin_force_confirm("2024-03-01", 0, 7, 21, "admin")
+    assert dm.cache_stats["rerates"] == 1
@@ -118,6 +118,18 @@ async function writeAuditLog(
   });
 }
 
+// Python DataManager와 캐시를 맞추기 위한 쓰기 후처리 (sql/data_version.sql, sql/rating_checkpoints.sql)
+// settings.data_version을 올려 다른 세션이 캐시를 다시 읽게 하고,
+// 경기 결과가 바뀔 수 있으면 그 날짜 이후 레이팅 체크포인트를 지운다 (다음 부분 재생은 이전 체크포인트부터).
+const RATING_SEED_DATE = "0000-00-00";
+
+async function markDataChanged(supabase: SupabaseClient, checkpointsFrom?: string | null): Promise<void> {
+  if (checkpointsFrom) {
+    await supabase.from("rating_checkpoints").delete().gte("date", checkpointsFrom);
+  }
+  await supabase.rpc("bump_data_version");
+}
+
 async function buildPlayerStatsMap(supabase: SupabaseClient): Promise<Map<string, PlayerStats>> {
   const map = new Map<string, PlayerStats>();
   const { data, error } = await supabase
@@ -652,6 +664,7 @@ app.post("/signup", async (c) => {
     pin_hash: pinHash,
   });
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase);
 
   return c.json({ success: true, message: "\ud68c\uc6d0\uac00\uc785 \uc694\uccad\uc774 \uc811\uc218\ub418\uc5c8\uc2b5\ub2c8\ub2e4. \uad00\ub9ac\uc790 \uc2b9\uc778 \ud6c4 \ub85c\uadf8\uc778\ud560 \uc218 \uc788\uc2b5\ub2c8\ub2e4." }, 201);
 });
@@ -704,6 +717,7 @@ app.post("/change-pin", requireAuth(), async (c) => {
     .update({ pin_hash: newHash })
     .eq("emp_id", user.sub);
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase);
   await writeAuditLog(supabase, user.sub, "auth.change_password", "player", user.sub, {});
 
   return c.json({ success: true, message: "鍮꾨?踰덊샇媛 蹂寃쎈릺?덉뒿?덈떎" });
@@ -719,6 +733,7 @@ app.post("/admin/reset-pin/:emp_id", requireAuth("admin"), async (c) => {
     .update({ pin_hash: null })
     .eq("emp_id", targetId);
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase);
   await writeAuditLog(supabase, actor.sub, "admin.reset_password", "player", targetId, {});
   return c.json({ success: true, message: `${targetId} 鍮꾨?踰덊샇媛 珥덇린?붾릺?덉뒿?덈떎 (珥덇린媛? ?щ쾲)` });
 });
@@ -747,6 +762,7 @@ app.post("/admin/signup-requests/:emp_id/approve", requireAuth("admin"), async (
     .select("emp_id, name, role, is_active")
     .single();
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase);
   await writeAuditLog(supabase, actor.sub, "signup.approve", "player", empId, {});
   return c.json({ success: true, player: data });
 });
@@ -763,6 +779,7 @@ app.post("/admin/signup-requests/:emp_id/reject", requireAuth("admin"), async (c
     .select("emp_id, name, role, is_active")
     .single();
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase);
   await writeAuditLog(supabase, actor.sub, "signup.reject", "player", empId, {});
   return c.json({ success: true, player: data });
 });
@@ -806,6 +823,7 @@ app.post("/players", requireAuth("admin"), async (c) => {
     .select("emp_id, name, score, xp, tier, win_count, match_count, streak, is_active, role")
     .single();
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase);
   await writeAuditLog(supabase, actor.sub, "player.create", "player", data.emp_id, {
     name: data.name,
     score: data.score,
@@ -827,6 +845,7 @@ app.patch("/players/:emp_id", requireAuth("admin"), async (c) => {
     .select("emp_id, name, score, xp, tier, win_count, match_count, streak, is_active, role")
     .single();
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase);
   await writeAuditLog(supabase, actor.sub, "player.update", "player", empId, body as Record<string, unknown>);
   return c.json(data);
 });
@@ -838,6 +857,7 @@ app.delete("/players/:emp_id", requireAuth("admin"), async (c) => {
   const supabase = getSupabase(c.env);
   const { error } = await supabase.from("players").update({ is_active: false }).eq("emp_id", empId);
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase);
   await writeAuditLog(supabase, actor.sub, "player.deactivate", "player", empId, {});
   return c.json({ success: true });
 });
@@ -862,6 +882,7 @@ app.delete("/players/:emp_id/hard", requireAuth("admin"), async (c) => {
 
   const { error } = await supabase.from("players").delete().eq("emp_id", empId);
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase);
   await writeAuditLog(supabase, user.sub, "player.delete_hard", "player", empId, {});
   return c.json({ success: true });
 });
@@ -942,6 +963,7 @@ app.post("/matches/:date/:match_id/submit-score", requireAuth(), async (c) => {
     .select()
     .single();
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase, targetMatch.date);
   await writeAuditLog(supabase, user.sub, "match.submit_score", "match", String(match_id), {
     score1: body.score1,
     score2: body.score2,
@@ -973,6 +995,7 @@ app.post("/matches/:date/:match_id/approve", requireAuth("admin"), async (c) =>
     .select()
     .single();
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase, targetMatch.date);
   await writeAuditLog(supabase, user.sub, "match.approve", "match", String(match_id), {});
   return c.json(data);
 });
@@ -998,6 +1021,7 @@ app.post("/matches/:date/:match_id/reject", requireAuth(), async (c) => {
     .select()
     .single();
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase, targetMatch.date);
   await writeAuditLog(supabase, user.sub, "match.reject", "match", String(match_id), {
     reason: body.reason ?? "",
   });
@@ -1039,6 +1063,7 @@ app.post("/matches", requireAuth("admin"), async (c) => {
   };
   const { data, error } = await supabase.from("matches").insert(row).select().single();
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase, data.date);
   await writeAuditLog(supabase, user.sub, "match.create", "match", String(data.id), {
     date: data.date,
     group_name: data.group_name,
@@ -1082,6 +1107,7 @@ app.patch("/matches/:match_id", requireAuth("admin"), async (c) => {
     .select()
     .single();
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase, body.date && body.date < currentMatch.date ? body.date : currentMatch.date);
   await writeAuditLog(supabase, user.sub, "match.update", "match", String(matchId), body as Record<string, unknown>);
   return c.json(data);
 });
@@ -1100,6 +1126,7 @@ app.delete("/matches/:match_id", requireAuth("admin"), async (c) => {
   if (lockMessage) return c.json({ error: lockMessage }, 409);
   const { error } = await supabase.from("matches").delete().eq("id", matchId);
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase, currentMatch.date);
   await writeAuditLog(supabase, user.sub, "match.delete", "match", String(matchId), {});
   return c.json({ success: true });
 });
@@ -1196,6 +1223,7 @@ app.post("/settings/month-close", requireAuth("admin"), async (c) => {
       .from("score_rules")
       .upsert({ key: monthCloseKey(month), value: 1 }, { onConflict: "key" });
     if (error) return c.json({ error: error.message }, 500);
+    await markDataChanged(supabase);
     await writeAuditLog(supabase, actor.sub, "settings.month.close", "month", month, {});
     const closed_months = await listClosedMonths(supabase);
     return c.json({ success: true, month, closed_months });
@@ -1213,6 +1241,7 @@ app.delete("/settings/month-close/:month", requireAuth("admin"), async (c) => {
     const supabase = getSupabase(c.env);
     const { error } = await supabase.from("score_rules").delete().eq("key", monthCloseKey(month));
     if (error) return c.json({ error: error.message }, 500);
+    await markDataChanged(supabase);
     await writeAuditLog(supabase, actor.sub, "settings.month.open", "month", month, {});
     const closed_months = await listClosedMonths(supabase);
     return c.json({ success: true, month, closed_months });
@@ -1271,6 +1300,7 @@ app.patch("/settings/rules", requireAuth("admin"), async (c) => {
     }
   }
 
+  await markDataChanged(supabase);
   await writeAuditLog(supabase, actor.sub, "settings.rules.update", "settings", "rules", {
     score_keys: Object.keys(body.score_rules ?? {}),
     tier_keys: Object.keys(body.tier_rules ?? {}),
@@ -1286,6 +1316,7 @@ app.post("/admin/recalculate/score", requireAuth("admin"), async (c) => {
     const dryRun = parsed?.dry_run !== false;
     const supabase = getSupabase(c.env);
     const result = await recalculateScores(supabase, dryRun);
+    if (!dryRun) await markDataChanged(supabase, RATING_SEED_DATE);
     await writeAuditLog(supabase, actor.sub, "recalculate.score", "system", "score", {
       dry_run: dryRun,
       players: result.players,
@@ -1305,6 +1336,7 @@ app.post("/admin/recalculate/xp", requireAuth("admin"), async (c) => {
     const dryRun = parsed?.dry_run !== false;
     const supabase = getSupabase(c.env);
     const result = await recalculateXp(supabase, dryRun);
+    if (!dryRun) await markDataChanged(supabase);
     await writeAuditLog(supabase, actor.sub, "recalculate.xp", "system", "xp", {
       dry_run: dryRun,
       players: result.players,
@@ -1326,6 +1358,7 @@ app.post("/admin/recalculate/all", requireAuth("admin"), async (c) => {
       recalculateScores(supabase, dryRun),
       recalculateXp(supabase, dryRun),
     ]);
+    if (!dryRun) await markDataChanged(supabase, RATING_SEED_DATE);
     await writeAuditLog(supabase, actor.sub, "recalculate.all", "system", "all", {
       dry_run: dryRun,
       score_players: score.players,
@@ -1360,6 +1393,7 @@ app.post("/tournaments/generate", requireAuth("admin"), async (c) => {
   const rows = body.matches.map((m) => ({ ...m, date: body.date, status: "pending" }));
   const { data, error } = await supabase.from("matches").insert(rows).select();
   if (error) return c.json({ error: error.message }, 500);
+  await markDataChanged(supabase);
   return c.json({ inserted: data?.length ?? 0, matches: data }, 201);
 });
 